@@ -0,0 +1,39 @@
+"""Benchmarks of the import time of the package.
+
+Run with ``pytest benchmarks`` after installing the ``bench`` extra.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+
+def _import(module):
+    """Import a module in a new interpreter and return its cumulative import time."""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stderr
+    for line in stderr.splitlines()[::-1]:
+        if line.split("|")[-1].strip() == module:
+            return int(line.split("|")[1]) * 1e-6  # in seconds
+    raise RuntimeError(f"The import time of {module} was not found.")
+
+
+@pytest.mark.parametrize(
+    "module",
+    (
+        "mne_lsl",
+        "mne_lsl.lsl",
+        "mne_lsl.stream",
+        "mne_lsl.stream.stream_lsl",
+        "mne_lsl.player.player_lsl",
+    ),
+)
+def test_import(benchmark, module):
+    """Benchmark the import of a module, including the interpreter start-up."""
+    import_time = benchmark.pedantic(_import, args=(module,), rounds=5)
+    benchmark.extra_info["import_time"] = import_time
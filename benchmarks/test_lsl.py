@@ -0,0 +1,88 @@
+"""Benchmarks of the low-level push and pull on a local loopback stream.
+
+Run with ``pytest benchmarks`` after installing the ``bench`` extra.
+"""
+
+import time
+import uuid
+
+import numpy as np
+import pytest
+
+from mne_lsl.lsl import StreamInfo, StreamInlet, StreamOutlet
+
+_N_SAMPLES = 1024
+
+
+@pytest.fixture(
+    scope="module",
+    params=[
+        (dtype, n_channels)
+        for dtype in ("float32", "float64", "int8", "int16", "int32", "string")
+        for n_channels in (1, 64, 256)
+    ],
+    ids=lambda param: f"{param[0]}-{param[1]}ch",
+)
+def loopback(request):
+    """Create a connected outlet and inlet pair."""
+    dtype, n_channels = request.param
+    sinfo = StreamInfo(
+        f"bench-{uuid.uuid4().hex}", "", n_channels, 1000, dtype, uuid.uuid4().hex
+    )
+    outlet = StreamOutlet(sinfo, chunk_size=_N_SAMPLES)
+    inlet = StreamInlet(sinfo, max_buffered=10)
+    inlet.open_stream(timeout=5)
+    if dtype == "string":
+        data = np.full((_N_SAMPLES, n_channels), "sample", dtype=object)
+    else:
+        data = np.ones((_N_SAMPLES, n_channels), dtype=dtype)
+    yield outlet, inlet, data
+    inlet.close_stream()
+    del inlet
+    del outlet
+
+
+def _push_and_wait(outlet, inlet, data):
+    """Push a chunk and wait until the inlet received it."""
+    inlet.flush()
+    outlet.push_chunk(data)
+    start = time.perf_counter()
+    while inlet.samples_available < data.shape[0]:
+        time.sleep(0.001)
+        if 5 < time.perf_counter() - start:
+            raise RuntimeError("The chunk was not received by the inlet.")
+
+
+def test_push_chunk(benchmark, loopback):
+    """Benchmark pushing a chunk of 1024 samples."""
+    outlet, inlet, data = loopback
+    benchmark(outlet.push_chunk, data)
+    inlet.flush()
+
+
+def test_pull_chunk(benchmark, loopback):
+    """Benchmark pulling a chunk of 1024 samples."""
+    outlet, inlet, data = loopback
+    result = benchmark.pedantic(
+        inlet.pull_chunk,
+        kwargs=dict(max_samples=_N_SAMPLES),
+        setup=lambda: _push_and_wait(outlet, inlet, data),
+        rounds=50,
+    )
+    assert len(result[1]) == _N_SAMPLES
+
+
+def test_pull_chunk_into(benchmark, loopback):
+    """Benchmark pulling a chunk of 1024 samples in a pre-allocated array."""
+    outlet, inlet, data = loopback
+    if data.dtype == object:
+        pytest.skip("Strings can not be pulled in a pre-allocated array.")
+    buffer = np.empty_like(data)
+    timestamps = np.empty(_N_SAMPLES)
+    n_samples = benchmark.pedantic(
+        inlet.pull_chunk_into,
+        args=(buffer, timestamps),
+        setup=lambda: _push_and_wait(outlet, inlet, data),
+        rounds=50,
+    )
+    assert n_samples == _N_SAMPLES
@@ -0,0 +1,48 @@
+"""Benchmarks of the timing of a Player.
+
+Run with ``pytest benchmarks`` after installing the ``bench`` extra.
+"""
+
+import time
+import uuid
+
+import numpy as np
+import pytest
+from mne import create_info
+from mne.io import RawArray
+
+from mne_lsl.player import PlayerLSL
+
+
+@pytest.fixture(scope="module")
+def fname(tmp_path_factory):
+    """Create a 64 channels recording sampled at 1 kHz."""
+    data = np.random.randn(64, 10000)
+    raw = RawArray(data, create_info(64, 1000, "eeg"))
+    fname = tmp_path_factory.mktemp("data") / "bench_raw.fif"
+    raw.save(fname)
+    return fname
+
+
+def _stream(fname, chunk_size, duration):
+    """Stream for duration seconds and return the metrics."""
+    player = PlayerLSL(fname, name=f"bench-{uuid.uuid4().hex}", chunk_size=chunk_size)
+    player.enable_metrics(size=4096)
+    player.start()
+    time.sleep(duration)
+    player.stop()
+    return player.metrics(percentiles=(50, 95, 99))
+
+
+@pytest.mark.parametrize("chunk_size", (1, 16, 200))
+def test_player_jitter(benchmark, fname, chunk_size):
+    """Benchmark the timing jitter of the player.
+
+    The benchmark measures the duration of 2 seconds of streaming, and the jitter is
+    reported as the percentiles of the lateness of the streaming ticks.
+    """
+    metrics = benchmark.pedantic(_stream, args=(fname, chunk_size, 2), rounds=1)
+    for p, value in metrics["lateness"].items():
+        benchmark.extra_info[f"lateness_p{p}"] = value
+    benchmark.extra_info["overruns"] = metrics["overruns"]
+    assert metrics["lateness"][50] < 0.01
@@ -0,0 +1,79 @@
+"""Benchmarks of the acquisition and buffer access of a Stream.
+
+Run with ``pytest benchmarks`` after installing the ``bench`` extra.
+"""
+
+import time
+import uuid
+
+import numpy as np
+import pytest
+
+from mne_lsl.lsl import StreamInfo, StreamOutlet
+from mne_lsl.stream import StreamLSL
+
+
+def _connect(n_channels, sfreq, bufsize):
+    """Create an outlet and connect a stream to it."""
+    name = f"bench-{uuid.uuid4().hex}"
+    sinfo = StreamInfo(name, "eeg", n_channels, sfreq, np.float32, uuid.uuid4().hex)
+    sinfo.set_channel_names([f"EEG{k:03d}" for k in range(n_channels)])
+    sinfo.set_channel_types("eeg")
+    outlet = StreamOutlet(sinfo)
+    stream = StreamLSL(bufsize, name=name)
+    stream.connect(timeout=5)
+    return outlet, stream
+
+
+def _push_and_wait(outlet, stream, data):
+    """Push a chunk and wait until the stream inlet received it."""
+    outlet.push_chunk(data)
+    start = time.perf_counter()
+    while stream._inlet.samples_available < data.shape[0]:
+        time.sleep(0.001)
+        if 5 < time.perf_counter() - start:
+            raise RuntimeError("The chunk was not received by the inlet.")
+
+
+@pytest.mark.parametrize("bufsize", (1, 10))
+@pytest.mark.parametrize("sfreq", (100, 1000, 10000))
+@pytest.mark.parametrize("n_channels", (8, 64, 256))
+def test_acquisition(benchmark, n_channels, sfreq, bufsize):
+    """Benchmark one acquisition tick pulling 200 ms of data in the buffer."""
+    outlet, stream = _connect(n_channels, sfreq, bufsize)
+    data = np.random.randn(int(sfreq * 0.2), n_channels).astype(np.float32)
+    with stream._interrupt_acquisition():
+        n_samples = benchmark.pedantic(
+            stream._pull_samples,
+            setup=lambda: _push_and_wait(outlet, stream, data),
+            rounds=30,
+        )
+    assert n_samples == data.shape[0]
+    benchmark.extra_info["samples_per_tick"] = data.shape[0]
+    stream.disconnect()
+
+
+@pytest.fixture(scope="module")
+def stream():
+    """Create a stream with a filled buffer."""
+    outlet, stream = _connect(64, 1000, 10)
+    data = np.random.randn(10000, 64).astype(np.float32)
+    for k in range(0, 10000, 1000):
+        outlet.push_chunk(data[k : k + 1000])
+    time.sleep(1)
+    yield stream
+    stream.disconnect()
+
+
+@pytest.mark.parametrize(
+    "picks",
+    (None, "eeg", list(range(0, 64, 2)), [10], slice(0, 32)),
+    ids=("all", "type", "even", "single", "slice"),
+)
+@pytest.mark.parametrize("winsize", (0.1, 1, 10))
+def test_get_data(benchmark, stream, picks, winsize):
+    """Benchmark the retrieval of data from the buffer."""
+    if isinstance(picks, slice):
+        picks = np.arange(64)[picks]
+    data, _ = benchmark(stream.get_data, winsize, picks)
+    assert data.shape[1] == int(winsize * 1000)
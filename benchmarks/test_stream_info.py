@@ -0,0 +1,72 @@
+"""Benchmarks of the parsing of the StreamInfo description.
+
+Run with ``pytest benchmarks`` after installing the ``bench`` extra.
+"""
+
+from time import strftime
+
+import numpy as np
+import pytest
+from mne import create_info
+from mne.channels import make_standard_montage
+
+from mne_lsl.lsl import StreamInfo
+
+
+@pytest.fixture(scope="module", params=(8, 64, 300))
+def sinfo(request):
+    """Create a StreamInfo with a description filled from an EEG Info."""
+    montage = make_standard_montage("standard_1005")
+    info = create_info(montage.ch_names[: request.param], 1000, "eeg")
+    info.set_montage(montage)
+    sinfo = StreamInfo(
+        "bench", "eeg", request.param, 1000, np.float32, strftime("%H%M%S")
+    )
+    sinfo.set_channel_info(info)
+    return sinfo
+
+
+@pytest.mark.parametrize("bulk", (True, False), ids=("bulk", "walk"))
+def test_parse_desc(benchmark, sinfo, bulk):
+    """Benchmark the parsing of the description in bulk or by walking the tree."""
+    if bulk:
+        # force the parsing on every call by invalidating the cache
+        def parse():
+            sinfo._desc_cache = None
+            return sinfo._get_desc()
+
+    else:
+
+        def parse():
+            return sinfo._get_desc(bulk=False)
+
+    benchmark(parse)
+
+
+def test_get_channel_info(benchmark, sinfo):
+    """Benchmark the retrieval of the measurement information."""
+
+    def get_channel_info():
+        sinfo._desc_cache = None
+        return sinfo.get_channel_info()
+
+    benchmark(get_channel_info)
+
+
+def test_set_channel_info(benchmark, sinfo):
+    """Benchmark writing the measurement information to the description."""
+    info = sinfo.get_channel_info()
+    benchmark(sinfo.set_channel_info, info)
+
+
+def test_rename_channel(benchmark, sinfo):
+    """Benchmark renaming a single channel in the description."""
+    ch_names = sinfo.get_channel_names()
+    ch_names_renamed = ch_names.copy()
+    ch_names_renamed[0] = "renamed"
+
+    def rename():
+        sinfo.set_channel_names(ch_names_renamed)
+        sinfo.set_channel_names(ch_names)
+
+    benchmark(rename)
@@ -1,3 +1,11 @@
 from ._version import __version__  # noqa: F401
-from .utils.config import sys_info  # noqa: F401
+from .utils._imports import lazy_attach
 from .utils.logs import add_file_handler, logger, set_log_level  # noqa: F401
+
+# the subpackages and the attributes below are imported on first access, as importing
+# MNE and loading liblsl is slow.
+__getattr__, __dir__, __all__ = lazy_attach(
+    __name__,
+    {"sys_info": "utils.config"},
+    ("datasets", "lsl", "player", "stream", "stream_viewer", "utils"),
+)
@@ -0,0 +1,264 @@
+from __future__ import annotations  # c.f. PEP 563, PEP 649
+
+import argparse
+import time
+import uuid
+from threading import Event, Thread
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from ..lsl import StreamInfo, StreamOutlet, local_clock
+from ..stream import StreamLSL
+
+if TYPE_CHECKING:
+    from typing import Dict, List, Optional, Union
+
+# processing flags compared by default, None disables post-processing
+_PROCESSING_FLAGS = ("none", "dejitter", "clocksync", "clocksync,dejitter")
+
+
+def _push(outlet: StreamOutlet, n_channels: int, chunk_size: int, stop: Event):
+    """Push chunks stamped with a sample counter and with local_clock()."""
+    delay = chunk_size / outlet.sfreq
+    data = np.zeros((chunk_size, n_channels), dtype=np.float64)
+    counter = np.arange(chunk_size, dtype=np.float64)
+    target = local_clock()
+    while not stop.is_set():
+        target += delay
+        wait = target - local_clock()
+        if 0 < wait:
+            time.sleep(wait)
+        data[:, 0] = counter
+        data[:, 1] = local_clock()
+        outlet.push_chunk(data)
+        counter += chunk_size
+
+
+def measure(
+    n_channels: int = 8,
+    sfreq: float = 1000,
+    chunk_size: int = 16,
+    bufsize: float = 2,
+    acquisition_delay: float = 0.01,
+    processing_flags: Optional[Union[str, List[str]]] = None,
+    duration: float = 5,
+) -> Dict[str, Union[int, np.ndarray]]:
+    """Measure the latency between a loopback outlet and StreamLSL.get_data().
+
+    Parameters
+    ----------
+    n_channels : int
+        Number of channels of the loopback stream, at least 2. The first channel holds
+        a sample counter and the second channel holds the value of
+        :func:`~mne_lsl.lsl.local_clock` when the chunk is pushed.
+    sfreq : float
+        Sampling rate of the loopback stream.
+    chunk_size : int
+        Number of samples pushed at once on the outlet.
+    bufsize : float
+        Size of the buffer of the stream, in seconds.
+    acquisition_delay : float
+        Delay in seconds between 2 acquisitions of the stream, also used as the delay
+        between 2 calls to :meth:`~mne_lsl.stream.StreamLSL.get_data`.
+    processing_flags : str | list of str | None
+        Post-processing options of the stream.
+    duration : float
+        Duration of the measurement in seconds.
+
+    Returns
+    -------
+    results : dict
+        The measured arrays and counts:
+
+        * ``'latency'``: delay (in seconds) between the push of a sample and its
+          retrieval with :meth:`~mne_lsl.stream.StreamLSL.get_data`.
+        * ``'offset'``: difference (in seconds) between the timestamp of a sample
+          retrieved and the time at which it was pushed.
+        * ``'jitter'``: difference (in seconds) between the interval of 2 consecutive
+          timestamps and the sampling period.
+        * ``'n_samples'``: number of samples received.
+        * ``'n_dropped'``: number of samples pushed but not retrieved.
+    """
+    if n_channels < 2:
+        raise ValueError(
+            "The argument 'n_channels' must be at least 2 as the first 2 channels "
+            f"hold the sample counter and the push time. {n_channels} is invalid."
+        )
+    name = f"bench-latency-{uuid.uuid4().hex}"
+    sinfo = StreamInfo(name, "", n_channels, sfreq, np.float64, uuid.uuid4().hex)
+    sinfo.set_channel_names(
+        ["counter", "clock"] + [f"CH{k}" for k in range(2, n_channels)]
+    )
+    sinfo.set_channel_types("misc")
+    outlet = StreamOutlet(sinfo, chunk_size=chunk_size)
+    stop = Event()
+    thread = Thread(target=_push, args=(outlet, n_channels, chunk_size, stop))
+    thread.daemon = True
+    thread.start()
+    stream = StreamLSL(bufsize, name=name, source_id=sinfo.source_id)
+    try:
+        stream.connect(
+            processing_flags=processing_flags,
+            timeout=5,
+            acquisition_delay=acquisition_delay,
+        )
+        # the samples pushed while connecting are discarded
+        latency, offset, timestamps, counter = [], [], [], []
+        start = local_clock()
+        last = -1  # counter of the last sample retrieved
+        while local_clock() - start < duration:
+            time.sleep(acquisition_delay)
+            if stream.n_new_samples == 0:
+                continue
+            data, ts = stream.get_data(picks=[0, 1])
+            now = local_clock()
+            # the new samples are selected with the sample counter pushed, as the
+            # number of new samples can change between 2 calls
+            mask = (last < data[0]) & (start <= data[1])
+            if not mask.any():
+                continue
+            last = data[0, mask][-1]
+            latency.append(now - data[1, mask])
+            offset.append(ts[mask] - data[1, mask])
+            timestamps.append(ts[mask])
+            counter.append(data[0, mask])
+    finally:
+        stop.set()
+        thread.join()
+        if stream.connected:
+            stream.disconnect()
+        del outlet
+    latency = np.concatenate(latency) if len(latency) != 0 else np.empty(0)
+    offset = np.concatenate(offset) if len(offset) != 0 else np.empty(0)
+    timestamps = np.concatenate(timestamps) if len(timestamps) != 0 else np.empty(0)
+    counter = np.concatenate(counter) if len(counter) != 0 else np.empty(0)
+    n_dropped = (
+        0 if counter.size == 0 else int(counter[-1] - counter[0] + 1) - counter.size
+    )
+    return {
+        "latency": latency,
+        "offset": offset,
+        "jitter": np.diff(timestamps) - 1 / sfreq,
+        "n_samples": counter.size,
+        "n_dropped": n_dropped,
+    }
+
+
+def _format_histogram(values: np.ndarray, bins: int = 10, width: int = 40) -> str:
+    """Format a text histogram of values in milliseconds."""
+    if values.size == 0:
+        return "    no samples"
+    counts, edges = np.histogram(values * 1e3, bins=bins)
+    scale = width / max(counts.max(), 1)
+    return "\n".join(
+        f"    {edges[k]:9.3f} - {edges[k + 1]:9.3f} ms | "
+        f"{'#' * int(round(count * scale)):<{width}} {count}"
+        for k, count in enumerate(counts)
+    )
+
+
+def _format_results(results: Dict[str, Union[int, np.ndarray]]) -> str:
+    """Format the results of a measurement."""
+    lines = [
+        f"  samples received: {results['n_samples']}, dropped: {results['n_dropped']}"
+    ]
+    for key, description in (
+        ("latency", "latency outlet to get_data()"),
+        ("offset", "timestamp offset to push time"),
+        ("jitter", "timestamp interval jitter"),
+    ):
+        values = results[key]
+        if values.size != 0:
+            p50, p95, p99 = np.percentile(values * 1e3, (50, 95, 99))
+            stats = (
+                f"p50 {p50:.3f} ms, p95 {p95:.3f} ms, p99 {p99:.3f} ms, "
+                f"std {np.std(values) * 1e3:.3f} ms"
+            )
+        else:
+            stats = "no samples"
+        lines.append(f"  {description}: {stats}")
+        lines.append(_format_histogram(values))
+    return "\n".join(lines)
+
+
+def run():
+    """Entrypoint for mne_lsl_bench_latency usage."""
+    parser = argparse.ArgumentParser(
+        prog="MNE-LSL Latency Benchmark",
+        description="Measures the latency and jitter between a loopback LSL outlet and "
+        "a Stream.",
+    )
+    parser.add_argument(
+        "-n",
+        "--n_channels",
+        type=int,
+        metavar="int",
+        help="number of channels of the loopback stream (at least 2).",
+        default=8,
+    )
+    parser.add_argument(
+        "-s",
+        "--sfreq",
+        type=float,
+        metavar="float",
+        help="sampling rate of the loopback stream.",
+        default=1000,
+    )
+    parser.add_argument(
+        "-c",
+        "--chunk_size",
+        type=int,
+        metavar="int",
+        help="number of samples pushed at once via LSL.",
+        default=16,
+    )
+    parser.add_argument(
+        "-b",
+        "--bufsize",
+        type=float,
+        metavar="float",
+        help="size of the buffer of the stream in seconds.",
+        default=2,
+    )
+    parser.add_argument(
+        "-a",
+        "--acquisition_delay",
+        type=float,
+        metavar="float",
+        help="delay in seconds between 2 acquisitions of the stream.",
+        default=0.01,
+    )
+    parser.add_argument(
+        "-p",
+        "--processing_flags",
+        type=str,
+        nargs="+",
+        metavar="str",
+        help="comma-separated processing flags compared, 'none' disables them.",
+        default=list(_PROCESSING_FLAGS),
+    )
+    parser.add_argument(
+        "-d",
+        "--duration",
+        type=float,
+        metavar="float",
+        help="duration of each measurement in seconds.",
+        default=5,
+    )
+
+    args = parser.parse_args()
+
+    for flags in args.processing_flags:
+        flags = [flag.strip() for flag in flags.split(",") if flag.strip() != "none"]
+        results = measure(
+            n_channels=args.n_channels,
+            sfreq=args.sfreq,
+            chunk_size=args.chunk_size,
+            bufsize=args.bufsize,
+            acquisition_delay=args.acquisition_delay,
+            processing_flags=flags if len(flags) != 0 else None,
+            duration=args.duration,
+        )
+        print(f"processing flags: {', '.join(flags) if len(flags) != 0 else 'none'}")
+        print(_format_results(results))
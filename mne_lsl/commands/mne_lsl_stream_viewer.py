@@ -7,18 +7,21 @@ def run():
     """Entrypoint for mne_lsl_stream_viewer usage."""
     parser = argparse.ArgumentParser(
         prog="MNE-LSL StreamViewer",
-        description="Starts a real-time viewer for a stream on LSL network.",
+        description="Starts a real-time viewer for streams on LSL network.",
     )
     parser.add_argument(
         "-s",
         "--stream_name",
         type=str,
+        nargs="+",
         metavar="str",
-        help="stream to display/plot.",
+        help="stream(s) to display/plot.",
     )
 
     args = parser.parse_args()
     stream_name = args.stream_name
+    if stream_name is not None and len(stream_name) == 1:
+        stream_name = stream_name[0]
 
     stream_viewer = StreamViewer(stream_name)
     stream_viewer.start()
@@ -0,0 +1,30 @@
+import pytest
+
+from mne_lsl.commands.mne_lsl_bench_latency import _format_results, measure
+
+
+@pytest.mark.parametrize("processing_flags", (None, ["clocksync", "dejitter"]))
+def test_measure(processing_flags):
+    """Test the measurement of the latency on a loopback stream."""
+    results = measure(
+        n_channels=3,
+        sfreq=500,
+        chunk_size=10,
+        processing_flags=processing_flags,
+        duration=1,
+    )
+    assert 0 < results["n_samples"]
+    assert results["n_dropped"] == 0
+    assert results["latency"].size == results["n_samples"]
+    assert results["jitter"].size == results["n_samples"] - 1
+    assert 0 < results["latency"].min()
+    assert results["latency"].max() < 1
+    output = _format_results(results)
+    assert "latency outlet to get_data()" in output
+    assert "dropped: 0" in output
+
+
+def test_measure_invalid_n_channels():
+    """Test invalid number of channels."""
+    with pytest.raises(ValueError, match="must be at least 2"):
+        measure(n_channels=1)
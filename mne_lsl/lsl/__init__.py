@@ -1,3 +1,4 @@
+from .continuous_resolver import ContinuousResolver  # noqa: F401
 from .functions import (  # noqa: F401
     library_version,
     local_clock,
@@ -1,11 +1,17 @@
+from __future__ import annotations  # c.f. PEP 563, PEP 649
+
 import platform
 import struct
 from ctypes import c_byte, c_char_p, c_double, c_float, c_int, c_longlong, c_short
+from typing import TYPE_CHECKING
 
 import numpy as np
 
 from .load_liblsl import lib
 
+if TYPE_CHECKING:
+    from typing import Any, Callable, Dict
+
 # -----------------
 # Supported formats
 # -----------------
@@ -54,62 +60,94 @@ string2numpy = {
 }
 numpy2string = {value: key for key, value in string2numpy.items()}
 
-# ------------------------------
-# Handle int64 incompatibilities
-# ------------------------------
-# int64 is not supported on windows and on 32 bits OS
-if struct.calcsize("P") != 4 and platform.system() != "Windows":
-    push_sample_int64 = lib.lsl_push_sample_ltp
-    pull_sample_int64 = lib.lsl_pull_sample_l
-    push_chunk_int64 = lib.lsl_push_chunk_ltp
-    pull_chunk_int64 = lib.lsl_pull_chunk_l
-else:
-
-    def push_sample_int64(*_):  # noqa: D103
-        raise NotImplementedError("int64 is not yet supported on your platform.")
-
-    pull_sample_int64 = push_chunk_int64 = pull_chunk_int64 = push_sample_int64
-
 # -------------------
 # Push/Pull functions
 # -------------------
+# The mappings between the formats and the push/pull functions are created on first
+# access with the module-level __getattr__, thus importing this module does not load
+# liblsl.
+_PUSH_PULL = (
+    "fmt2push_sample",
+    "fmt2pull_sample",
+    "fmt2push_chunk",
+    "fmt2push_chunk_n",
+    "fmt2pull_chunk",
+)
+
+
+def _int64_not_supported(*_):
+    """Raise for int64 on platforms which do not support it."""
+    raise NotImplementedError("int64 is not yet supported on your platform.")
+
+
+def _create_push_pull() -> Dict[str, Dict[Any, Callable]]:
+    """Create the mappings between the formats and the push/pull functions."""
+    # int64 is not supported on windows and on 32 bits OS
+    if struct.calcsize("P") != 4 and platform.system() != "Windows":
+        push_sample_int64 = lib.lsl_push_sample_ltp
+        pull_sample_int64 = lib.lsl_pull_sample_l
+        push_chunk_int64 = lib.lsl_push_chunk_ltp
+        push_chunk_n_int64 = lib.lsl_push_chunk_ltnp
+        pull_chunk_int64 = lib.lsl_pull_chunk_l
+    else:
+        push_sample_int64 = pull_sample_int64 = _int64_not_supported
+        push_chunk_int64 = push_chunk_n_int64 = pull_chunk_int64 = _int64_not_supported
+    return {
+        "fmt2push_sample": {
+            c_float: lib.lsl_push_sample_ftp,
+            c_double: lib.lsl_push_sample_dtp,
+            c_char_p: lib.lsl_push_sample_strtp,
+            c_int: lib.lsl_push_sample_itp,
+            c_short: lib.lsl_push_sample_stp,
+            c_byte: lib.lsl_push_sample_ctp,
+            c_longlong: push_sample_int64,
+        },
+        "fmt2pull_sample": {
+            c_float: lib.lsl_pull_sample_f,
+            c_double: lib.lsl_pull_sample_d,
+            c_char_p: lib.lsl_pull_sample_str,
+            c_int: lib.lsl_pull_sample_i,
+            c_short: lib.lsl_pull_sample_s,
+            c_byte: lib.lsl_pull_sample_c,
+            c_longlong: pull_sample_int64,
+        },
+        "fmt2push_chunk": {
+            c_float: lib.lsl_push_chunk_ftp,
+            c_double: lib.lsl_push_chunk_dtp,
+            c_char_p: lib.lsl_push_chunk_strtp,
+            c_int: lib.lsl_push_chunk_itp,
+            c_short: lib.lsl_push_chunk_stp,
+            c_byte: lib.lsl_push_chunk_ctp,
+            c_longlong: push_chunk_int64,
+        },
+        "fmt2push_chunk_n": {
+            c_float: lib.lsl_push_chunk_ftnp,
+            c_double: lib.lsl_push_chunk_dtnp,
+            c_char_p: lib.lsl_push_chunk_strtnp,
+            c_int: lib.lsl_push_chunk_itnp,
+            c_short: lib.lsl_push_chunk_stnp,
+            c_byte: lib.lsl_push_chunk_ctnp,
+            c_longlong: push_chunk_n_int64,
+        },
+        "fmt2pull_chunk": {
+            c_float: lib.lsl_pull_chunk_f,
+            c_double: lib.lsl_pull_chunk_d,
+            c_char_p: lib.lsl_pull_chunk_str,
+            c_int: lib.lsl_pull_chunk_i,
+            c_short: lib.lsl_pull_chunk_s,
+            c_byte: lib.lsl_pull_chunk_c,
+            c_longlong: pull_chunk_int64,
+        },
+    }
+
+
+def __getattr__(name: str):
+    """Create the push/pull mappings on first access."""
+    if name in _PUSH_PULL:
+        globals().update(_create_push_pull())
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-fmt2push_sample = {
-    c_float: lib.lsl_push_sample_ftp,
-    c_double: lib.lsl_push_sample_dtp,
-    c_char_p: lib.lsl_push_sample_strtp,
-    c_int: lib.lsl_push_sample_itp,
-    c_short: lib.lsl_push_sample_stp,
-    c_byte: lib.lsl_push_sample_ctp,
-    c_longlong: push_sample_int64,
-}
-fmt2pull_sample = {
-    c_float: lib.lsl_pull_sample_f,
-    c_double: lib.lsl_pull_sample_d,
-    c_char_p: lib.lsl_pull_sample_str,
-    c_int: lib.lsl_pull_sample_i,
-    c_short: lib.lsl_pull_sample_s,
-    c_byte: lib.lsl_pull_sample_c,
-    c_longlong: pull_sample_int64,
-}
-fmt2push_chunk = {
-    c_float: lib.lsl_push_chunk_ftp,
-    c_double: lib.lsl_push_chunk_dtp,
-    c_char_p: lib.lsl_push_chunk_strtp,
-    c_int: lib.lsl_push_chunk_itp,
-    c_short: lib.lsl_push_chunk_stp,
-    c_byte: lib.lsl_push_chunk_ctp,
-    c_longlong: push_chunk_int64,
-}
-fmt2pull_chunk = {
-    c_float: lib.lsl_pull_chunk_f,
-    c_double: lib.lsl_pull_chunk_d,
-    c_char_p: lib.lsl_pull_chunk_str,
-    c_int: lib.lsl_pull_chunk_i,
-    c_short: lib.lsl_pull_chunk_s,
-    c_byte: lib.lsl_pull_chunk_c,
-    c_longlong: pull_chunk_int64,
-}
 
 # ---------------------
 # Post processing flags
@@ -0,0 +1,223 @@
+from __future__ import annotations  # c.f. PEP 563, PEP 649
+
+from ctypes import byref, c_char_p, c_double, c_void_p
+from threading import Lock, Timer
+from typing import TYPE_CHECKING
+
+from ..utils._checks import check_type
+from ..utils.logs import logger
+from .functions import _create_predicate
+from .load_liblsl import lib
+from .stream_info import _BaseStreamInfo
+
+if TYPE_CHECKING:
+    from typing import Callable, Dict, List, Optional, Set
+
+
+class ContinuousResolver:
+    """A resolver continuously maintaining a directory of the streams on the network.
+
+    Contrary to :func:`~mne_lsl.lsl.resolve_streams` which blocks for the entire
+    ``timeout`` on every call, the resolver discovers streams in the background and
+    keeps an indexed directory of the streams present on the network. Queries with
+    :meth:`~mne_lsl.lsl.ContinuousResolver.results` return immediately.
+
+    Parameters
+    ----------
+    name : str | None
+        Restrict the resolved streams to this name.
+    stype : str | None
+        Restrict the resolved streams to this type.
+    source_id : str | None
+        Restrict the resolved streams to this source ID.
+    forget_after : float
+        Duration (in seconds) after which a stream which is not visible anymore on the
+        network is removed from the directory.
+    interval : float
+        Interval (in seconds) between 2 updates of the directory.
+    on_appeared : callable | None
+        Function called with the :class:`~mne_lsl.lsl.StreamInfo` of every stream
+        which appears on the network.
+    on_disappeared : callable | None
+        Function called with the :class:`~mne_lsl.lsl.StreamInfo` of every stream
+        which disappears from the network.
+
+    Notes
+    -----
+    The callbacks are called from the thread updating the directory and should not
+    block. The directory is updated every ``interval`` seconds, thus a stream appears
+    in the results at most ``interval`` seconds after being discovered by ``liblsl``.
+    """
+
+    def __init__(
+        self,
+        name: Optional[str] = None,
+        stype: Optional[str] = None,
+        source_id: Optional[str] = None,
+        forget_after: float = 5.0,
+        interval: float = 0.5,
+        on_appeared: Optional[Callable[[_BaseStreamInfo], None]] = None,
+        on_disappeared: Optional[Callable[[_BaseStreamInfo], None]] = None,
+    ):
+        check_type(forget_after, ("numeric",), "forget_after")
+        if forget_after <= 0:
+            raise ValueError(
+                "The argument 'forget_after' must be a strictly positive number. "
+                f"{forget_after} is invalid."
+            )
+        check_type(interval, ("numeric",), "interval")
+        if interval <= 0:
+            raise ValueError(
+                "The argument 'interval' must be a strictly positive number. "
+                f"{interval} is invalid."
+            )
+        check_type(on_appeared, ("callable", None), "on_appeared")
+        check_type(on_disappeared, ("callable", None), "on_disappeared")
+
+        predicate = _create_predicate(name, stype, source_id)
+        if predicate is None:
+            self._obj = lib.lsl_create_continuous_resolver(c_double(forget_after))
+        else:
+            self._obj = lib.lsl_create_continuous_resolver_bypred(
+                c_char_p(predicate.encode("utf-8")), c_double(forget_after)
+            )
+        self._obj = c_void_p(self._obj)
+        if not self._obj:
+            raise RuntimeError("The ContinuousResolver could not be created.")
+
+        self._interval = interval
+        self._on_appeared = on_appeared
+        self._on_disappeared = on_disappeared
+        # directory of streams, indexed by uid, and secondary indexes mapping the
+        # stream properties to the uids.
+        self._streams: Dict[str, _BaseStreamInfo] = dict()
+        self._index: Dict[str, Dict[str, Set[str]]] = {
+            "name": dict(),
+            "stype": dict(),
+            "source_id": dict(),
+        }
+        self._lock = Lock()
+        self._interrupt = False
+        self._update()
+
+    def __del__(self):
+        """Destroy a :class:`~mne_lsl.lsl.ContinuousResolver`."""
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    def __enter__(self):
+        """Context manager entry point."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        """Context manager exit point."""
+        self.close()
+
+    def __repr__(self) -> str:
+        """Representation of the instance."""
+        if self._obj is None:
+            return "<ContinuousResolver (closed)>"
+        return f"<ContinuousResolver: {len(self._streams)} stream(s)>"
+
+    def close(self) -> None:
+        """Stop the resolver and destroy the underlying ``liblsl`` object."""
+        if self._obj is None:
+            return None
+        self._interrupt = True
+        while True:
+            thread = self._update_thread
+            thread.cancel()
+            if thread.ident is not None:  # the thread might not be started yet
+                thread.join()
+            if thread is self._update_thread:
+                break
+        lib.lsl_destroy_continuous_resolver(self._obj)
+        self._obj = None
+
+    def results(
+        self,
+        name: Optional[str] = None,
+        stype: Optional[str] = None,
+        source_id: Optional[str] = None,
+        uid: Optional[str] = None,
+    ) -> List[_BaseStreamInfo]:
+        """Look up streams in the directory.
+
+        Parameters
+        ----------
+        name : str | None
+            Restrict the selected streams to this name.
+        stype : str | None
+            Restrict the selected streams to this type.
+        source_id : str | None
+            Restrict the selected streams to this source ID.
+        uid : str | None
+            Restrict the selected streams to this unique identifier.
+
+        Returns
+        -------
+        sinfos : list
+            List of :class:`~mne_lsl.lsl.StreamInfo` objects present in the directory
+            and matching the requested properties.
+        """
+        if self._obj is None:
+            raise RuntimeError("The ContinuousResolver is closed.")
+        with self._lock:
+            if uid is not None:
+                check_type(uid, (str,), "uid")
+                uids = {uid} if uid in self._streams else set()
+            else:
+                uids = set(self._streams)
+            for key, value in (
+                ("name", name),
+                ("stype", stype),
+                ("source_id", source_id),
+            ):
+                if value is None:
+                    continue
+                check_type(value, (str,), key)
+                uids &= self._index[key].get(value, set())
+            return [self._streams[uid] for uid in uids]
+
+    def _update(self) -> None:
+        """Update the directory from the liblsl resolver and call the callbacks."""
+        try:
+            buffer = (c_void_p * 1024)()
+            num_found = lib.lsl_resolver_results(self._obj, byref(buffer), 1024)
+            sinfos = [_BaseStreamInfo(buffer[k]) for k in range(num_found)]
+            sinfos = {sinfo.uid: sinfo for sinfo in sinfos}
+            appeared = [sinfos[uid] for uid in sinfos.keys() - self._streams.keys()]
+            disappeared = [
+                self._streams[uid] for uid in self._streams.keys() - sinfos.keys()
+            ]
+            if len(appeared) != 0 or len(disappeared) != 0:
+                with self._lock:
+                    for sinfo in disappeared:
+                        del self._streams[sinfo.uid]
+                        for key, index in self._index.items():
+                            index[getattr(sinfo, key)].discard(sinfo.uid)
+                            if len(index[getattr(sinfo, key)]) == 0:
+                                del index[getattr(sinfo, key)]
+                    for sinfo in appeared:
+                        self._streams[sinfo.uid] = sinfo
+                        for key, index in self._index.items():
+                            index.setdefault(getattr(sinfo, key), set()).add(sinfo.uid)
+                for sinfo in disappeared:
+                    logger.debug("Stream %s disappeared.", sinfo.name)
+                    if self._on_disappeared is not None:
+                        self._on_disappeared(sinfo)
+                for sinfo in appeared:
+                    logger.debug("Stream %s appeared.", sinfo.name)
+                    if self._on_appeared is not None:
+                        self._on_appeared(sinfo)
+        except Exception as error:
+            logger.exception(error)
+        if self._interrupt:
+            # don't recreate the thread if we are trying to close the resolver
+            return None
+        # recreate the timer thread as it is one-call only
+        self._update_thread = Timer(self._interval, self._update)
+        self._update_thread.daemon = True
+        self._update_thread.start()
@@ -114,39 +114,55 @@ def resolve_streams(
             f"Provided '{minimum}' is invalid."
         )
 
-    properties = [
-        # filter out the properties set to None
-        (prop, name)
-        for prop, name in zip(properties, ("name", "stype", "source_id"))
-        if prop is not None
-    ]
-    timeout /= len(properties)
-
-    streams = []
-    for prop, name in properties:
-        check_type(prop, (str,), name)
-        # rename properties for lsl compatibility
-        name = "type" if name == "stype" else name
-
-        num_found = lib.lsl_resolve_byprop(
-            byref(buffer),
-            1024,
-            c_char_p(str.encode(name)),
-            c_char_p(str.encode(prop)),
-            minimum,
-            c_double(timeout),
-        )
-        new_streams = [_BaseStreamInfo(buffer[k]) for k in range(num_found)]
-        # now delete the ones that dn't have all the correct properties
-        stream2delete = list()
-        for k, stream in enumerate(new_streams):
-            for prop, name in properties:
-                if getattr(stream, name) != prop:
-                    stream2delete.append(k)
-                    break
-        for idx in stream2delete[::-1]:
-            del new_streams[idx]
-        streams.extend(new_streams)
-        if minimum <= len(streams):
-            break
+    # a single predicate matching all the properties is resolved with the entire
+    # timeout, and the resolution stops as soon as 'minimum' streams are found.
+    predicate = _create_predicate(name, stype, source_id)
+    num_found = lib.lsl_resolve_bypred(
+        byref(buffer),
+        1024,
+        c_char_p(predicate.encode("utf-8")),
+        minimum,
+        c_double(timeout),
+    )
+    streams = [_BaseStreamInfo(buffer[k]) for k in range(num_found)]
     return list(set(streams))  # remove duplicates
+
+
+def _create_predicate(
+    name: Optional[str] = None,
+    stype: Optional[str] = None,
+    source_id: Optional[str] = None,
+) -> Optional[str]:
+    """Create an XPath 1.0 predicate matching the provided stream properties.
+
+    Parameters
+    ----------
+    name : str | None
+        Name of the stream.
+    stype : str | None
+        Type of the stream.
+    source_id : str | None
+        Source ID of the stream.
+
+    Returns
+    -------
+    predicate : str | None
+        The predicate, e.g. ``"name='my-stream' and type='EEG'"``, or None if all the
+        properties are None.
+    """
+    predicates = list()
+    for prop, key in ((name, "name"), (stype, "type"), (source_id, "source_id")):
+        if prop is None:
+            continue
+        check_type(prop, (str,), "stype" if key == "type" else key)
+        # XPath 1.0 does not support escaping quotes within a literal
+        if "'" not in prop:
+            predicates.append(f"{key}='{prop}'")
+        elif '"' not in prop:
+            predicates.append(f'{key}="{prop}"')
+        else:
+            raise ValueError(
+                f"The stream property '{key}' can not contain both single and double "
+                f"quotes. {prop} is invalid."
+            )
+    return " and ".join(predicates) if len(predicates) != 0 else None
@@ -10,11 +10,9 @@ from ctypes.util import find_library
 from importlib.resources import files
 from pathlib import Path
 from shutil import move, rmtree
+from threading import Lock
 from typing import TYPE_CHECKING
 
-import pooch
-import requests
-
 from ..utils._path import walk
 from ..utils.logs import logger
 
@@ -120,6 +118,10 @@ def _fetch_liblsl() -> Optional[CDLL]:
     lib : CDLL | None
         Loaded binary LSL library. None if not found for this platform.
     """
+    # imported here, as importing 'requests' and 'pooch' is slow
+    import pooch
+    import requests
+
     try:
         response = requests.get(
             "https://api.github.com/repos/sccn/liblsl/releases/latest"
@@ -494,5 +496,27 @@ def _set_types(lib: CDLL) -> CDLL:
     return lib
 
 
-# load library
-lib = load_liblsl()
+class _LazyLiblsl:
+    """Proxy loading the binary LSL library on first use.
+
+    Loading liblsl, and fetching it if it is not found on the system, is deferred until
+    the first access to one of its functions. The functions accessed are cached as
+    attributes of the proxy, thus subsequent accesses are plain attribute lookups.
+    """
+
+    def __init__(self):
+        self._lib = None
+        self._lock = Lock()
+
+    def __getattr__(self, name: str):
+        # only called when the attribute is not found, i.e. before it is cached
+        if self._lib is None:
+            with self._lock:
+                if self._lib is None:
+                    self._lib = load_liblsl()
+        attr = getattr(self._lib, name)
+        setattr(self, name, attr)
+        return attr
+
+
+lib = _LazyLiblsl()
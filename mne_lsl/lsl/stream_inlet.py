@@ -1,6 +1,7 @@
 from __future__ import annotations  # c.f. PEP 563, PEP 649
 
 import time
+import weakref
 from ctypes import byref, c_char_p, c_double, c_int, c_size_t, c_void_p
 from functools import reduce
 from typing import TYPE_CHECKING
@@ -9,13 +10,20 @@ import numpy as np
 
 from ..utils._checks import check_type, check_value, ensure_int
 from ..utils._docs import copy_doc
-from .constants import fmt2numpy, fmt2pull_chunk, fmt2pull_sample, post_processing_flags
+from . import constants
+from .constants import fmt2numpy, post_processing_flags
 from .load_liblsl import lib
 from .stream_info import _BaseStreamInfo
-from .utils import _check_timeout, _free_char_p_array_memory, handle_error
+from .utils import (
+    _check_timeout,
+    _decode_strings,
+    _free_char_p_array_memory,
+    handle_error,
+)
 
 if TYPE_CHECKING:
-    from typing import List, Optional, Sequence, Tuple, Union
+    from ctypes import Array
+    from typing import Dict, List, Optional, Sequence, Tuple, Union
 
     from numpy.typing import DTypeLike, NDArray
 
@@ -116,9 +124,9 @@ class StreamInlet:
         self._stype = sinfo.stype
 
         # inlet properties
-        self._do_pull_sample = fmt2pull_sample[self._dtype]
-        self._do_pull_chunk = fmt2pull_chunk[self._dtype]
-        self._buffer_data = {1: (self._dtype * self._n_channels)()}
+        self._do_pull_sample = constants.fmt2pull_sample[self._dtype]
+        self._do_pull_chunk = constants.fmt2pull_chunk[self._dtype]
+        self._buffer_data = {}
         self._buffer_ts = {}
 
         # variable to define if the stream is open or not  sinfo_ = inlet.get_sinfo()
@@ -243,10 +251,11 @@ class StreamInlet:
         """
         timeout = _check_timeout(timeout)
 
+        data_buffer = _get_buffer(self._buffer_data, self._n_channels, self._dtype, 1)
         errcode = c_int()
         timestamp = self._do_pull_sample(
             self._obj,
-            byref(self._buffer_data[1]),
+            byref(data_buffer),
             self._n_channels,
             c_double(timeout),
             byref(errcode),
@@ -257,10 +266,10 @@ class StreamInlet:
 
         if timestamp:
             if self._dtype == c_char_p:
-                sample = [v.decode("utf-8") for v in self._buffer_data[1]]
-                _free_char_p_array_memory(self._buffer_data[1])
+                sample = _decode_strings(data_buffer, self._n_channels)
+                _free_char_p_array_memory(data_buffer, self._n_channels)
             else:
-                sample = np.frombuffer(self._buffer_data[1], dtype=self._dtype)
+                sample = np.frombuffer(data_buffer, dtype=self._dtype)
         else:
             sample = [] if self._dtype == c_char_p else np.empty(0, dtype=self._dtype)
             timestamp = None
@@ -270,6 +279,7 @@ class StreamInlet:
         self,
         timeout: Optional[float] = 0.0,
         max_samples: int = 1024,
+        strings_as_array: bool = False,
     ) -> Tuple[Union[List[List[str]], NDArray[float]], NDArray[float]]:
         """Pull a chunk of samples from the inlet.
 
@@ -284,13 +294,18 @@ class StreamInlet:
             Maximum number of samples to return. The function is blocking until this
             number of samples is available or until ``timeout`` is reached. See notes
             for additional details.
+        strings_as_array : bool
+            If True and the channel format is ``'string'``, the samples are returned as
+            a numpy array of shape ``(n_samples, n_channels)`` with an ``object``
+            dtype instead of a list of list. Ignored for numerical streams.
 
         Returns
         -------
         samples : list of list of str | array of shape (n_samples, n_channels)
             If the channel format is ``'string'``, returns a list of list of values for
-            each channel and sample. Each sublist represents an entire channel. Else,
-            returns a numpy array of shape ``(n_samples, n_channels)``.
+            each channel and sample, or an array of strings if ``strings_as_array`` is
+            True. Each sublist represents an entire channel. Else, returns a numpy
+            array of shape ``(n_samples, n_channels)``.
         timestamps : array of shape (n_samples,)
             Acquisition timestamp on the remote machine. To map the timestamp to the
             local clock of the client machine, add the estimated time correction return
@@ -306,6 +321,11 @@ class StreamInlet:
 
         Note that if ``timeout`` is reached and no sample is available, empty
         ``samples`` and ``timestamps`` arrays are returned.
+
+        The returned arrays are views on pre-allocated buffers, thus pulling a chunk
+        does not copy the data. A buffer is re-used by the next pull only if the arrays
+        previously returned are not referenced anymore, else a new buffer is allocated.
+        Thus, the returned arrays are never overwritten and can be safely stored.
         """
         timeout = _check_timeout(timeout)
         if not isinstance(max_samples, int):
@@ -318,12 +338,8 @@ class StreamInlet:
 
         # look up or create a pre-allocated buffers of appropriate length
         max_samples_data = max_samples * self._n_channels
-        if max_samples_data not in self._buffer_data:
-            self._buffer_data[max_samples_data] = (self._dtype * max_samples_data)()
-        if max_samples not in self._buffer_ts:
-            self._buffer_ts[max_samples] = (c_double * max_samples)()
-        data_buffer = self._buffer_data[max_samples_data]
-        ts_buffer = self._buffer_ts[max_samples]
+        data_buffer = _get_buffer(self._buffer_data, max_samples_data, self._dtype)
+        ts_buffer = _get_buffer(self._buffer_ts, max_samples, c_double)
 
         # read data into it
         errcode = c_int()
@@ -342,14 +358,15 @@ class StreamInlet:
 
         n_samples = int(n_samples_data / self._n_channels)
         if self._dtype == c_char_p:
-            samples = [
-                [
-                    data_buffer[s * self._n_channels + c].decode("utf-8")
-                    for c in range(self._n_channels)
+            samples = _decode_strings(data_buffer, n_samples_data)
+            _free_char_p_array_memory(data_buffer, n_samples_data)
+            if strings_as_array:
+                samples = np.array(samples, dtype=object).reshape(-1, self._n_channels)
+            else:
+                samples = [
+                    samples[k : k + self._n_channels]
+                    for k in range(0, n_samples_data, self._n_channels)
                 ]
-                for s in range(int(n_samples))
-            ]
-            _free_char_p_array_memory(data_buffer)
         else:
             # this is 400-500x faster than the list approach
             samples = np.frombuffer(data_buffer, dtype=self._dtype)[
@@ -366,6 +383,89 @@ class StreamInlet:
         timestamps = np.frombuffer(ts_buffer, dtype=np.float64)[:n_samples]
         return samples, timestamps
 
+    def pull_chunk_into(
+        self,
+        data: NDArray[float],
+        timestamps: NDArray[float],
+        timeout: Optional[float] = 0.0,
+    ) -> int:
+        """Pull a chunk of samples from the inlet directly into the provided arrays.
+
+        Contrary to :meth:`~mne_lsl.lsl.StreamInlet.pull_chunk`, the samples are not
+        pulled in an internal buffer but written by ``liblsl`` directly in the memory of
+        the provided arrays, e.g. in the tail of a ring buffer.
+
+        Parameters
+        ----------
+        data : array of shape (max_samples, n_channels)
+            C-contiguous and writeable array, with the same ``dtype`` as the inlet, in
+            which the samples are written. The number of rows defines the maximum
+            number of samples to pull.
+        timestamps : array of shape (max_samples,)
+            C-contiguous and writeable ``float64`` array in which the timestamps are
+            written.
+        timeout : float | None
+            Optional timeout (in seconds) of the operation. None correspond to a very
+            large value, effectively disabling the timeout. ``0.`` makes this function
+            non-blocking even if no sample is available.
+
+        Returns
+        -------
+        n_samples : int
+            Number of samples pulled. The samples are written in ``data[:n_samples]``
+            and their acquisition timestamps in ``timestamps[:n_samples]``. The rest of
+            the arrays is left untouched.
+
+        Notes
+        -----
+        This method is only supported for numerical streams.
+        """
+        if self._dtype == c_char_p:
+            raise RuntimeError(
+                "StreamInlet.pull_chunk_into() is only supported for numerical "
+                "streams."
+            )
+        timeout = _check_timeout(timeout)
+        assert isinstance(data, np.ndarray), "'data' must be a numpy array."
+        assert isinstance(timestamps, np.ndarray), "'timestamps' must be a numpy array."
+        if data.ndim != 2 or data.shape[1] != self._n_channels or data.shape[0] == 0:
+            raise ValueError(
+                "The array 'data' must have a shape (max_samples, n_channels) with "
+                f"max_samples ≥ 1 and n_channels = {self._n_channels}. {data.shape} is "
+                "invalid."
+            )
+        if timestamps.shape != (data.shape[0],):
+            raise ValueError(
+                "The array 'timestamps' must have a shape (max_samples,) matching the "
+                f"number of samples in 'data'. {timestamps.shape} is invalid."
+            )
+        if data.dtype != fmt2numpy[self._dtype]:
+            raise ValueError(
+                f"The array 'data' must have the dtype {self.dtype} of the inlet. "
+                f"{data.dtype} is invalid."
+            )
+        if timestamps.dtype != np.float64:
+            raise ValueError(
+                "The array 'timestamps' must have the dtype float64. "
+                f"{timestamps.dtype} is invalid."
+            )
+
+        # from_buffer() raises if the arrays are not C-contiguous or not writeable
+        errcode = c_int()
+        n_samples_data = self._do_pull_chunk(
+            self._obj,
+            byref((self._dtype * data.size).from_buffer(data)),
+            byref((c_double * timestamps.size).from_buffer(timestamps)),
+            c_size_t(data.size),
+            c_size_t(timestamps.size),
+            c_double(timeout),
+            byref(errcode),
+        )
+        handle_error(errcode)
+        if not self._stream_is_open:
+            self._stream_is_open = True
+        return n_samples_data // self._n_channels
+
     def flush(self) -> int:
         """Drop all queued and not-yet pulled samples.
 
@@ -443,3 +543,48 @@ class StreamInlet:
         result = lib.lsl_get_fullinfo(self._obj, c_double(timeout), byref(errcode))
         handle_error(errcode)
         return _BaseStreamInfo(result)
+
+
+def _get_buffer(
+    buffers: Dict[int, Tuple[Array, weakref.ref]],
+    size: int,
+    ctype,
+    key: Optional[int] = None,
+):
+    """Look up or create a pre-allocated buffer which can be safely overwritten.
+
+    The arrays returned by the pull methods are views on a ctypes array created at
+    every pull on the memory of a pre-allocated buffer, and tracked with a weak
+    reference. If the ctypes array of the previous pull is still alive, e.g. because the
+    user is holding on to a previous result or to a view on it, the buffer is replaced
+    by a new one instead of being overwritten.
+
+    Parameters
+    ----------
+    buffers : dict
+        Pre-allocated buffers and weak reference to the ctypes array of the last pull.
+    size : int
+        Number of elements in the buffer.
+    ctype : type
+        ctypes type of the elements of the buffer.
+    key : int | None
+        Key of the buffer in ``buffers``. If None, ``size`` is used.
+
+    Returns
+    -------
+    buffer : Array
+        ctypes array on a pre-allocated buffer which is not referenced by a previously
+        returned array. The arrays returned by the pull must be created from it.
+    """
+    key = size if key is None else key
+    entry = buffers.get(key)
+    # %timeit _get_buffer(buffers, 1024, c_double)
+    # 2.07 µs per loop
+    if entry is None or entry[1]() is not None:
+        buffer = (ctype * size)()
+    else:
+        buffer = entry[0]
+    # from_buffer() keeps a reference to 'buffer'
+    owner = (ctype * size).from_buffer(buffer)
+    buffers[key] = (buffer, weakref.ref(owner))
+    return owner
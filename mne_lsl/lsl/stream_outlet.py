@@ -7,13 +7,14 @@ import numpy as np
 
 from ..utils._checks import check_type, ensure_int
 from ..utils._docs import copy_doc
-from .constants import fmt2numpy, fmt2push_chunk, fmt2push_sample
+from . import constants
+from .constants import fmt2numpy
 from .load_liblsl import lib
 from .stream_info import _BaseStreamInfo
-from .utils import _check_timeout, handle_error
+from .utils import _check_timeout, _encode_strings, handle_error
 
 if TYPE_CHECKING:
-    from typing import List, Optional, Union
+    from typing import Any, List, Optional, Union
 
     from numpy.typing import DTypeLike, NDArray
 
@@ -67,9 +68,13 @@ class StreamOutlet:
         self._stype = sinfo.stype
 
         # outlet properties
-        self._do_push_sample = fmt2push_sample[self._dtype]
-        self._do_push_chunk = fmt2push_chunk[self._dtype]
+        self._do_push_sample = constants.fmt2push_sample[self._dtype]
+        self._do_push_chunk = constants.fmt2push_chunk[self._dtype]
+        self._do_push_chunk_n = constants.fmt2push_chunk_n[self._dtype]
         self._buffer_sample = self._dtype * self._n_channels
+        # pre-allocated buffers registered with get_buffer(), stored as
+        # {id(array): (array, ctypes array sharing the memory of the numpy array)}
+        self._buffers = dict()
 
     def __del__(self):
         """Destroy a :class:`~mne_lsl.lsl.StreamOutlet`.
@@ -94,8 +99,8 @@ class StreamOutlet:
         ----------
         x : list | array of shape (n_channels,)
             Sample to push, with one element for each channel. If strings are
-            transmitted, a list is required. If numericals are transmitted, a numpy
-            array is required.
+            transmitted, a list or a numpy array of strings is required. If numericals
+            are transmitted, a numpy array is required.
         timestamp : float
             The acquisition timestamp of the sample, in agreement with
             :func:`mne_lsl.lsl.local_clock`. The default, ``0``, uses the current time.
@@ -106,8 +111,18 @@ class StreamOutlet:
             ``pushThrough`` flag.
         """
         if self._dtype == c_char_p:
-            assert isinstance(x, list), "'x' must be a list if strings are pushed."
-            x = [v.encode("utf-8") for v in x]
+            assert isinstance(
+                x, (list, np.ndarray)
+            ), "'x' must be a list or an array if strings are pushed."
+            if isinstance(x, np.ndarray):
+                if x.ndim != 1:
+                    raise ValueError(
+                        "The sample to push 'x' must contain one element per channel. "
+                        f"Thus, the shape should be (n_channels,), {x.shape} is "
+                        "invalid."
+                    )
+                x = x.tolist()
+            x = [v if isinstance(v, bytes) else v.encode("utf-8") for v in x]
         else:
             assert isinstance(
                 x, np.ndarray
@@ -119,16 +134,26 @@ class StreamOutlet:
                 )
             npdtype = fmt2numpy[self._dtype]
             x = x if x.dtype == npdtype else x.astype(npdtype)
+            x = x if x.flags["C_CONTIGUOUS"] else np.ascontiguousarray(x)
         if len(x) != self._n_channels:
             raise ValueError(
                 "The sample to push 'x' must contain one element per channel. Thus, "
                 f"{self._n_channels} elements are expected. {len(x)} is invalid."
             )
+        # %timeit (c_float * 64)(*x)
+        # 16.3 µs ± 87.4 ns per loop
+        # %timeit (c_float * 64).from_buffer_copy(x)
+        # 372 ns ± 2.1 ns per loop
+        data_buffer = (
+            self._buffer_sample(*x)
+            if self._dtype == c_char_p
+            else self._buffer_sample.from_buffer_copy(x)
+        )
 
         handle_error(
             self._do_push_sample(
                 self._obj,
-                self._buffer_sample(*x),
+                data_buffer,
                 c_double(timestamp),
                 c_int(pushThrough),
             )
@@ -137,7 +162,7 @@ class StreamOutlet:
     def push_chunk(
         self,
         x: Union[List[List[str]], NDArray[float]],
-        timestamp: float = 0.0,
+        timestamp: Union[float, NDArray[float]] = 0.0,
         pushThrough: bool = True,
     ) -> None:
         """Push a chunk of samples into the :class:`~mne_lsl.lsl.StreamOutlet`.
@@ -146,31 +171,65 @@ class StreamOutlet:
         ----------
         x : list of list | array of shape (n_samples, n_channels)
             Samples to push, with one element for each channel at every time point. If
-            strings are transmitted, a list of sublist containing ``(n_channels,)`` is
-            required. If numericals are transmitted, a numpy array of shape
+            strings are transmitted, a list of sublist containing ``(n_channels,)`` or
+            a numpy array of strings of shape ``(n_samples, n_channels)`` is required.
+            The strings are encoded in bulk, thus an array of strings, e.g. of
+            markers, is pushed without iterating over its elements in Python. If
+            numericals are transmitted, a numpy array of shape
             ``(n_samples, n_channels)`` is required.
-        timestamp : float
-            The acquisition timestamp of the last sample, in agreement with
+        timestamp : float | array of shape (n_samples,)
+            If a float, the acquisition timestamp of the last sample, in agreement with
             :func:`mne_lsl.lsl.local_clock`. The default, ``0``, uses the current time.
+            The timestamps of the other samples in the chunk are extrapolated by
+            ``liblsl`` from the nominal sampling rate. If an array, the acquisition
+            timestamp of every sample in the chunk, e.g. to replay a recording with its
+            original timestamps. A C-contiguous ``float64`` array is passed to
+            ``liblsl`` without copy.
         pushThrough : bool
             If True, push the sample through to the receivers instead of buffering it
             with subsequent samples. Note that the ``chunk_size`` defined when creating
             a :class:`~mne_lsl.lsl.StreamOutlet` takes precedence over the
             ``pushThrough`` flag.
+
+        Notes
+        -----
+        If ``x`` is a buffer obtained from :meth:`~mne_lsl.lsl.StreamOutlet.get_buffer`,
+        or a view selecting the first samples of such a buffer, e.g.
+        ``buffer[:n_samples]``, the validation and conversion of ``x`` are skipped and
+        the memory of the buffer is passed directly to ``liblsl``. Other views on the
+        buffer are validated as any other array.
         """
-        if self._dtype == c_char_p:
-            assert isinstance(x, list), "'x' must be a list if strings are pushed."
-            x = [v for sample in x for v in sample]  # flatten
-            n_samples = len(x)
-            if n_samples % self._n_channels != 0:  # quick incomplete test
-                raise ValueError(
-                    "The samples to push 'x' must contain one element per channel at "
-                    "each time-point. Thus, the shape should be (n_samples, "
-                    "n_channels)."
-                )
-            x = [v.encode("utf-8") for v in x]
-            n_samples = len(x)
-            data_buffer = (self._dtype * n_samples)(*x)
+        buffer = self._buffers.get(id(x))
+        if buffer is not None:
+            # registered buffer, the ctypes array was created once in get_buffer()
+            n_samples = x.size
+            data_buffer = buffer[1]
+        elif self._is_buffer_view(x):
+            # view on the first samples of a registered buffer, e.g. buffer[:n_samples]
+            n_samples = x.size
+            data_buffer = (self._dtype * n_samples).from_buffer(x)
+        elif self._dtype == c_char_p:
+            assert isinstance(
+                x, (list, np.ndarray)
+            ), "'x' must be a list or an array if strings are pushed."
+            if isinstance(x, np.ndarray):
+                if x.ndim != 2 or x.shape[1] != self._n_channels:
+                    raise ValueError(
+                        "The samples to push 'x' must contain one element per channel "
+                        "at each time-point. Thus, the shape should be (n_samples, "
+                        f"n_channels), {x.shape} is invalid."
+                    )
+            else:
+                x = [v for sample in x for v in sample]  # flatten
+                if len(x) % self._n_channels != 0:  # quick incomplete test
+                    raise ValueError(
+                        "The samples to push 'x' must contain one element per channel "
+                        "at each time-point. Thus, the shape should be (n_samples, "
+                        "n_channels)."
+                    )
+            # 'x' holds the encoded strings referenced by the pointers in data_buffer
+            data_buffer, x = _encode_strings(x)
+            n_samples = x.size
         else:
             assert isinstance(
                 x, np.ndarray
@@ -187,16 +246,119 @@ class StreamOutlet:
             n_samples = x.size
             data_buffer = (self._dtype * n_samples).from_buffer(x)
 
-        handle_error(
-            self._do_push_chunk(
-                self._obj,
-                data_buffer,
-                c_long(n_samples),
-                c_double(timestamp),
-                c_int(pushThrough),
+        if isinstance(timestamp, np.ndarray):
+            if timestamp.ndim != 1 or timestamp.size != n_samples // self._n_channels:
+                raise ValueError(
+                    "The timestamps to push 'timestamp' must contain one element per "
+                    "sample. Thus, the shape should be (n_samples,), "
+                    f"{timestamp.shape} is invalid."
+                )
+            timestamp = (
+                timestamp
+                if timestamp.dtype == np.float64
+                else timestamp.astype(np.float64)
+            )
+            timestamp = (
+                timestamp
+                if timestamp.flags["C_CONTIGUOUS"]
+                else np.ascontiguousarray(timestamp)
             )
+            handle_error(
+                self._do_push_chunk_n(
+                    self._obj,
+                    data_buffer,
+                    c_long(n_samples),
+                    (c_double * timestamp.size).from_buffer(timestamp),
+                    c_int(pushThrough),
+                )
+            )
+        else:
+            handle_error(
+                self._do_push_chunk(
+                    self._obj,
+                    data_buffer,
+                    c_long(n_samples),
+                    c_double(timestamp),
+                    c_int(pushThrough),
+                )
+            )
+
+    def _is_buffer_view(self, x: Any) -> bool:
+        """Check if ``x`` is a view on the first samples of a registered buffer.
+
+        The view must match the dtype and the samples of the buffer, else misaligned or
+        wrongly typed memory would be pushed without validation.
+        """
+        base = getattr(x, "base", None)
+        if id(base) not in self._buffers:
+            return False
+        return (
+            x.dtype == fmt2numpy[self._dtype]
+            and x.ndim == 2
+            and x.shape[1] == self._n_channels
+            and x.flags["C_CONTIGUOUS"]
+            and x.ctypes.data == base.ctypes.data
         )
 
+    def get_buffer(self, n_samples: int) -> NDArray[float]:
+        """Get a pre-allocated buffer to push chunks of ``n_samples`` samples.
+
+        The buffer is a C-contiguous numpy array matching the channel format of the
+        :class:`~mne_lsl.lsl.StreamOutlet`. It is registered once by the outlet, and can
+        be filled in-place and pushed with :meth:`~mne_lsl.lsl.StreamOutlet.push_chunk`
+        as many times as needed, with the validation and conversion of the samples
+        skipped. Views selecting consecutive samples of the buffer, e.g.
+        ``buffer[:k]``, can also be pushed.
+
+        Parameters
+        ----------
+        n_samples : int
+            Number of samples in the buffer.
+
+        Returns
+        -------
+        buffer : array of shape (n_samples, n_channels)
+            Pre-allocated buffer, filled with zeros.
+
+        Notes
+        -----
+        Pre-allocated buffers are not supported for ``'string'`` streams. The outlet
+        keeps a reference to every buffer returned, which can be released with
+        :meth:`~mne_lsl.lsl.StreamOutlet.release_buffer`.
+        """
+        if self._dtype == c_char_p:
+            raise RuntimeError(
+                "Pre-allocated buffers are only supported for numerical streams."
+            )
+        n_samples = ensure_int(n_samples, "n_samples")
+        if n_samples <= 0:
+            raise ValueError(
+                "The argument 'n_samples' must be a strictly positive integer. "
+                f"{n_samples} is invalid."
+            )
+        buffer = np.zeros((n_samples, self._n_channels), dtype=fmt2numpy[self._dtype])
+        self._buffers[id(buffer)] = (
+            buffer,
+            (self._dtype * buffer.size).from_buffer(buffer),
+        )
+        return buffer
+
+    def release_buffer(self, buffer: NDArray[float]) -> None:
+        """Release a buffer obtained with :meth:`~mne_lsl.lsl.StreamOutlet.get_buffer`.
+
+        Parameters
+        ----------
+        buffer : array of shape (n_samples, n_channels)
+            Buffer to release. Once released, the buffer is pushed as any other
+            array, with validation.
+        """
+        if id(buffer) not in self._buffers:
+            raise ValueError(
+                "The provided buffer was not obtained from StreamOutlet.get_buffer() "
+                "or was already released."
+            )
+        del self._buffers[id(buffer)]
+
     def wait_for_consumers(self, timeout: Optional[float]) -> bool:
         """Wait (block) until at least one :class:`~mne_lsl.lsl.StreamInlet` connects.
 
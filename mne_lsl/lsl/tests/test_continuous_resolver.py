@@ -0,0 +1,79 @@
+import time
+import uuid
+
+import pytest
+
+from mne_lsl.lsl import ContinuousResolver, StreamInfo, StreamOutlet
+from mne_lsl.lsl.functions import _create_predicate
+
+
+def test_continuous_resolver():
+    """Test the directory of streams maintained by the continuous resolver."""
+    appeared, disappeared = list(), list()
+    resolver = ContinuousResolver(
+        interval=0.1,
+        on_appeared=lambda sinfo: appeared.append(sinfo.name),
+        on_disappeared=lambda sinfo: disappeared.append(sinfo.name),
+    )
+    assert resolver.results() == []
+    source_id = uuid.uuid4().hex[:6]
+    sinfo1 = StreamInfo("test1", "EEG", 1, 0.0, "int8", source_id)
+    sinfo2 = StreamInfo("test2", "Markers", 1, 0.0, "string", source_id)
+    outlet1 = StreamOutlet(sinfo1)
+    outlet2 = StreamOutlet(sinfo2)  # noqa: F841
+    time.sleep(2)
+    assert sorted(appeared) == ["test1", "test2"]
+    assert disappeared == []
+    assert sorted(sinfo.name for sinfo in resolver.results()) == ["test1", "test2"]
+    assert resolver.results(source_id=source_id, stype="EEG") == [sinfo1]
+    assert resolver.results(name="test2") == [sinfo2]
+    assert resolver.results(name="test2", stype="EEG") == []
+    assert resolver.results(name="test3") == []
+    uid = resolver.results(name="test1")[0].uid
+    assert resolver.results(uid=uid) == [sinfo1]
+    assert resolver.results(uid=uid, name="test2") == []
+    # remove a stream
+    del outlet1
+    time.sleep(7)
+    assert disappeared == ["test1"]
+    assert resolver.results() == [sinfo2]
+    resolver.close()
+    with pytest.raises(RuntimeError, match="is closed"):
+        resolver.results()
+    resolver.close()  # closing twice is fine
+
+
+def test_continuous_resolver_properties():
+    """Test the continuous resolver restricted to stream properties."""
+    sinfo1 = StreamInfo("test1", "EEG", 1, 0.0, "int8", uuid.uuid4().hex[:6])
+    sinfo2 = StreamInfo("test2", "EEG", 1, 0.0, "int8", uuid.uuid4().hex[:6])
+    outlet1 = StreamOutlet(sinfo1)  # noqa: F841
+    outlet2 = StreamOutlet(sinfo2)  # noqa: F841
+    with ContinuousResolver(name="test2", stype="EEG", interval=0.1) as resolver:
+        time.sleep(2)
+        assert resolver.results() == [sinfo2]
+
+
+def test_continuous_resolver_invalid():
+    """Test invalid arguments of the continuous resolver."""
+    with pytest.raises(ValueError, match="'forget_after' must be a strictly"):
+        ContinuousResolver(forget_after=0)
+    with pytest.raises(ValueError, match="'interval' must be a strictly"):
+        ContinuousResolver(interval=-1)
+    with pytest.raises(TypeError, match="'on_appeared' must be an instance of"):
+        ContinuousResolver(on_appeared=101)
+    with pytest.raises(TypeError, match="'name' must be an instance of"):
+        ContinuousResolver(name=101)
+
+
+def test_create_predicate():
+    """Test the creation of XPath predicates."""
+    assert _create_predicate() is None
+    assert _create_predicate(name="test") == "name='test'"
+    assert (
+        _create_predicate(name="test", stype="EEG", source_id="101")
+        == "name='test' and type='EEG' and source_id='101'"
+    )
+    assert _create_predicate(stype="it's") == 'type="it\'s"'
+    with pytest.raises(ValueError, match="both single and double quotes"):
+        _create_predicate(name="'\"")
@@ -85,6 +85,12 @@ def test_resolve_streams():
     assert len(streams) == 1
     assert sinfo2 in streams
 
+    # the resolution stops as soon as the minimum is reached
+    start = local_clock()
+    streams = resolve_streams(timeout=10, name="test1", stype="Markers", source_id="")
+    assert local_clock() - start < 5
+    assert streams == [sinfo2]
+
     with pytest.raises(
         ValueError, match="'timeout' must be a strictly positive integer"
     ):
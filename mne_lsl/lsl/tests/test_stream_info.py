@@ -2,7 +2,7 @@ from time import strftime
 
 import numpy as np
 import pytest
-from mne import create_info
+from mne import Projection, create_info
 from mne.io import read_raw_fif
 
 from mne_lsl import logger
@@ -247,3 +247,82 @@ def test_stream_info_desc_from_info():
     inlet.open_stream()
     info_retrieved = inlet.get_sinfo().get_channel_info()
     compare_infos(raw.info, info_retrieved)
+
+
+def _to_tuple(element):
+    """Convert an XML element to nested tuples, ignoring the indentation."""
+    return (
+        element.tag,
+        (element.text or "").strip(),
+        tuple(_to_tuple(child) for child in element),
+    )
+
+
+def test_stream_info_desc_bulk_parsing():
+    """Test that the bulk parsing of the description matches the tree walk."""
+    info = create_info(["Fp1", "Fp2", "Cz", "Oz"], 1000, "eeg")
+    info.set_montage("standard_1020")
+    proj_data = {
+        "nrow": 1,
+        "ncol": 4,
+        "row_names": None,
+        "col_names": info["ch_names"],
+        "data": np.array([[0.5, 0.5, -0.5, -0.5]]),
+    }
+    with info._unlock():
+        info["projs"] = [Projection(data=proj_data, desc="test", kind=1)]
+        info["highpass"] = 0.1
+        info["lowpass"] = 40.0
+    sinfo = StreamInfo("test", "eeg", 4, 1000, np.float32, strftime("%H%M%S"))
+    sinfo.set_channel_info(info)
+    desc_bulk = sinfo._get_desc()
+    desc_walk = sinfo._get_desc(bulk=False)
+    assert _to_tuple(desc_bulk) == _to_tuple(desc_walk)
+    assert sinfo._get_desc() is desc_bulk  # cached
+    compare_infos(info, sinfo.get_channel_info())
+    # the cache is invalidated when the description changes
+    sinfo.desc.child("channels").first_child().child("label").first_child().set_value(
+        "1"
+    )
+    assert sinfo._get_desc() is not desc_bulk
+    assert sinfo.get_channel_info()["ch_names"] == ["1", "Fp2", "Cz", "Oz"]
+
+
+def test_stream_info_desc_partial_channel_info():
+    """Test retrieving an Info from a description with only the channel names."""
+    sinfo = StreamInfo("test", "eeg", 3, 1000, np.float32, strftime("%H%M%S"))
+    sinfo.set_channel_names(["1", "2", "3"])
+    info = sinfo.get_channel_info()
+    assert info["ch_names"] == ["1", "2", "3"]
+    assert np.all(np.isnan(np.array([ch["loc"] for ch in info["chs"]])))
+    assert len(info["projs"]) == 0
+
+
+def test_stream_info_desc_bulk_writing():
+    """Test that the description written in bulk matches the parsed description."""
+    info = create_info(["Fp1", "Fp2", "Cz", "Oz"], 1000, "eeg")
+    info.set_montage("standard_1020")
+    sinfo = StreamInfo("test", "eeg", 4, 1000, np.float32, strftime("%H%M%S"))
+    # custom fields are preserved
+    sinfo.set_channel_names(["1", "2", "3", "4"])
+    sinfo.desc.child("channels").first_child().append_child_value("custom", "101")
+    sinfo.set_channel_info(info)
+    assert _to_tuple(sinfo._get_desc()) == _to_tuple(sinfo._get_desc(bulk=False))
+    assert sinfo.desc.child("channels").first_child().child_value("custom") == "101"
+    compare_infos(info, sinfo.get_channel_info())
+    # the cached description is updated along the liblsl description
+    sinfo._desc_cache = None
+    desc = sinfo._get_desc()
+    sinfo.set_channel_names(["Fp1", "Fp2", "Cz", "O1"])
+    assert sinfo._get_desc() is desc
+    assert _to_tuple(desc) == _to_tuple(sinfo._get_desc(bulk=False))
+    assert sinfo.get_channel_names() == ["Fp1", "Fp2", "Cz", "O1"]
+    assert sinfo.get_channel_types() == ["eeg"] * 4
+    assert sinfo.get_channel_info()["chs"][3]["loc"][0] == info["chs"][3]["loc"][0]
+    sinfo.set_channel_info(info)
+    assert _to_tuple(sinfo._get_desc()) == _to_tuple(sinfo._get_desc(bulk=False))
+    # tempered description with duplicated nodes
+    sinfo.desc.append_child("channels").append_child("channel")
+    sinfo.set_channel_types(["eeg", "eeg", "eog", "eog"])
+    assert _to_tuple(sinfo._get_desc()) == _to_tuple(sinfo._get_desc(bulk=False))
+    assert sinfo.get_channel_types() == ["eeg", "eeg", "eog", "eog"]
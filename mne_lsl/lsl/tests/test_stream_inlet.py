@@ -114,6 +114,112 @@ def test_pull_numerical_chunk(dtype_str, dtype):
         data, ts = inlet.pull_chunk(max_samples=-101)
 
 
+def test_pull_chunk_ownership():
+    """Test that the arrays returned by pull_chunk are not overwritten."""
+    x = np.array([[1, 4], [2, 5], [3, 6]], dtype=np.float32)
+    sinfo = StreamInfo("test", "", 2, 0.0, "float32", uuid.uuid4().hex[:6])
+    outlet = StreamOutlet(sinfo, chunk_size=3)
+    inlet = StreamInlet(sinfo)
+    inlet.open_stream(timeout=5)
+    outlet.push_chunk(x)
+    data, ts = inlet.pull_chunk(max_samples=3, timeout=5)
+    _test_numerical_data(data, x, np.float32, ts, 3)
+    buffer_id = id(inlet._buffer_data[6][0])
+    ts_copy = ts.copy()
+    # the buffers are referenced by data and ts, they must not be overwritten
+    outlet.push_chunk(x + 10)
+    data2, ts2 = inlet.pull_chunk(max_samples=3, timeout=5)
+    _test_numerical_data(data2, x + 10, np.float32, ts2, 3)
+    assert_allclose(data, x)
+    assert_allclose(ts, ts_copy)
+    assert id(inlet._buffer_data[6][0]) != buffer_id
+    # once the arrays are released, the buffers are re-used, note that holding a
+    # reference to the buffer itself would prevent its re-use
+    buffer_id = id(inlet._buffer_data[6][0])
+    del data2, ts2
+    outlet.push_chunk(x + 20)
+    data, ts = inlet.pull_chunk(max_samples=3, timeout=5)
+    _test_numerical_data(data, x + 20, np.float32, ts, 3)
+    assert id(inlet._buffer_data[6][0]) == buffer_id
+    # a view on a returned array is enough to protect the buffer, across several pulls
+    view = data[:, 1]
+    del data, ts
+    for k in range(3):
+        outlet.push_chunk(x + 30 + k)
+        data2, ts2 = inlet.pull_chunk(max_samples=3, timeout=5)
+        _test_numerical_data(data2, x + 30 + k, np.float32, ts2, 3)
+        assert_allclose(view, x[:, 1] + 20)
+    # same for pull_sample
+    outlet.push_chunk(x)
+    sample, _ = inlet.pull_sample(timeout=5)
+    sample2, _ = inlet.pull_sample(timeout=5)
+    assert_allclose(sample, x[0])
+    assert_allclose(sample2, x[1])
+
+
+@pytest.mark.parametrize(
+    "dtype_str, dtype",
+    [
+        ("float32", np.float32),
+        ("float64", np.float64),
+        ("int8", np.int8),
+        ("int16", np.int16),
+        ("int32", np.int32),
+    ],
+)
+def test_pull_numerical_chunk_into(dtype_str, dtype):
+    """Test pull_chunk_into on a numerical chunk."""
+    x = np.array([[1, 4], [2, 5], [3, 6]], dtype=dtype)
+    sinfo = StreamInfo("test", "", 2, 0.0, dtype_str, uuid.uuid4().hex[:6])
+    outlet = StreamOutlet(sinfo, chunk_size=3)
+    inlet = StreamInlet(sinfo)
+    inlet.open_stream(timeout=5)
+    data = np.full((5, 2), -1, dtype=dtype)
+    ts = np.full(5, -1, dtype=np.float64)
+    outlet.push_chunk(x)
+    n_samples = inlet.pull_chunk_into(data, ts, timeout=5)
+    assert n_samples == 3
+    _test_numerical_data(data[:3], x, dtype, ts[:3], 3)
+    assert_allclose(data[3:], -1)
+    assert_allclose(ts[3:], -1)
+    assert inlet.pull_chunk_into(data, ts, timeout=0) == 0
+    # pull in the tail of a larger buffer
+    outlet.push_chunk(x)
+    n_samples = inlet.pull_chunk_into(data[-3:], ts[-3:], timeout=5)
+    assert n_samples == 3
+    _test_numerical_data(data[-3:], x, dtype, ts[-3:], 3)
+    # pull fewer samples than available
+    outlet.push_chunk(x)
+    time.sleep(0.1)
+    assert inlet.pull_chunk_into(data[:2], ts[:2], timeout=5) == 2
+    assert_allclose(data[:2], x[:2])
+    assert inlet.pull_chunk_into(data[:2], ts[:2], timeout=5) == 1
+    assert_allclose(data[0], x[2])
+
+    # invalid
+    with pytest.raises(ValueError, match="must have a shape"):
+        inlet.pull_chunk_into(np.zeros((3, 3), dtype=dtype), ts[:3])
+    with pytest.raises(ValueError, match="must have a shape"):
+        inlet.pull_chunk_into(np.zeros((3, 2), dtype=dtype), ts)
+    with pytest.raises(ValueError, match="must have the dtype"):
+        inlet.pull_chunk_into(np.zeros((5, 2), dtype=np.int64), ts)
+    with pytest.raises(ValueError, match="must have the dtype float64"):
+        inlet.pull_chunk_into(data, ts.astype(np.float32))
+    with pytest.raises(TypeError, match="not C contiguous"):
+        inlet.pull_chunk_into(np.zeros((2, 5), dtype=dtype).T, ts)
+    data.flags.writeable = False
+    with pytest.raises(TypeError, match="not writable"):
+        inlet.pull_chunk_into(data, ts)
+
+
+def test_pull_str_chunk_into():
+    """Test that pull_chunk_into is not supported on string streams."""
+    sinfo = StreamInfo("test", "", 2, 0.0, "string", uuid.uuid4().hex[:6])
+    inlet = StreamInlet(sinfo)
+    with pytest.raises(RuntimeError, match="only supported for numerical streams"):
+        inlet.pull_chunk_into(np.zeros((3, 2)), np.zeros(3))
+
+
 def test_pull_str_chunk():
     """Test pull_chunk on a string chunk."""
     x = [["1", "4"], ["2", "5"], ["3", "6"]]
@@ -146,6 +252,15 @@ def test_pull_str_chunk():
     assert data == x[1]
     data, ts = inlet.pull_chunk(max_samples=5, timeout=1)
     assert data == [x[2]]  # chunk is nested
+    # pull as an array of strings
+    outlet.push_chunk(x)
+    data, ts = inlet.pull_chunk(max_samples=5, timeout=1, strings_as_array=True)
+    assert isinstance(data, np.ndarray)
+    assert data.shape == (3, 2)
+    assert data.tolist() == x
+    data, ts = inlet.pull_chunk(max_samples=5, timeout=0, strings_as_array=True)
+    assert data.shape == (0, 2)
+    assert ts.size == 0
 
 
 @pytest.mark.xfail(
@@ -6,7 +6,7 @@ import numpy as np
 import pytest
 from numpy.testing import assert_allclose
 
-from mne_lsl.lsl import StreamInfo, StreamInlet, StreamOutlet
+from mne_lsl.lsl import StreamInfo, StreamInlet, StreamOutlet, local_clock
 from mne_lsl.lsl.constants import string2numpy
 from mne_lsl.lsl.stream_info import _BaseStreamInfo
 
@@ -97,6 +97,126 @@ def test_push_numerical_chunk(dtype_str, dtype):
         outlet.push_chunk(np.array(x, dtype=dtype).flatten())
 
 
+@pytest.mark.parametrize(
+    "dtype_str, dtype",
+    [
+        ("float32", np.float32),
+        ("float64", np.float64),
+        ("int8", np.int8),
+        ("int16", np.int16),
+        ("int32", np.int32),
+    ],
+)
+def test_push_numerical_chunk_timestamps(dtype_str, dtype):
+    """Test pushing a numerical chunk with one timestamp per sample."""
+    x = np.array([[1, 4], [2, 5], [3, 6]], dtype=dtype)
+    timestamps = local_clock() - np.array([0.3, 0.25, 0.05])  # jittered
+    sinfo = StreamInfo("test", "", 2, 10.0, dtype_str, uuid.uuid4().hex[:6])
+    outlet = StreamOutlet(sinfo, chunk_size=3)
+    inlet = StreamInlet(sinfo)
+    inlet.open_stream(timeout=5)
+    outlet.push_chunk(x, timestamp=timestamps)
+    data, ts = inlet.pull_chunk(max_samples=3, timeout=5)
+    assert_allclose(data, x)
+    assert_allclose(ts, timestamps)
+    # non-contiguous timestamps
+    timestamps = np.repeat(local_clock() + np.arange(3.0), 2)[::2]
+    assert not timestamps.flags["C_CONTIGUOUS"]
+    outlet.push_chunk(x, timestamp=timestamps)
+    data, ts = inlet.pull_chunk(max_samples=3, timeout=5)
+    assert_allclose(data, x)
+    assert_allclose(ts, timestamps)
+
+    with pytest.raises(ValueError, match="one element per sample"):
+        outlet.push_chunk(x, timestamp=np.zeros(2))
+    with pytest.raises(ValueError, match="one element per sample"):
+        outlet.push_chunk(x, timestamp=np.zeros((3, 1)))
+
+
+@pytest.mark.parametrize(
+    "dtype_str, dtype",
+    [
+        ("float32", np.float32),
+        ("float64", np.float64),
+        ("int8", np.int8),
+        ("int16", np.int16),
+        ("int32", np.int32),
+    ],
+)
+def test_push_chunk_buffer(dtype_str, dtype):
+    """Test pushing chunks from a pre-allocated buffer."""
+    sinfo = StreamInfo("test", "", 2, 0.0, dtype_str, uuid.uuid4().hex[:6])
+    outlet = StreamOutlet(sinfo, chunk_size=3)
+    inlet = StreamInlet(sinfo)
+    inlet.open_stream(timeout=5)
+    buffer = outlet.get_buffer(3)
+    assert buffer.shape == (3, 2)
+    assert buffer.dtype == dtype
+    assert buffer.flags["C_CONTIGUOUS"]
+    # push the entire buffer, filled in-place
+    buffer[:] = np.array([[1, 4], [2, 5], [3, 6]], dtype=dtype)
+    outlet.push_chunk(buffer)
+    data, ts = inlet.pull_chunk(max_samples=3, timeout=5)
+    assert_allclose(data, buffer)
+    # the buffer is re-used
+    buffer[:] = np.array([[7, 10], [8, 11], [9, 12]], dtype=dtype)
+    outlet.push_chunk(buffer)
+    data, ts = inlet.pull_chunk(max_samples=3, timeout=5)
+    assert_allclose(data, buffer)
+    # push a view on the buffer
+    outlet.push_chunk(buffer[:2])
+    data, ts = inlet.pull_chunk(max_samples=3, timeout=5)
+    assert_allclose(data, buffer[:2])
+    outlet.push_chunk(buffer[1:], timestamp=np.arange(2, dtype=np.float64) + 1)
+    data, ts = inlet.pull_chunk(max_samples=3, timeout=5)
+    assert_allclose(data, buffer[1:])
+    assert_allclose(ts, [1, 2])
+    # non-contiguous views are validated
+    with pytest.raises(ValueError, match="the shape should be"):
+        outlet.push_chunk(buffer.T)
+    # views which are not aligned on the samples of the buffer are validated
+    assert outlet._is_buffer_view(buffer[:2])
+    for view in (buffer[1:], buffer.ravel(), buffer.ravel()[1:], buffer[:, :1]):
+        assert not outlet._is_buffer_view(view)
+    with pytest.raises(ValueError, match="the shape should be"):
+        outlet.push_chunk(buffer.ravel()[1:])
+    if buffer.itemsize == 4:
+        view = buffer.view(np.float32 if dtype != np.float32 else np.int32)
+        assert not outlet._is_buffer_view(view)
+    # release the buffer
+    outlet.release_buffer(buffer)
+    with pytest.raises(ValueError, match="was not obtained from"):
+        outlet.release_buffer(buffer)
+    outlet.push_chunk(buffer)
+    data, ts = inlet.pull_chunk(max_samples=3, timeout=5)
+    assert_allclose(data, buffer)
+
+    with pytest.raises(ValueError, match="must be a strictly positive integer"):
+        outlet.get_buffer(0)
+
+
+def test_push_chunk_buffer_invalid():
+    """Test that pre-allocated buffers are not supported on string streams."""
+    sinfo = StreamInfo("test", "", 2, 0.0, "string", uuid.uuid4().hex[:6])
+    outlet = StreamOutlet(sinfo, chunk_size=3)
+    with pytest.raises(RuntimeError, match="only supported for numerical streams"):
+        outlet.get_buffer(3)
+
+
+def test_push_str_chunk_timestamps():
+    """Test pushing a string chunk with one timestamp per sample."""
+    x = [["1", "4"], ["2", "5"], ["3", "6"]]
+    timestamps = local_clock() - np.array([0.3, 0.25, 0.05])
+    sinfo = StreamInfo("test", "", 2, 0.0, "string", uuid.uuid4().hex[:6])
+    outlet = StreamOutlet(sinfo, chunk_size=3)
+    inlet = StreamInlet(sinfo)
+    inlet.open_stream(timeout=5)
+    outlet.push_chunk(x, timestamp=timestamps)
+    data, ts = inlet.pull_chunk(max_samples=3, timeout=5)
+    assert data == x
+    assert_allclose(ts, timestamps)
+
+
 def test_push_str_chunk():
     """Test the error checking when pushing a string chunk."""
     sinfo = StreamInfo("test", "", 2, 0.0, "string", uuid.uuid4().hex[:6])
@@ -108,7 +228,7 @@ def test_push_str_chunk():
     # invalid
     with pytest.raises(
         AssertionError,
-        match="must be a list if strings are pushed.",
+        match="must be a list or an array if strings are pushed.",
     ):
         outlet.push_chunk((["1", "4"], ["2", "5"], ["3", "6"]))
     with pytest.raises(
@@ -118,6 +238,39 @@ def test_push_str_chunk():
         outlet.push_chunk([["1", "4"], ["2", "5"], ["3", "6"], ["7"]])
 
 
+@pytest.mark.parametrize("dtype", [str, object, bytes, "object-bytes"])
+def test_push_str_array(dtype):
+    """Test pushing an array of strings."""
+    expected = [["1", "4"], ["é", "5"], ["marker", ""]]
+    if dtype is bytes:
+        x = np.char.encode(np.array(expected), "utf-8")
+    elif dtype == "object-bytes":
+        x = np.array([[v.encode("utf-8") for v in s] for s in expected], dtype=object)
+    else:
+        x = np.array(expected, dtype=dtype)
+    sinfo = StreamInfo("test", "", 2, 0.0, "string", uuid.uuid4().hex[:6])
+    outlet = StreamOutlet(sinfo, chunk_size=3)
+    inlet = StreamInlet(sinfo)
+    inlet.open_stream(timeout=5)
+    outlet.push_chunk(x)
+    data, ts = inlet.pull_chunk(max_samples=3, timeout=5)
+    assert data == expected
+    outlet.push_sample(x[1])
+    data, ts = inlet.pull_sample(timeout=5)
+    assert data == expected[1]
+
+    with pytest.raises(ValueError, match=re.escape("the shape should be (n_samples")):
+        outlet.push_chunk(x.T)
+    with pytest.raises(ValueError, match=re.escape("the shape should be (n_channels")):
+        outlet.push_sample(x)
+    with pytest.raises(ValueError, match="can not contain null characters"):
+        outlet.push_chunk([["1", "4\x00a"]])
+    with pytest.raises(ValueError, match="can not contain null characters"):
+        outlet.push_chunk([["1", b"4\x00a"]])
+    with pytest.raises(TypeError, match="must be str or bytes"):
+        outlet.push_chunk(np.array([["1", 4]], dtype=object))
+
+
 def test_wait_for_consumers():
     """Test wait for client."""
     sinfo = StreamInfo("test", "EEG", 2, 100.0, "float32", uuid.uuid4().hex[:6])
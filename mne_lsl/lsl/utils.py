@@ -1,8 +1,18 @@
-from ctypes import POINTER, c_int, c_void_p, cast
-from typing import Optional
+from __future__ import annotations  # c.f. PEP 563, PEP 649
+
+from ctypes import c_char_p, c_int, c_void_p, memset, sizeof
+from typing import TYPE_CHECKING
+
+import numpy as np
 
 from .load_liblsl import lib
 
+if TYPE_CHECKING:
+    from ctypes import Array
+    from typing import List, Optional, Tuple, Union
+
+    from numpy.typing import NDArray
+
 
 # -- XML tree -----------------------------------------------------------------
 class XMLElement:
@@ -184,12 +194,88 @@ def handle_error(errcode):
 
 
 # -- Memory function ----------------------------------------------------------
-def _free_char_p_array_memory(char_p_array):
-    num_elements = len(char_p_array)
-    pointers = cast(char_p_array, POINTER(c_void_p))
-    for p in range(num_elements):
-        if pointers[p] is not None:  # only free initialized pointers
-            lib.lsl_destroy_string(pointers[p])
+def _free_char_p_array_memory(char_p_array, n_elements: Optional[int] = None):
+    """Free the strings allocated by liblsl in the first elements of the array.
+
+    The freed pointers are reset to NULL to prevent a double-free on the next call
+    with the same array.
+    """
+    n_elements = len(char_p_array) if n_elements is None else n_elements
+    pointers = np.frombuffer(char_p_array, dtype=np.uintp, count=n_elements)
+    for p in pointers[pointers != 0].tolist():  # only free initialized pointers
+        lib.lsl_destroy_string(p)
+    memset(char_p_array, 0, n_elements * sizeof(c_void_p))
+
+
+# -- String conversion --------------------------------------------------------
+def _decode_strings(char_p_array, n_elements: int) -> List[str]:
+    """Decode the first elements of an array of char pointers in bulk.
+
+    A C-string can not contain a null character, thus the strings are joined with a
+    null separator, decoded in a single call, and split.
+    """
+    if n_elements == 0:
+        return []
+    # >>> %timeit [buffer[k].decode("utf-8") for k in range(2000)]
+    # 229 µs ± 1.87 µs per loop
+    # >>> %timeit b"\0".join(buffer[:2000]).decode("utf-8").split("\0")
+    # 132 µs ± 1.03 µs per loop
+    return b"\0".join(char_p_array[:n_elements]).decode("utf-8").split("\0")
+
+
+def _encode_strings(x: Union[List[str], NDArray[str]]) -> Tuple[Array, NDArray]:
+    """Encode strings in bulk and create the array of char pointers.
+
+    Parameters
+    ----------
+    x : list of str | array of str
+        Flat list or array of strings to encode. The bytes, in an array of bytes or as
+        elements of a list or of an object array, are considered already encoded.
+
+    Returns
+    -------
+    char_p_array : Array
+        Array of char pointers to the encoded strings.
+    encoded : array of bytes
+        Array of null-terminated encoded strings referenced by ``char_p_array``. It
+        must be kept alive as long as ``char_p_array`` is used.
+    """
+    if isinstance(x, np.ndarray):
+        bytes_ = x.dtype.kind == "S"
+        x = x.ravel().tolist()
+    else:
+        bytes_ = False
+    # >>> %timeit (c_char_p * 2000)(*[v.encode("utf-8") for v in x])
+    # 678 µs ± 4.12 µs per loop
+    # >>> %timeit _encode_strings(x)
+    # 232 µs ± 2.35 µs per loop
+    if bytes_ or len(x) == 0:
+        encoded = x
+    elif all(isinstance(elt, str) for elt in x):
+        encoded = "\0".join(x).encode("utf-8").split(b"\0")
+    else:
+        # bytes, possibly mixed with strings, e.g. from an object array
+        encoded = list()
+        for elt in x:
+            if isinstance(elt, str):
+                elt = elt.encode("utf-8")
+            elif not isinstance(elt, bytes):
+                raise TypeError(
+                    "The strings to push must be str or bytes. "
+                    f"{type(elt).__name__} is invalid."
+                )
+            encoded.append(elt)
+        if any(b"\0" in elt for elt in encoded):
+            raise ValueError("The strings to push can not contain null characters.")
+    if len(encoded) != len(x):
+        raise ValueError("The strings to push can not contain null characters.")
+    # store the strings in a fixed-width array with at least one trailing null byte
+    encoded = np.array(encoded, dtype="S")
+    width = encoded.dtype.itemsize + 1
+    encoded = encoded.astype(f"S{width}")
+    pointers = np.arange(encoded.size, dtype=np.uintp) * width + encoded.ctypes.data
+    # from_buffer() keeps a reference to 'pointers'
+    return (c_char_p * encoded.size).from_buffer(pointers), encoded
 
 
 # -- Static checker -----------------------------------------------------------
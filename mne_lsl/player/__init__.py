@@ -1 +1,4 @@
-from .player_lsl import PlayerLSL  # noqa: F401
+from ..utils._imports import lazy_attach
+
+# PlayerLSL is imported on first access, as it requires MNE which is slow to import.
+__getattr__, __dir__, __all__ = lazy_attach(__name__, {"PlayerLSL": "player_lsl"})
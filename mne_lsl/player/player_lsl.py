@@ -1,6 +1,7 @@
 from __future__ import annotations  # c.f. PEP 563, PEP 649
 
 from threading import Timer
+from time import perf_counter
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -8,12 +9,13 @@ import numpy as np
 from ..lsl import StreamInfo, StreamOutlet, local_clock
 from ..utils._checks import check_type
 from ..utils._docs import copy_doc
+from ..utils._metrics import _Metrics
 from ..utils.logs import logger
 from ._base import BasePlayer
 
 if TYPE_CHECKING:
     from pathlib import Path
-    from typing import Callable, Dict, Optional, Union
+    from typing import Any, Callable, Dict, Optional, Sequence, Union
 
 
 class PlayerLSL(BasePlayer):
@@ -54,8 +56,59 @@ class PlayerLSL(BasePlayer):
         )
         self._sinfo.set_channel_info(self._raw.info)
         # create additional streaming variables
+        self._metrics = None
         self._reset_variables()
 
+    def enable_metrics(self, size: int = 1024) -> None:
+        """Record metrics about the streaming at every tick.
+
+        The metrics are retained for the last ``size`` streaming ticks in fixed-size
+        arrays and are summarized by :meth:`~mne_lsl.player.PlayerLSL.metrics`. When
+        the metrics are disabled, the streaming is not instrumented.
+
+        Parameters
+        ----------
+        size : int
+            Number of streaming ticks retained.
+        """
+        self._metrics = _Metrics(("duration", "n_samples", "lateness", "latency"), size)
+
+    def disable_metrics(self) -> None:
+        """Stop recording metrics about the streaming."""
+        # a tick in flight records in the metrics it bound
+        self._metrics = None
+
+    def metrics(self, percentiles: Sequence[float] = (50, 95, 99)) -> Dict[str, Any]:
+        """Summarize the metrics recorded during the streaming.
+
+        Parameters
+        ----------
+        percentiles : list of float
+            Percentiles (between 0 and 100) computed on the recorded metrics.
+
+        Returns
+        -------
+        metrics : dict
+            The number of streaming ticks ``'n_ticks'``, the number of ticks
+            ``'overruns'`` which pushed a chunk after the timestamp of its last sample,
+            and for each metric a dictionary mapping the percentiles to their values:
+
+            * ``'duration'``: duration (in seconds) of the push.
+            * ``'n_samples'``: number of samples pushed.
+            * ``'lateness'``: delay (in seconds) between the expected and the actual
+              start of the streaming tick.
+            * ``'latency'``: difference (in seconds) between
+              :func:`~mne_lsl.lsl.local_clock` after the push and the timestamp of the
+              last sample pushed, which is negative if the chunk is pushed ahead of
+              time.
+        """
+        if self._metrics is None:
+            raise RuntimeError(
+                "The metrics are not recorded. Use Player.enable_metrics() to start "
+                "recording them."
+            )
+        return self._metrics.summary(percentiles)
+
     @copy_doc(BasePlayer.rename_channels)
     def rename_channels(
         self,
@@ -106,6 +159,15 @@ class PlayerLSL(BasePlayer):
 
     @copy_doc(BasePlayer._stream)
     def _stream(self) -> None:
+        # bound, the metrics can be disabled during the tick
+        metrics = self._metrics
+        if metrics is None:
+            self._stream_chunk()
+        else:
+            self._stream_with_metrics(metrics)
+
+    def _stream_chunk(self) -> None:
+        """Push a chunk of data and schedule the next tick."""
         try:
             # retrieve data and push to the stream outlet
             start = self._start_idx
@@ -141,6 +203,23 @@ class PlayerLSL(BasePlayer):
                 self._streaming_thread.daemon = True
                 self._streaming_thread.start()
 
+    def _stream_with_metrics(self, metrics: _Metrics) -> None:
+        """Push a chunk of data and record the metrics."""
+        start = perf_counter()
+        # the chunk pushed is timestamped 'delay' after the expected wake up
+        target_timestamp, delay = self._target_timestamp, self._streaming_delay
+        if target_timestamp is None:
+            # the player was stopped or reset, the tick is interrupted without sample
+            self._stream_chunk()
+            return None
+        lateness = local_clock() - target_timestamp
+        self._stream_chunk()
+        stop = perf_counter()
+        latency = local_clock() - target_timestamp - delay
+        metrics.record(
+            (stop - start, self._chunk_size, lateness, latency), overrun=0 < latency
+        )
+
     def _reset_variables(self) -> None:
         """Reset variables for streaming."""
         super()._reset_variables()
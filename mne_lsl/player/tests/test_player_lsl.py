@@ -1,3 +1,5 @@
+import time
+import weakref
 from pathlib import Path
 
 import numpy as np
@@ -243,3 +245,64 @@ def _create_inlet(name: str) -> StreamInlet:
     inlet = StreamInlet(streams[0])
     inlet.open_stream()
     return inlet
+
+
+def test_player_metrics():
+    """Test the metrics recorded while streaming."""
+    player = Player(fname, "Player-test_player_metrics", 16)
+    with pytest.raises(RuntimeError, match="metrics are not recorded"):
+        player.metrics()
+    player.enable_metrics(size=8)
+    player.start()
+    time.sleep(0.5)
+    metrics = player.metrics(percentiles=(50, 95))
+    assert 8 < metrics["n_ticks"]
+    assert metrics["n_samples"] == {50: 16, 95: 16}
+    assert 0 < metrics["duration"][50]
+    for key in ("lateness", "latency"):
+        assert set(metrics[key]) == {50, 95}
+    player.disable_metrics()
+    assert player._metrics is None
+    player.stop()
+    # the metrics do not create a reference cycle delaying the release of the outlet
+    player.enable_metrics()
+    ref = weakref.ref(player)
+    del player
+    assert ref() is None
+
+
+def test_player_metrics_after_reset():
+    """Test that a tick after a reset of the player does not record metrics."""
+    player = Player(fname, "Player-test_player_metrics_after_reset", 16)
+    player.enable_metrics(size=8)
+    assert player._target_timestamp is None
+    player._stream()  # tick in flight when the player is stopped
+    assert player._metrics.summary((50,))["n_ticks"] == 0
+    assert player._streaming_thread is None
+
+
+def test_player_disable_metrics_during_tick(monkeypatch):
+    """Test that the metrics can be disabled while a tick is in flight."""
+    name = "Player-test_player_disable_metrics_during_tick"
+    player = Player(fname, name, 16)
+    player.enable_metrics(size=8)
+    metrics = player._metrics
+    stream_chunk = Player._stream_chunk
+
+    def stream_and_disable(self):
+        self.disable_metrics()  # disabled by another thread during the tick
+        stream_chunk(self)
+
+    monkeypatch.setattr(Player, "_stream_chunk", stream_and_disable)
+    player.start()
+    time.sleep(0.2)
+    assert player._metrics is None
+    assert metrics.summary((50,))["n_ticks"] == 1
+    # the streaming continues after the tick
+    inlet = StreamInlet(resolve_streams(name=name)[0])
+    inlet.open_stream(timeout=5)
+    time.sleep(0.2)
+    _, ts = inlet.pull_chunk()
+    assert 0 < ts.size
+    inlet.close_stream()
+    player.stop()
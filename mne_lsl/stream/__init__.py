@@ -1 +1,5 @@
-from .stream_lsl import StreamLSL  # noqa: F401
+from ..utils._imports import lazy_attach
+from ._info_cache import set_info_cache  # noqa: F401
+
+# StreamLSL is imported on first access, as it requires MNE which is slow to import.
+__getattr__, __dir__, __all__ = lazy_attach(__name__, {"StreamLSL": "stream_lsl"})
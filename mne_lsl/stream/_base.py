@@ -202,7 +202,10 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
         refs = np.zeros((self._timestamps.size, len(ref_channels)), dtype=self.dtype)
         with self._interrupt_acquisition():
             self._added_channels.extend(ref_channels)  # save reference channels
-            self._buffer = np.hstack((self._buffer, refs), dtype=self.dtype)
+            self._window = (
+                np.hstack((self._buffer, refs), dtype=self.dtype),
+                self._timestamps,
+            )
 
     @fill_doc
     def anonymize(self, daysback=None, keep_his=False, *, verbose=None):
@@ -251,9 +254,9 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
         # create the ringbuffer. By the end of this method, the following variables
         # must exist:
         # - self._info: mne.Info
-        # - self._buffer: array of shape (n_samples, n_channels)
-        # - self._timestamps: array of shape (n_samples,) with n_samples which differs
-        #   between regularly and irregularly sampled streams.
+        # - self._window: tuple of the buffer, array of shape (n_samples, n_channels),
+        #   and of the timestamps, array of shape (n_samples,) with n_samples which
+        #   differs between regularly and irregularly sampled streams.
         # - self._picks_inlet: array of shape (n_channels,)
         # plus any additional variables needed by the source and the stream-specific
         # methods.
@@ -263,8 +266,7 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
         """Disconnect from the LSL stream and interrupt data collection."""
         self._check_connected(name="disconnect()")
         self._interrupt = True
-        while self._acquisition_thread.is_alive():
-            self._acquisition_thread.cancel()
+        self._cancel_acquisition_thread()
         # This method needs to close any inlet/network object and need to end with
         # self._reset_variables().
 
@@ -372,8 +374,11 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
         the argument ``picks``.
         """
         try:
+            # the buffer and the timestamps are published together by the acquisition
+            # thread, thus they are retrieved together.
+            buffer, timestamps = self._window
             if winsize is None:
-                n_samples = self._buffer.shape[0]
+                n_samples = buffer.shape[0]
             else:
                 assert (
                     0 <= winsize
@@ -392,7 +397,10 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
             # 253 µs ± 1.22 µs per loop
             picks = _picks_to_idx(self._info, picks, none="all")
             self._n_new_samples = 0  # reset the number of new samples
-            return self._buffer[-n_samples:, picks].T, self._timestamps[-n_samples:]
+            # the buffers are re-used by the acquisition thread, thus the returned
+            # arrays must be copies, which is the case for the data with the advanced
+            # indexing of picks.
+            return buffer[-n_samples:, picks].T, timestamps[-n_samples:].copy()
         except Exception:
             if not self.connected:
                 raise RuntimeError(
@@ -601,8 +609,12 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
         with self._interrupt_acquisition():
             self._ref_channels = picks_ref
             self._ref_from = picks
-            data_ref = self._buffer[:, self._ref_channels].mean(axis=1, keepdims=True)
-            self._buffer[:, self._ref_from] -= data_ref
+            # the buffer is replaced instead of modified in-place, as it can be a
+            # window on a ring storing each sample twice
+            buffer = self._buffer.copy()
+            data_ref = buffer[:, self._ref_channels].mean(axis=1, keepdims=True)
+            buffer[:, self._ref_from] -= data_ref
+            self._window = (buffer, self._timestamps)
             with self._info._unlock():
                 self._info["custom_ref_applied"] = FIFF.FIFFV_MNE_CUSTOM_REF_ON
 
@@ -694,6 +706,35 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
                 "with an irregular sampling rate."
             )
 
+    def _get_data_since(
+        self, timestamp: float, picks: NDArray[int]
+    ) -> Tuple[NDArray[float], NDArray[float]]:
+        """Retrieve the samples acquired after a timestamp from the buffer.
+
+        Contrary to ``get_data()``, the number of new
+        samples is not reset, thus several consumers can retrieve the new samples
+        independently, each keeping track of the last timestamp retrieved.
+
+        Parameters
+        ----------
+        timestamp : float
+            Timestamp of the last sample already retrieved.
+        picks : array of int
+            Indices of the channels to retrieve.
+
+        Returns
+        -------
+        data : array of shape (n_channels, n_samples)
+            Data acquired after the timestamp.
+        timestamps : array of shape (n_samples,)
+            Timestamps acquired after the timestamp.
+        """
+        # the buffer and the timestamps are published together by the acquisition
+        # thread, and the new samples are written outside of the published window.
+        data, timestamps = self._window
+        start = np.searchsorted(timestamps, timestamp, side="right")
+        return data[start:, picks].T, timestamps[start:].copy()
+
     def _create_acquisition_thread(self, delay: float) -> None:
         """Create and start the daemonic acquisition thread.
 
@@ -706,6 +747,21 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
         self._acquisition_thread.daemon = True
         self._acquisition_thread.start()
 
+    def _cancel_acquisition_thread(self) -> None:
+        """Cancel the acquisition thread and wait for its termination.
+
+        A running acquisition thread might have re-created the next thread before
+        seeing the interrupt flag, thus the cancellation is repeated until the current
+        acquisition thread is the one which was cancelled.
+        """
+        while True:
+            thread = self._acquisition_thread
+            thread.cancel()
+            if thread.ident is not None:  # the thread might not be started yet
+                thread.join()
+            if thread is self._acquisition_thread:
+                break
+
     @contextmanager
     def _interrupt_acquisition(self):
         """Context manager interrupting the acquisition thread."""
@@ -716,8 +772,7 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
                 "error traceback to the developers."
             )
         self._interrupt = True
-        while self._acquisition_thread.is_alive():
-            self._acquisition_thread.cancel()
+        self._cancel_acquisition_thread()
         yield
         self._interrupt = False
         self._create_acquisition_thread(0)
@@ -744,7 +799,7 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
         with self._interrupt_acquisition():
             self._info = pick_info(self._info, picks)
             self._picks_inlet = self._picks_inlet[picks_inlet]
-            self._buffer = self._buffer[:, picks]
+            self._window = (self._buffer[:, picks], self._timestamps)
 
             # prune added channels which are not part of the inlet
             for ch in self._added_channels[::-1]:
@@ -758,13 +813,12 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
         self._acquisition_delay = None
         self._acquisition_thread = None
         self._interrupt = False
-        self._buffer = None
+        self._window = None
         self._n_new_samples = None
         self._picks_inlet = None
         self._added_channels = []
         self._ref_channels = None
         self._ref_from = None
-        self._timestamps = None
         # This method needs to reset any stream-system-specific variables, e.g. an inlet
         # or a StreamInfo for LSL streams.
 
@@ -798,9 +852,8 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
             "_info",
             "_acquisition_delay",
             "_acquisition_thread",
-            "_buffer",
+            "_window",
             "_picks_inlet",
-            "_timestamps",
         )
         if all(getattr(self, attr) is None for attr in attributes):
             return False
@@ -809,6 +862,16 @@ class BaseStream(ABC, ContainsMixin, SetChannelsMixin):
             assert not any(getattr(self, attr) is None for attr in attributes)
             return True
 
+    @property
+    def _buffer(self) -> Optional[NDArray[float]]:
+        """Buffer of shape (n_samples, n_channels) of the published window."""
+        return None if self._window is None else self._window[0]
+
+    @property
+    def _timestamps(self) -> Optional[NDArray[float]]:
+        """Timestamps of shape (n_samples,) of the published window."""
+        return None if self._window is None else self._window[1]
+
     @property
     def dtype(self) -> Optional[DTypeLike]:
         """Channel format of the stream."""
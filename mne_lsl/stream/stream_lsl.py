@@ -1,6 +1,7 @@
 from __future__ import annotations  # c.f. PEP 563, PEP 649
 
 from math import ceil
+from time import perf_counter
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -13,19 +14,30 @@ elif check_version("mne", "1.6"):
 else:
     from mne.io.constants import FIFF
 
-from ..lsl import StreamInlet, resolve_streams
+from ..lsl import StreamInlet, local_clock, resolve_streams
 from ..lsl.constants import fmt2numpy
+from ..lsl.utils import LostError
 from ..utils._checks import check_type
 from ..utils._docs import fill_doc
+from ..utils._metrics import _Metrics
 from ..utils.logs import logger
+from . import _info_cache
 from ._base import BaseStream
 
 if TYPE_CHECKING:
-    from typing import Optional, Sequence, Union
+    from typing import Any, Dict, Optional, Sequence, Union
+
+    from numpy.typing import NDArray
 
     from mne_lsl.lsl.stream_info import _BaseStreamInfo
 
 
+# number of sampling periods between 2 samples above which a gap is recorded
+_GAP_PERIODS = 5
+# maximum number of samples returned by a single pull of the inlet
+_MAX_SAMPLES = 1024
+
+
 @fill_doc
 class StreamLSL(BaseStream):
     """Stream object representing a single LSL stream.
@@ -62,6 +74,7 @@ class StreamLSL(BaseStream):
         self._name = name
         self._stype = stype
         self._source_id = source_id
+        self._metrics = None
         self._reset_variables()
 
     def __repr__(self):
@@ -98,6 +111,7 @@ class StreamLSL(BaseStream):
         processing_flags: Optional[Union[str, Sequence[str]]] = None,
         timeout: Optional[float] = 2,
         acquisition_delay: float = 0.2,
+        recover: bool = True,
     ) -> None:
         """Connect to the LSL stream and initiate data collection in the buffer.
 
@@ -120,6 +134,11 @@ class StreamLSL(BaseStream):
         acquisition_delay : float
             Delay in seconds between 2 acquisition during which chunks of data are
             pulled from the :class:`~mne_lsl.lsl.StreamInlet`.
+        recover : bool
+            If True, a lost connection is recovered. The stream is resolved again, by
+            ``source_id`` if available, and the acquisition resumes in the existing
+            buffer. The interruption is reported in :attr:`~StreamLSL.gaps`. If False,
+            a lost connection disconnects the stream.
 
         Notes
         -----
@@ -145,6 +164,7 @@ class StreamLSL(BaseStream):
             )
         if processing_flags == "all":
             processing_flags = ("clocksync", "dejitter", "monotize")
+        check_type(recover, (bool,), "recover")
         # resolve and connect to available streams
         sinfos = resolve_streams(timeout, self._name, self._stype, self._source_id)
         if len(sinfos) != 1:
@@ -164,32 +184,34 @@ class StreamLSL(BaseStream):
             sinfos[0],
             max_buffered=ceil(self._bufsize),
             processing_flags=processing_flags,
+            recover=recover,
         )
         self._inlet.open_stream(timeout=timeout)
+        self._processing_flags = processing_flags
+        self._recover = recover
         self._sinfo = self._inlet.get_sinfo()
         self._name = self._sinfo.name
         self._stype = self._sinfo.stype
         self._source_id = self._sinfo.source_id
-        # create MNE info from the LSL stream info returned by an open stream inlet
-        self._info = self._sinfo.get_channel_info()
+        # create MNE info from the LSL stream info returned by an open stream inlet,
+        # reusing the info parsed on a previous connection if the stream is unchanged
+        self._info = _info_cache._cache.get_channel_info(self._sinfo)
         # initiate time-correction
         tc = self._inlet.time_correction(timeout=timeout)
         logger.info("The estimated timestamp offset is %.2f seconds.", tc)
         # create buffer of shape (n_samples, n_channels) and (n_samples,)
-        if self._inlet.sfreq == 0:
-            self._buffer = np.zeros(
-                (self._bufsize, self._inlet.n_channels),
-                dtype=fmt2numpy[self._inlet._dtype],
-            )
-            self._timestamps = np.zeros(self._bufsize, dtype=np.float64)
-        else:
-            self._buffer = np.zeros(
-                (ceil(self._bufsize * self._inlet.sfreq), self._inlet.n_channels),
+        n_samples = (
+            self._bufsize
+            if self._inlet.sfreq == 0
+            else ceil(self._bufsize * self._inlet.sfreq)
+        )
+        self._window = (
+            np.zeros(
+                (n_samples, self._inlet.n_channels),
                 dtype=fmt2numpy[self._inlet._dtype],
-            )
-            self._timestamps = np.zeros(
-                ceil(self._bufsize * self._inlet.sfreq), dtype=np.float64
-            )
+            ),
+            np.zeros(n_samples, dtype=np.float64),
+        )
         self._picks_inlet = np.arange(0, self._inlet.n_channels)
         # define the acquisition thread
         self._create_acquisition_thread(0)
@@ -201,62 +223,371 @@ class StreamLSL(BaseStream):
         del self._inlet
         self._reset_variables()
 
+    def enable_metrics(self, size: int = 1024) -> None:
+        """Record metrics about the acquisition at every tick.
+
+        The metrics are retained for the last ``size`` acquisition ticks in fixed-size
+        arrays and are summarized by :meth:`~mne_lsl.stream.StreamLSL.metrics`. When
+        the metrics are disabled, the acquisition is not instrumented.
+
+        Parameters
+        ----------
+        size : int
+            Number of acquisition ticks retained.
+        """
+        self._metrics = _Metrics(
+            ("duration", "n_samples", "backlog", "fill", "lateness", "latency"), size
+        )
+        self._metrics_next_tick = np.nan
+
+    def disable_metrics(self) -> None:
+        """Stop recording metrics about the acquisition."""
+        # a tick in flight records in the metrics it bound
+        self._metrics = None
+
+    def metrics(self, percentiles: Sequence[float] = (50, 95, 99)) -> Dict[str, Any]:
+        """Summarize the metrics recorded during the acquisition.
+
+        Parameters
+        ----------
+        percentiles : list of float
+            Percentiles (between 0 and 100) computed on the recorded metrics.
+
+        Returns
+        -------
+        metrics : dict
+            The number of acquisition ticks ``'n_ticks'``, the number of ticks
+            ``'overruns'`` which overwrote new samples not yet retrieved, and
+            for each metric a dictionary mapping the percentiles to their values:
+
+            * ``'duration'``: duration (in seconds) of the pull.
+            * ``'n_samples'``: number of samples pulled.
+            * ``'backlog'``: number of samples available in the inlet before the pull.
+            * ``'fill'``: ratio between the number of new samples and the buffer size.
+            * ``'lateness'``: delay (in seconds) between the expected and the actual
+              start of the acquisition tick.
+            * ``'latency'``: difference (in seconds) between
+              :func:`~mne_lsl.lsl.local_clock` and the timestamp of the last sample
+              pulled. Without the processing flag ``'clocksync'``, this difference
+              includes the clock offset between the source and the local computer.
+        """
+        if self._metrics is None:
+            raise RuntimeError(
+                "The metrics are not recorded. Use Stream.enable_metrics() to start "
+                "recording them."
+            )
+        return self._metrics.summary(percentiles)
+
     def _acquire(self) -> None:
         """Update function pulling new samples in the buffer at a regular interval."""
         try:
-            # pull data
-            data, timestamps = self._inlet.pull_chunk(timeout=0.0)
-            if timestamps.size == 0:
-                return None  # interrupt early
-
-            # process acquisition window
-            data = data[:, self._picks_inlet]
-            if len(self._added_channels) != 0:
-                refs = np.zeros(
-                    (timestamps.size, len(self._added_channels)), dtype=self.dtype
-                )
-                data = np.hstack((data, refs), dtype=self.dtype)
-
-            if self.info["custom_ref_applied"] == FIFF.FIFFV_MNE_CUSTOM_REF_ON:
-                data_ref = data[:, self._ref_channels].mean(axis=1, keepdims=True)
-                data[:, self._ref_from] -= data_ref
-
-            # roll and update buffers
-            self._buffer = np.roll(self._buffer, -timestamps.size, axis=0)
-            self._timestamps = np.roll(self._timestamps, -timestamps.size, axis=0)
-            # fmt: off
-            self._buffer[-timestamps.size :, :] = data[-self._timestamps.size :, :]  # noqa: E203, E501
-            self._timestamps[-timestamps.size :] = timestamps[-self._timestamps.size :]  # noqa: E203, E501
-            # fmt: on
-            # update the number of new samples available
-            self._n_new_samples += min(timestamps.size, self.n_buffer)
-            if (
-                self._timestamps.size < self._n_new_samples
-                or self._timestamps.size < timestamps.size
-            ):
-                logger.info(
-                    "The number of new samples exceeds the buffer size. Consider using "
-                    "a larger buffer by creating a Stream with a larger 'bufsize' "
-                    "argument or consider retrieving new samples more often with "
-                    "Stream.get_data()."
-                )
+            # bound, the metrics can be disabled during the tick
+            metrics = self._metrics
+            if metrics is None:
+                n_samples = self._pull_samples()
+            else:
+                n_samples = self._pull_samples_with_metrics(metrics)
+            if n_samples != 0:
+                self._update_gaps(n_samples)
+                # update the number of new samples available
+                self._n_new_samples += min(n_samples, self.n_buffer)
+                if (
+                    self._timestamps.size < self._n_new_samples
+                    or self._timestamps.size < n_samples
+                ):
+                    logger.info(
+                        "The number of new samples exceeds the buffer size. Consider "
+                        "using a larger buffer by creating a Stream with a larger "
+                        "'bufsize' argument or consider retrieving new samples more "
+                        "often with Stream.get_data()."
+                    )
+        except LostError as error:
+            if not self._recover:
+                logger.exception(error)
+                self._reset_variables()
+                return None  # equivalent to an interrupt
+            logger.warning(
+                "The connection to the stream '%s' was lost. Attempting to recover it.",
+                self._name,
+            )
+            self._lost = True
         except Exception as error:
             logger.exception(error)
             self._reset_variables()
             return None  # equivalent to an interrupt
+        if self._interrupt:
+            # don't recreate the thread if we are trying to interrupt acquisition
+            return None
+        # recreate the timer thread as it is one-call only
+        self._create_acquisition_thread(self._acquisition_delay)
+
+    def _pull_samples(self) -> int:
+        """Pull the new samples available in the buffer."""
+        if self._lost and not self._reconnect():
+            return 0
+        elif self._pull_into_buffer():
+            return self._acquire_into_buffer()
         else:
-            if self._interrupt:
-                # don't recreate the thread if we are trying to interrupt acquisition
-                return None
-            else:
-                # recreate the timer thread as it is one-call only
-                self._create_acquisition_thread(self._acquisition_delay)
+            return self._acquire_chunk()
+
+    def _pull_samples_with_metrics(self, metrics: _Metrics) -> int:
+        """Pull the new samples available in the buffer and record the metrics."""
+        start = perf_counter()
+        lateness = start - self._metrics_next_tick
+        backlog = np.nan if self._lost else self._inlet.samples_available
+        n_samples = self._pull_samples()
+        stop = perf_counter()
+        n_new_samples = self._n_new_samples + n_samples
+        metrics.record(
+            (
+                stop - start,
+                n_samples,
+                backlog,
+                min(n_new_samples, self._timestamps.size) / self._timestamps.size,
+                lateness,
+                local_clock() - self._timestamps[-1] if n_samples != 0 else np.nan,
+            ),
+            # unread samples were overwritten
+            overrun=n_samples != 0 and self._timestamps.size < n_new_samples,
+        )
+        self._metrics_next_tick = stop + self._acquisition_delay
+        return n_samples
+
+    def _reconnect(self) -> bool:
+        """Try to reconnect to a lost stream, keeping the existing buffer.
+
+        The stream is resolved by ``source_id`` if available, else by ``name`` and
+        ``stype``, and must match the number of channels, the sampling rate and the data
+        type of the lost stream. The buffer is kept as is and the acquisition resumes in
+        it, without reallocation.
+        """
+        source_id = self._source_id if len(self._source_id) != 0 else None
+        sinfos = resolve_streams(
+            timeout=max(self._acquisition_delay, 0.1),
+            name=self._name,
+            stype=self._stype,
+            source_id=source_id,
+            minimum=1,
+        )
+        sinfos = [
+            sinfo
+            for sinfo in sinfos
+            if sinfo.n_channels == self._sinfo.n_channels
+            and sinfo.sfreq == self._sinfo.sfreq
+            and sinfo.dtype == self._sinfo.dtype
+        ]
+        if len(sinfos) == 0:
+            return False
+        timeout = max(self._acquisition_delay, 0.1)
+        inlet = StreamInlet(
+            sinfos[0],
+            max_buffered=ceil(self._bufsize),
+            processing_flags=self._processing_flags,
+            recover=self._recover,
+        )
+        try:
+            inlet.open_stream(timeout=timeout)
+            sinfo = inlet.get_sinfo(timeout=timeout)
+        except (TimeoutError, LostError):
+            # the stream is resolved but not ready, the reconnection is attempted
+            # again at the next acquisition tick
+            _close_inlet(inlet)
+            return False
+        self._inlet, inlet = inlet, self._inlet
+        _close_inlet(inlet)
+        self._sinfo = sinfo
+        self._lost = False
+        self._gap_pending = True
+        logger.info("The connection to the stream '%s' was recovered.", self._name)
+        return True
+
+    def _update_gaps(self, n_samples: int) -> None:
+        """Record the gap, if any, between the previous and the new samples."""
+        first = self._timestamps[-min(n_samples, self._timestamps.size)]
+        if self._last_timestamp is not None and (
+            self._gap_pending
+            or (
+                self._inlet.sfreq != 0
+                and _GAP_PERIODS / self._inlet.sfreq < first - self._last_timestamp
+            )
+        ):
+            self._gaps.append((self._last_timestamp, first))
+            logger.info(
+                "Gap of %.3f seconds between samples in the stream '%s'.",
+                first - self._last_timestamp,
+                self._name,
+            )
+        self._gap_pending = False
+        self._last_timestamp = self._timestamps[-1]
+        # forget the gaps which are not in the buffer anymore
+        while len(self._gaps) != 0 and self._gaps[0][1] < self._timestamps[0]:
+            self._gaps.pop(0)
+
+    def _pull_into_buffer(self) -> bool:
+        """Check if the samples can be pulled directly in the tail of the buffer.
+
+        This is the case if the buffer contains all the channels of the inlet, in
+        order, without added reference channels.
+        """
+        return (
+            self._picks_inlet.size == self._inlet.n_channels
+            and len(self._added_channels) == 0
+            and self._buffer.flags["C_CONTIGUOUS"]
+            and bool(np.all(self._picks_inlet[1:] > self._picks_inlet[:-1]))
+        )
+
+    def _acquire_into_buffer(self) -> int:
+        """Pull new samples directly in the ring backing the buffer.
+
+        The samples are written by liblsl in the ring, skipping the copy from the inlet
+        internal buffer, the channel selection and the allocations of np.roll.
+        """
+        n_samples = self._inlet.samples_available
+        if n_samples == 0:
+            return 0
+        if self._timestamps.size < n_samples:
+            # more samples than the buffer can hold, only the last ones are retained
+            return self._acquire_chunk()
+        start = self._ring_position(n_samples)
+        ring, ring_ts = self._ring
+        n_pulled = self._inlet.pull_chunk_into(
+            ring[start : start + n_samples],
+            ring_ts[start : start + n_samples],
+            timeout=0.0,
+        )
+        if n_pulled == 0:
+            return 0
+        if self.info["custom_ref_applied"] == FIFF.FIFFV_MNE_CUSTOM_REF_ON:
+            data = ring[start : start + n_pulled]
+            data_ref = data[:, self._ref_channels].mean(axis=1, keepdims=True)
+            data[:, self._ref_from] -= data_ref
+        self._ring_publish(start, n_pulled)
+        return n_pulled
+
+    def _ring_position(self, n_samples: int) -> int:
+        """Position in the ring at which the next ``n_samples`` samples are written.
+
+        The buffer is a window on a ring of twice its size in which every sample is
+        written twice, at the positions ``k`` and ``k + n_buffer``, thus the window
+        ``ring[start : start + n_buffer]`` is always contiguous. Writing new samples
+        costs a copy of the new samples instead of a copy of the entire buffer, at the
+        cost of a ring twice the size of the buffer.
+
+        The ring is created, or re-created from the current buffer, if the buffer is
+        not a window on the ring, e.g. after a channel selection.
+        """
+        buffer, timestamps = self._window
+        if (
+            self._ring is None
+            or buffer.base is not self._ring[0]
+            or timestamps.base is not self._ring[1]
+        ):
+            size = timestamps.size
+            ring = np.empty((2 * size, buffer.shape[1]), dtype=buffer.dtype)
+            ring_ts = np.empty(2 * size, dtype=timestamps.dtype)
+            ring[:size] = ring[size:] = buffer
+            ring_ts[:size] = ring_ts[size:] = timestamps
+            self._ring = (ring, ring_ts)
+            self._ring_start = 0
+            self._window = (ring[:size], ring_ts[:size])
+        size = self._timestamps.size
+        if self._ring_start + n_samples <= size:
+            # the samples are written after the current window, in the second half
+            return self._ring_start + size
+        # the samples are written over the oldest samples of the current window
+        return self._ring_start
+
+    def _ring_publish(self, start: int, n_samples: int) -> None:
+        """Publish the window ending with the samples written at ``start``.
+
+        The buffer and the timestamps are published together, in a single assignment,
+        thus a reader never pairs the samples with the timestamps of another window.
+        The new samples are then copied at their mirrored position, outside of the
+        published window. The new samples and their copies overwrite the oldest
+        samples of the previous window, thus a reader still copying the entire previous
+        window might read some of the new samples instead of the oldest ones.
+        """
+        ring, ring_ts = self._ring
+        size = self._timestamps.size
+        # once samples are written, the start of the window is in ]0, size], thus the
+        # window ending at the end of the ring is the second half, where the new
+        # samples were written, instead of the first half
+        self._ring_start += n_samples
+        if size < self._ring_start:
+            self._ring_start -= size
+        self._window = (
+            ring[self._ring_start : self._ring_start + size],
+            ring_ts[self._ring_start : self._ring_start + size],
+        )
+        positions = np.arange(start, start + n_samples)
+        mirrors = (positions + size) % (2 * size)
+        ring[mirrors] = ring[positions]
+        ring_ts[mirrors] = ring_ts[positions]
+
+    def _acquire_chunk(self) -> int:
+        """Pull new samples in the inlet buffer and copy them in the buffer.
+
+        A pull returns at most _MAX_SAMPLES samples, thus the inlet is pulled until it
+        is drained. Else, the samples of a stream with a high sampling rate would
+        accumulate in the inlet, delaying the acquisition a bit more at every pull.
+        """
+        chunks, n_samples, n_pulled = list(), 0, 0
+        while True:
+            data, timestamps = self._inlet.pull_chunk(
+                timeout=0.0, max_samples=_MAX_SAMPLES
+            )
+            if timestamps.size == 0:
+                break
+            chunks.append((data, timestamps))
+            n_samples += timestamps.size
+            n_pulled += timestamps.size
+            # only the chunks holding the last samples the buffer can hold are retained
+            while self._timestamps.size <= n_samples - chunks[0][1].size:
+                n_samples -= chunks.pop(0)[1].size
+            if timestamps.size < _MAX_SAMPLES:
+                break
+        if len(chunks) == 0:
+            return 0
+        elif len(chunks) == 1:
+            data, timestamps = chunks[0]
+        else:
+            data = np.concatenate([chunk[0] for chunk in chunks])
+            timestamps = np.concatenate([chunk[1] for chunk in chunks])
+
+        # process acquisition window
+        data = data[:, self._picks_inlet]
+        if len(self._added_channels) != 0:
+            refs = np.zeros(
+                (timestamps.size, len(self._added_channels)), dtype=self.dtype
+            )
+            data = np.hstack((data, refs), dtype=self.dtype)
+
+        if self.info["custom_ref_applied"] == FIFF.FIFFV_MNE_CUSTOM_REF_ON:
+            data_ref = data[:, self._ref_channels].mean(axis=1, keepdims=True)
+            data[:, self._ref_from] -= data_ref
+
+        # write the last samples the buffer can hold in the ring
+        n_samples = min(timestamps.size, self._timestamps.size)
+        start = self._ring_position(n_samples)
+        ring, ring_ts = self._ring
+        ring[start : start + n_samples] = data[-n_samples:]
+        ring_ts[start : start + n_samples] = timestamps[-n_samples:]
+        self._ring_publish(start, n_samples)
+        return n_pulled
 
     def _reset_variables(self) -> None:
         """Reset variables define after connection."""
         super()._reset_variables()
         self._sinfo = None
         self._inlet = None
+        self._ring = None
+        self._ring_start = None
+        self._processing_flags = None
+        self._recover = None
+        self._lost = False
+        self._gaps = []
+        self._gap_pending = False
+        self._last_timestamp = None
 
     # ----------------------------------------------------------------------------------
     @property
@@ -288,6 +619,20 @@ class StreamLSL(BaseStream):
             assert all(getattr(self, attr) is None for attr in attributes)
             return False
 
+    @property
+    def gaps(self) -> NDArray[np.float64]:
+        """Gaps between consecutive samples present in the buffer.
+
+        A gap is recorded when the connection to the stream is recovered, or when the
+        interval between 2 consecutive samples of a regularly sampled stream exceeds
+        5 sampling periods, e.g. when samples are lost. Each gap is defined by the
+        timestamps of the last sample before and of the first sample after the gap.
+
+        :type: :class:`~numpy.ndarray` of shape (n_gaps, 2)
+        """
+        self._check_connected(name="gaps")
+        return np.array(self._gaps, dtype=np.float64).reshape(-1, 2)
+
     @property
     def name(self) -> Optional[str]:
         """Name of the LSL stream.
@@ -319,3 +664,11 @@ class StreamLSL(BaseStream):
         :type: :class:`str` | None
         """
         return self._source_id
+
+
+def _close_inlet(inlet: StreamInlet) -> None:
+    """Close the stream of an inlet, ignoring the errors of a lost stream."""
+    try:
+        inlet.close_stream()
+    except Exception:
+        pass
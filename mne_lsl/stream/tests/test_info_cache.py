@@ -0,0 +1,93 @@
+from time import strftime
+
+import numpy as np
+import pytest
+from mne import create_info
+
+from mne_lsl.lsl import StreamInfo
+from mne_lsl.stream import _info_cache as info_cache_module
+from mne_lsl.stream import set_info_cache
+from mne_lsl.stream._info_cache import _InfoCache
+from mne_lsl.utils._tests import compare_infos
+
+
+def _create_sinfo(n_channels=3, name="test"):
+    """Create a stream info with a filled description."""
+    info = create_info(n_channels, 1000, "eeg")
+    sinfo = StreamInfo(name, "eeg", n_channels, 1000, np.float32, strftime("%H%M%S"))
+    sinfo.set_channel_info(info)
+    return sinfo
+
+
+def test_info_cache():
+    """Test the in-memory LRU cache of parsed measurement info."""
+    cache = _InfoCache(maxsize=2)
+    sinfo = _create_sinfo()
+    info = cache.get_channel_info(sinfo)
+    compare_infos(info, sinfo.get_channel_info())
+    assert len(cache._cache) == 1
+    # a cache hit returns a copy which can be modified in-place
+    info2 = cache.get_channel_info(sinfo)
+    assert info2 is not info
+    compare_infos(info, info2)
+    with info2._unlock():
+        info2["bads"] = [info2["ch_names"][0]]
+    assert cache.get_channel_info(sinfo)["bads"] == []
+    assert len(cache._cache) == 1
+    # a modified description is parsed again
+    sinfo.set_channel_names(["1", "2", "3"])
+    assert cache.get_channel_info(sinfo)["ch_names"] == ["1", "2", "3"]
+    assert len(cache._cache) == 2
+    # least recently used entries are evicted
+    sinfo2 = _create_sinfo(5, "test2")
+    assert len(cache.get_channel_info(sinfo2)["ch_names"]) == 5
+    assert len(cache._cache) == 2
+    assert cache.get_channel_info(sinfo)["ch_names"] == ["1", "2", "3"]
+    assert list(cache._cache.values())[-1]["ch_names"] == ["1", "2", "3"]
+    cache.clear()
+    assert len(cache._cache) == 0
+
+
+def test_info_cache_disabled():
+    """Test disabling the cache."""
+    cache = _InfoCache(maxsize=0)
+    sinfo = _create_sinfo()
+    compare_infos(cache.get_channel_info(sinfo), sinfo.get_channel_info())
+    assert len(cache._cache) == 0
+
+
+def test_info_cache_directory(tmp_path):
+    """Test the on-disk cache of parsed measurement info."""
+    cache = _InfoCache(maxsize=2, directory=tmp_path)
+    sinfos = [_create_sinfo(k + 2, f"test{k}") for k in range(3)]
+    info = cache.get_channel_info(sinfos[0])
+    assert len(list(tmp_path.glob("*-info.pkl"))) == 1
+    # a different cache instance, e.g. in another process, reads the file
+    cache2 = _InfoCache(maxsize=2, directory=tmp_path)
+    compare_infos(cache2._read(next(iter(cache._cache))), info)
+    compare_infos(cache2.get_channel_info(sinfos[0]), info)
+    for sinfo in sinfos[1:]:
+        cache.get_channel_info(sinfo)
+    assert len(list(tmp_path.glob("*-info.pkl"))) == 2
+
+
+def test_invalid_info_cache(tmp_path):
+    """Test invalid arguments for the info cache."""
+    with pytest.raises(ValueError, match="must be a positive integer"):
+        _InfoCache(maxsize=-1)
+    with pytest.raises(TypeError, match="must be an integer"):
+        _InfoCache(maxsize=2.5)
+    with pytest.raises(FileNotFoundError, match="does not exist"):
+        _InfoCache(directory=tmp_path / "missing")
+
+
+def test_set_info_cache(tmp_path):
+    """Test configuring the info cache used by the streams."""
+    cache = info_cache_module._cache
+    try:
+        set_info_cache(maxsize=5, directory=tmp_path)
+        assert info_cache_module._cache is not cache
+        assert info_cache_module._cache._maxsize == 5
+        assert info_cache_module._cache._directory == tmp_path
+    finally:
+        info_cache_module._cache = cache
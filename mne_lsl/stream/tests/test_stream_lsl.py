@@ -1,5 +1,7 @@
 import re
 import time
+import uuid
+import weakref
 from datetime import datetime, timezone
 
 import numpy as np
@@ -20,6 +22,7 @@ else:
 
 from mne_lsl import logger
 from mne_lsl.datasets import testing
+from mne_lsl.lsl import StreamInfo, StreamInlet, StreamOutlet, local_clock
 from mne_lsl.stream import StreamLSL as Stream
 from mne_lsl.utils._tests import match_stream_and_raw_data
 from mne_lsl.utils.logs import _use_log_level
@@ -491,3 +494,227 @@ def test_stream_rereference_average(mock_lsl_stream_int):
     data, _ = stream.get_data(picks="eeg")
     assert_allclose(data, data_ref)
     stream.disconnect()
+
+
+def _create_outlet(name, source_id=""):
+    """Create an outlet with 2 channels sampled at 100 Hz."""
+    sinfo = StreamInfo(name, "eeg", 2, 100, np.float32, source_id)
+    sinfo.set_channel_names(["a", "b"])
+    return StreamOutlet(sinfo)
+
+
+def _push(outlet, start, stop):
+    """Push the samples [start, stop[ at 100 Hz, in chunks of 10 samples."""
+    for k in range(start, stop, 10):
+        data = np.arange(k, k + 10, dtype=np.float32)
+        outlet.push_chunk(np.tile(data, (2, 1)).T.copy())
+        time.sleep(0.1)
+
+
+def test_stream_gaps():
+    """Test the detection of gaps between consecutive samples."""
+    name = f"pytest-gaps-{uuid.uuid4().hex[:6]}"
+    outlet = _create_outlet(name)
+    stream = Stream(bufsize=5, name=name)
+    stream.connect(acquisition_delay=0.05)
+    data = np.ones((10, 2), dtype=np.float32)
+    now = local_clock()
+    outlet.push_chunk(data, timestamp=now - 1)
+    time.sleep(0.3)
+    assert stream.gaps.shape == (0, 2)
+    outlet.push_chunk(data, timestamp=now - 0.9)  # continuous
+    time.sleep(0.3)
+    assert stream.gaps.shape == (0, 2)
+    outlet.push_chunk(data, timestamp=now)  # gap of 0.8 second
+    time.sleep(0.3)
+    gaps = stream.gaps
+    assert gaps.shape == (1, 2)
+    assert_allclose(gaps[0, 1] - gaps[0, 0], 0.81, atol=1e-6)
+    stream.disconnect()
+    with pytest.raises(RuntimeError, match="Please connect to the stream"):
+        stream.gaps
+
+
+def test_stream_recover():
+    """Test the recovery of a lost connection, keeping the buffer."""
+    name = f"pytest-recover-{uuid.uuid4().hex[:6]}"
+    outlet = _create_outlet(name)
+    stream = Stream(bufsize=10, name=name)
+    stream.connect(acquisition_delay=0.05)
+    _push(outlet, 0, 100)
+    time.sleep(0.3)
+    ring = stream._ring
+    del outlet
+    time.sleep(2)
+    outlet = _create_outlet(name)
+    _push(outlet, 200, 300)
+    time.sleep(0.5)
+    assert stream.connected
+    assert not stream._lost
+    assert stream._ring is ring
+    assert stream._buffer.base is ring[0]
+    assert stream.gaps.shape == (1, 2)
+    data, _ = stream.get_data(winsize=3)
+    # the samples before and after the loss are retained
+    assert 99 in data[0]
+    assert 299 in data[0]
+    stream.disconnect()
+
+    # without recovery, a lost connection disconnects the stream
+    stream.connect(acquisition_delay=0.05, recover=False)
+    del outlet
+    time.sleep(3)
+    assert not stream.connected
+
+
+def test_stream_recover_not_ready(monkeypatch):
+    """Test that a stream resolved but not ready is retried at the next tick."""
+    name = f"pytest-recover-{uuid.uuid4().hex[:6]}"
+    outlet = _create_outlet(name)
+    stream = Stream(bufsize=10, name=name)
+    stream.connect(acquisition_delay=0.05)
+    _push(outlet, 0, 50)
+    time.sleep(0.3)
+    ring = stream._ring
+
+    def open_stream(self, timeout=None):
+        raise TimeoutError("The stream is not ready.")
+
+    monkeypatch.setattr(StreamInlet, "open_stream", open_stream)
+    del outlet
+    time.sleep(2)
+    outlet = _create_outlet(name)
+    time.sleep(1)
+    # the reconnection fails without disconnecting the stream
+    assert stream.connected
+    assert stream._lost
+    assert stream._ring is ring
+    monkeypatch.undo()
+    _push(outlet, 200, 250)
+    time.sleep(0.5)
+    assert not stream._lost
+    data, _ = stream.get_data(winsize=3)
+    assert 49 in data[0]
+    assert 249 in data[0]
+    stream.disconnect()
+
+
+def test_stream_metrics(mock_lsl_stream):
+    """Test the metrics recorded during the acquisition."""
+    stream = Stream(bufsize=2, name="Player-pytest")
+    with pytest.raises(RuntimeError, match="metrics are not recorded"):
+        stream.metrics()
+    stream.enable_metrics(size=16)
+    stream.connect(acquisition_delay=0.01)
+    time.sleep(0.5)
+    metrics = stream.metrics(percentiles=(50, 99))
+    assert 16 < metrics["n_ticks"]
+    assert metrics["overruns"] == 0
+    for key in ("duration", "n_samples", "backlog", "fill", "lateness", "latency"):
+        assert set(metrics[key]) == {50, 99}
+    assert 0 < metrics["n_samples"][99]
+    assert 0 < metrics["fill"][99] <= 1
+    stream.disable_metrics()
+    assert stream._metrics is None
+    time.sleep(0.1)
+    stream.disconnect()
+    # the metrics do not create a reference cycle delaying the release of the stream
+    ref = weakref.ref(stream)
+    del stream
+    assert ref() is None
+
+
+@pytest.mark.parametrize("pick", (False, True))
+def test_stream_ring(pick):
+    """Test that the buffer and the timestamps are written in a ring and paired."""
+    name = f"pytest-ring-{uuid.uuid4().hex[:6]}"
+    outlet = _create_outlet(name)
+    stream = Stream(bufsize=1, name=name)  # 100 samples
+    stream.connect(acquisition_delay=0.01)
+    if pick:
+        stream.pick("b")  # the samples are pulled in chunks and copied in the ring
+    rng = np.random.default_rng(0)
+    start = 0
+    for n_samples in rng.integers(1, 150, size=20):
+        data = np.arange(start, start + n_samples, dtype=np.float32)
+        outlet.push_chunk(
+            np.tile(data, (2, 1)).T.copy(), timestamp=data.astype(np.float64)
+        )
+        start += n_samples
+        time.sleep(0.05)
+        data, timestamps = stream.get_data()
+        # the samples are paired with their timestamps, in order
+        assert_allclose(data[-1], timestamps)
+        assert timestamps[-1] == start - 1
+        n_valid = min(start, 100)
+        assert_allclose(np.diff(timestamps[-n_valid:]), 1)
+        assert stream._buffer.base is stream._ring[0]
+        assert 2 * 100 == stream._ring[1].size
+    stream.disconnect()
+
+
+@pytest.mark.parametrize("pick", (False, True))
+def test_stream_drain_inlet(pick):
+    """Test that the inlet is drained at every acquisition."""
+    name = f"pytest-drain-{uuid.uuid4().hex[:6]}"
+    outlet = _create_outlet(name)
+    stream = Stream(bufsize=60, name=name)
+    stream.connect(acquisition_delay=0.5)
+    if pick:
+        stream.pick("b")  # the samples are pulled in chunks and copied in the buffer
+    assert stream._pull_into_buffer() is not pick
+    time.sleep(0.6)
+    # more samples than a single pull returns
+    data = np.arange(3000, dtype=np.float32)
+    outlet.push_chunk(np.tile(data, (2, 1)).T.copy())
+    time.sleep(0.7)
+    assert stream._inlet.samples_available == 0
+    assert stream.n_new_samples == 3000
+    data, _ = stream.get_data(winsize=30)
+    assert_allclose(data[-1], np.arange(3000))
+    stream.disconnect()
+
+
+def test_stream_drop_and_add_reference_channels():
+    """Test that the channels are not shifted after a drop and an added reference."""
+    name = f"pytest-ref-{uuid.uuid4().hex[:6]}"
+    sinfo = StreamInfo(name, "eeg", 3, 100, np.float32, "")
+    sinfo.set_channel_names(["a", "b", "c"])
+    outlet = StreamOutlet(sinfo)
+    stream = Stream(bufsize=1, name=name)
+    stream.connect(acquisition_delay=0.01)
+    stream.drop_channels("b")
+    stream.add_reference_channels("ref")
+    assert stream.ch_names == ["a", "c", "ref"]
+    # the first acquisition re-creates the ring, with as many channels as the inlet
+    # but not the layout of the inlet
+    for _ in range(2):
+        outlet.push_chunk(np.tile(np.array([1, 2, 3], dtype=np.float32), (10, 1)))
+        time.sleep(0.2)
+        assert stream._buffer.shape[1] == stream._inlet.n_channels
+        assert not stream._pull_into_buffer()
+    data, _ = stream.get_data(winsize=0.2)
+    assert_allclose(data, np.tile([[1], [3], [0]], (1, 20)))
+    stream.disconnect()
+
+
+def test_stream_disable_metrics_during_tick(monkeypatch):
+    """Test that the metrics can be disabled while a tick is in flight."""
+    name = f"pytest-metrics-{uuid.uuid4().hex[:6]}"
+    outlet = _create_outlet(name)  # noqa: F841
+    stream = Stream(bufsize=2, name=name)
+    stream.connect(acquisition_delay=100)  # the ticks are triggered manually
+    time.sleep(0.1)
+    stream.enable_metrics(size=16)
+    metrics = stream._metrics
+
+    def pull_samples(self):
+        self.disable_metrics()  # disabled by another thread during the tick
+        return 0
+
+    monkeypatch.setattr(Stream, "_pull_samples", pull_samples)
+    assert stream._pull_samples_with_metrics(metrics) == 0
+    assert stream._metrics is None
+    assert metrics.summary((50,))["n_ticks"] == 1
+    monkeypatch.undo()
+    stream.disconnect()
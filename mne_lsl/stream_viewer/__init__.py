@@ -1 +1,6 @@
-from .stream_viewer import StreamViewer  # noqa: F401
+from ..utils._imports import lazy_attach
+
+# the viewer is imported on first access, thus the engine can be used without Qt.
+__getattr__, __dir__, __all__ = lazy_attach(
+    __name__, {"StreamViewer": "stream_viewer", "ViewerEngine": "engine"}
+)
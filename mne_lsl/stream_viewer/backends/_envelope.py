@@ -0,0 +1,97 @@
+import math
+
+import numpy as np
+
+
+class _Envelope:
+    """Min/max envelope of the plotting window updated with the new samples only.
+
+    The samples are grouped in bins of a fixed number of samples, aligned on the number
+    of samples received, and each bin is stored as its minimum and maximum in a
+    persistent array of 2 points per bin, e.g. one bin per pixel of the plotting window.
+    The number of points to draw thus scales with the width of the window instead of the
+    number of samples, while the peaks remain visible. A chunk of new samples only
+    updates the bins it covers, the last bin being merged with the next chunk until it
+    is complete. The bins are stored in a ring, the oldest bin being overwritten by the
+    newest one.
+
+    Parameters
+    ----------
+    n_channels : int
+        Number of channels.
+    n_samples : int
+        Number of samples in the plotting window.
+    n_bins : int
+        Maximum number of bins.
+    """
+
+    def __init__(self, n_channels, n_samples, n_bins):
+        # the last bin is incomplete until it is filled, thus the ring holds the bins
+        # covering n_samples - 1 samples plus the last bin to cover the plotting window
+        # whatever the number of samples in the last bin.
+        self._bin_size = max(math.ceil((n_samples - 1) / max(n_bins - 1, 1)), 1)
+        self._n_bins = math.ceil((n_samples - 1) / self._bin_size) + 1
+        # (channels, bins, [min, max]), the bins not yet received are not drawn
+        self._data = np.full((n_channels, self._n_bins, 2), np.nan)
+        self._n_samples = 0
+
+    def update(self, data):
+        """Update the envelope with new samples of shape (channels, samples)."""
+        fill = self._n_samples % self._bin_size
+        if fill != 0 and data.shape[-1] != 0:
+            # merge the beginning of the chunk with the last incomplete bin
+            head = data[:, : self._bin_size - fill]
+            slot = self.last_slot
+            np.minimum(
+                self._data[:, slot, 0], head.min(axis=-1), out=self._data[:, slot, 0]
+            )
+            np.maximum(
+                self._data[:, slot, 1], head.max(axis=-1), out=self._data[:, slot, 1]
+            )
+            self._n_samples += head.shape[-1]
+            data = data[:, head.shape[-1] :]
+        if data.shape[-1] == 0:
+            return
+        # skip the complete bins which would be overwritten within the same chunk
+        skip = max(math.ceil(data.shape[-1] / self._bin_size) - self._n_bins, 0)
+        data = data[:, skip * self._bin_size :]
+        self._n_samples += skip * self._bin_size
+        starts = np.arange(0, data.shape[-1], self._bin_size)
+        slots = (self._n_samples // self._bin_size + np.arange(starts.size)) % (
+            self._n_bins
+        )
+        self._data[:, slots, 0] = np.minimum.reduceat(data, starts, axis=-1)
+        self._data[:, slots, 1] = np.maximum.reduceat(data, starts, axis=-1)
+        self._n_samples += data.shape[-1]
+
+    @property
+    def bin_size(self):
+        """Number of samples in a bin."""
+        return self._bin_size
+
+    @property
+    def n_bins(self):
+        """Number of bins."""
+        return self._n_bins
+
+    @property
+    def n_samples(self):
+        """Number of samples received."""
+        return self._n_samples
+
+    @property
+    def last_slot(self):
+        """Position in the ring of the last bin received."""
+        return (self._n_samples - 1) // self._bin_size % self._n_bins
+
+    @property
+    def last_fill(self):
+        """Number of samples in the last bin received."""
+        return (
+            self._n_samples - (self._n_samples - 1) // self._bin_size * self._bin_size
+        )
+
+    @property
+    def data(self):
+        """Envelope of shape (channels, bins, 2) stored in a ring of bins."""
+        return self._data
@@ -0,0 +1,64 @@
+import numpy as np
+
+_EVENT_DTYPE = np.dtype(
+    [("sample", np.int64), ("value", np.float64), ("label", np.int64)]
+)
+
+
+class _TriggerEvents:
+    """Trigger events stored in a structured array sorted by sample index.
+
+    The events are stored with the index of their sample since the start of the
+    acquisition, thus their position in the plotting window is derived from the number
+    of samples acquired instead of being shifted event by event at every update.
+    """
+
+    def __init__(self):
+        self._events = np.empty(0, dtype=_EVENT_DTYPE)
+
+    def add(self, samples, values, labels=-1):
+        """Add new events.
+
+        Parameters
+        ----------
+        samples : array of int
+            Index of the sample of each event.
+        values : array
+            Value of each event.
+        labels : int | array of int
+            Index of the text label of each event, -1 for the events labelled by their
+            value.
+        """
+        events = np.empty(len(samples), dtype=_EVENT_DTYPE)
+        events["sample"] = samples
+        events["value"] = values
+        events["label"] = labels
+        n_events = self._events.size
+        self._events = np.concatenate((self._events, events))
+        # the markers retrieved from another stream than the trigger channel might be
+        # older than the last events stored.
+        if n_events != 0 and np.any(
+            events["sample"] < self._events["sample"][n_events - 1]
+        ):
+            self._events = self._events[
+                np.argsort(self._events["sample"], kind="stable")
+            ]
+
+    def discard(self, sample):
+        """Discard the events before a sample."""
+        start = np.searchsorted(self._events["sample"], sample)
+        self._events = self._events[start:]
+
+    def window(self, start, stop):
+        """Get the events with a sample index in [start, stop[."""
+        start, stop = np.searchsorted(self._events["sample"], (start, stop))
+        return self._events[start:stop]
+
+    def __len__(self):
+        """Return the number of events stored."""
+        return self._events.size
+
+    @property
+    def events(self):
+        """Structured array of the events with the fields 'sample', 'value', 'label'."""
+        return self._events
@@ -0,0 +1,87 @@
+import numpy as np
+
+
+class _Frame:
+    """Frame of the display window, ready to be drawn.
+
+    Parameters
+    ----------
+    picks : list of int
+        Indices of the channels in the frame.
+    times : array of shape (n_points,)
+        Position of the points in the window in seconds, shared between frames.
+    freqs : array of shape (n_freqs,) | None
+        Frequencies of the spectrum in Hz, shared between frames. None if the spectrum
+        is not computed.
+    n_blocks : int
+        Number of blocks of the spectrogram.
+    """
+
+    def __init__(self, picks, times, freqs=None, n_blocks=0):
+        self.picks = picks
+        self.times = times
+        self.data = np.empty((len(picks), times.size))
+        # translation of the points along the time axis
+        self.position = 0.0
+        # number of samples acquired and timestamp of the last one
+        self.n_samples = 0
+        self.timestamp = None
+        # position in the window, value and text displayed of the trigger events
+        self.event_times = np.empty(0)
+        self.event_values = np.empty(0)
+        self.event_labels = list()
+        # power spectral density of each channel and of each block across channels
+        self.freqs = np.empty(0) if freqs is None else freqs
+        self.psd = np.full((len(picks), self.freqs.size), np.nan)
+        self.spectrogram = np.full((n_blocks, self.freqs.size), np.nan)
+
+
+class _TripleBuffer:
+    """Lock-free triple buffer exchanging frames between a producer and a consumer.
+
+    The producer writes in a frame which is neither the last published frame nor the
+    frame read by the consumer, and publishes it by storing its index. The consumer
+    acquires the last published frame and marks it as read. None of the threads waits
+    on the other, and a frame is never written while it is read. The indices are
+    exchanged with attribute assignments, which are atomic.
+
+    Parameters
+    ----------
+    frames : list of _Frame
+        The 3 frames exchanged.
+    """
+
+    def __init__(self, frames):
+        assert len(frames) == 3
+        self._frames = frames
+        self._back = 0
+        self._published = None
+        self._reading = None
+        self._n_published = 0
+        self._n_acquired = 0
+
+    def back(self):
+        """Get the frame in which the producer can write."""
+        published, reading = self._published, self._reading
+        self._back = next(k for k in range(3) if k != published and k != reading)
+        return self._frames[self._back]
+
+    def publish(self):
+        """Publish the frame written by the producer."""
+        self._published = self._back
+        self._n_published += 1
+
+    def acquire(self):
+        """Get the last published frame, or None if it was already acquired."""
+        while True:
+            n_published = self._n_published
+            if n_published == self._n_acquired:
+                return None
+            idx = self._published
+            self._reading = idx
+            # the producer might have published a new frame in the meantime, in which
+            # case it might be writing in the frame previously published.
+            if self._published == idx:
+                break
+        self._n_acquired = n_published
+        return self._frames[idx]
@@ -0,0 +1,120 @@
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy.signal import get_window
+
+
+class _Spectrum:
+    """Power spectral density computed from cached FFT blocks.
+
+    The signal is split in blocks of ``n_fft`` samples, starting every ``hop`` samples.
+    Each block is windowed with a Hann window and its power spectrum is cached in a ring
+    of blocks, thus the new samples are transformed once, when their block is complete,
+    instead of transforming the entire window at every update. The power spectral
+    density is the average of the cached blocks (Welch's method), updated with a running
+    sum, and the spectrogram is the average of each block across channels.
+
+    Parameters
+    ----------
+    n_channels : int
+        Number of channels.
+    sfreq : float
+        Sampling frequency in Hz.
+    n_fft : int
+        Number of samples of a block.
+    hop : int
+        Number of samples between the start of 2 consecutive blocks.
+    n_blocks : int
+        Number of blocks cached.
+    """
+
+    def __init__(self, n_channels, sfreq, n_fft, hop, n_blocks):
+        self._n_fft = n_fft
+        self._hop = hop
+        self._n_blocks = n_blocks
+        self._freqs = np.fft.rfftfreq(n_fft, 1 / sfreq)
+        self._window = get_window("hann", n_fft)
+        # scaling to a one-sided density, the DC and Nyquist components being unique
+        self._scale = np.full(self._freqs.size, 2 / (sfreq * (self._window**2).sum()))
+        self._scale[0] /= 2
+        if n_fft % 2 == 0:
+            self._scale[-1] /= 2
+        # ring of the power spectrum of each block
+        self._blocks = np.zeros((n_blocks, n_channels, self._freqs.size))
+        self._spectrogram = np.full((n_blocks, self._freqs.size), np.nan)
+        self._sum = np.zeros((n_channels, self._freqs.size))
+        self._idx = 0  # slot of the next block
+        self._n_computed = 0  # number of blocks computed
+        self._n_writes = 0  # number of blocks added to the sum since the last reset
+        # samples of the next blocks, not yet transformed
+        self._pending = np.empty((n_channels, 0))
+
+    def update(self, data):
+        """Update the spectrum with new samples.
+
+        Parameters
+        ----------
+        data : array of shape (n_channels, n_samples)
+            New samples.
+        """
+        data = np.concatenate((self._pending, data), axis=-1)
+        n_new = (data.shape[-1] - self._n_fft) // self._hop + 1
+        if n_new <= 0:
+            self._pending = data
+            return
+        # only the blocks which are not overwritten in the same update are computed
+        n_skip = max(n_new - self._n_blocks, 0)
+        blocks = sliding_window_view(data, self._n_fft, axis=-1)[
+            :, n_skip * self._hop : n_new * self._hop : self._hop
+        ]  # (n_channels, n_blocks, n_fft)
+        # all the channels and blocks are transformed at once
+        power = np.abs(np.fft.rfft(blocks * self._window, axis=-1)) ** 2
+        power *= self._scale
+        self._pending = data[:, n_new * self._hop :]
+        self._write(power.transpose(1, 0, 2))
+
+    def _write(self, power):
+        """Write the power spectrum of new blocks in the ring and update the sum."""
+        slots = (self._idx + np.arange(power.shape[0])) % self._n_blocks
+        # the slots not yet computed are set to zero
+        self._sum -= self._blocks[slots].sum(axis=0)
+        self._blocks[slots] = power
+        self._spectrogram[slots] = power.mean(axis=1)
+        self._sum += power.sum(axis=0)
+        self._idx = (self._idx + power.shape[0]) % self._n_blocks
+        self._n_computed += power.shape[0]
+        self._n_writes += power.shape[0]
+        # the running sum accumulates rounding errors, thus it is recomputed once per
+        # ring of blocks.
+        if self._n_blocks <= self._n_writes:
+            self._sum = self._blocks.sum(axis=0)
+            self._n_writes = 0
+
+    @property
+    def freqs(self):
+        """Frequencies of the spectrum in Hz."""
+        return self._freqs
+
+    @property
+    def n_blocks(self):
+        """Number of blocks cached."""
+        return self._n_blocks
+
+    @property
+    def psd(self):
+        """Power spectral density averaged over the blocks cached, (channels, freqs).
+
+        The power spectral density is NaN until the first block is complete.
+        """
+        n_blocks = min(self._n_computed, self._n_blocks)
+        if n_blocks == 0:
+            return np.full(self._sum.shape, np.nan)
+        return self._sum / n_blocks
+
+    @property
+    def spectrogram(self):
+        """Power spectral density of each block in chronological order, (blocks, freqs).
+
+        The power spectral density of a block is averaged across channels, and the
+        blocks not yet computed are set to NaN.
+        """
+        return np.roll(self._spectrogram, -self._idx, axis=0)
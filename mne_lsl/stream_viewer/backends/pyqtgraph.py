@@ -1,26 +1,42 @@
 """PyQt5 Canvas for MNE-LSL's StreamViewer."""
 
+import time
+
 import numpy as np
 import pyqtgraph as pg
-from qtpy import QtCore
+from qtpy import QtCore, QtGui
 
+from ...lsl import local_clock
 from ...utils._docs import copy_doc, fill_doc
 from ...utils.logs import logger
-from ._backend import _Backend, _Event
+from ..engine import _EngineLoop
+from ._backend import _Backend
 
 # pg.setConfigOptions(antialias=True)
 
+# the interval between 2 updates is adapted to the time spent drawing the plot, to
+# leave the GUI thread responsive. The minimum interval is configurable.
+_REFRESH_INTERVAL_MIN = 20  # ms
+_REFRESH_INTERVAL_MAX = 200  # ms
+_REFRESH_INTERVAL_RATIO = 2
+_FFT_WINDOW = 1  # seconds
+_HOP = 0.25  # seconds
+
 
 @fill_doc
 class _BackendPyQtGraph(_Backend):
     """PyQtGraph backend for MNE-LSL's StreamViewer.
 
+    The frames of each engine are drawn in a pane, the panes being stacked in the same
+    window and sharing the x-axis. In scroll mode, the panes are aligned on the LSL
+    timestamp of the most recent sample acquired across the engines.
+
     Parameters
     ----------
-    scope : Scope
-        Scope connected to a StreamInlet acquiring the data and applying
-        filtering. The scope has a buffer of _BUFFER_DURATION seconds
-        (default: 30s
+    engines : list of ViewerEngine
+        Engines producing the frames displayed from the signal acquired and filtered
+        by their scope, one per pane. The scopes have a buffer of _BUFFER_DURATION
+        seconds (default: 30s).
     geometry : tuple | list
         Window geometry as (pos_x, pos_y, size_x, size_y).
     xRange : int
@@ -30,163 +46,262 @@ class _BackendPyQtGraph(_Backend):
     """
 
     # ---------------------------- Init ---------------------------
-    def __init__(self, scope, geometry, xRange, yRange):
-        super().__init__(scope, geometry, xRange, yRange)
-        self._trigger_events = list()
-
-        # Variables
-        self._available_colors = np.random.uniform(
-            size=(self._scope.nb_channels, 3), low=128, high=230
-        )
-        self._init_variables()
+    def __init__(self, engines, geometry, xRange, yRange):
+        super().__init__(engines, geometry, xRange, yRange)
+        self._refresh_interval = _REFRESH_INTERVAL_MIN
+        self._min_refresh_interval = _REFRESH_INTERVAL_MIN
+        self._frame_time = None
+        self._lag = None
+        # the signals are acquired, filtered and decimated outside of the GUI thread,
+        # by a single loop updating all the engines
+        for engine, selected_channels in zip(self._engines, self._selected_channels):
+            engine.duration = self._xRange
+            engine.picks = selected_channels
+            engine.frame_rate = 1000 / self._refresh_interval
+        self._loop = _EngineLoop(self._engines)
+        self._show_spectrum = False
+        self._fft_window = _FFT_WINDOW
+        self._hop = _HOP
+        self._spectrum_win = None
 
         # Canvas
+        self._geometry = geometry
+        title = ", ".join(scope.stream_name for scope in self._scopes)
         self._win = pg.GraphicsLayoutWidget(
-            size=geometry[2:],
-            title=f"Stream Viewer: {self._scope.stream_name}",
+            size=geometry[2:], title=f"Stream Viewer: {title}"
         )
         self._win.show()
-        self._plot_handler = self._win.addPlot()  # pyqtgraph.PlotItem
-
-        subsampling_ratio = int(self._scope.sample_rate / 64)
-        if subsampling_ratio != 0:
-            self._plot_handler.setDownsampling(
-                ds=subsampling_ratio, auto=None, mode="mean"
-            )
-        self._plot_handler.setMouseEnabled(x=False, y=False)
-        self._plot_handler.setMenuEnabled(False)
+        self._panes = list()
+        for k, engine in enumerate(self._engines):
+            if k != 0:
+                self._win.nextRow()
+            plot_handler = self._win.addPlot()  # pyqtgraph.PlotItem
+            plot_handler.setMouseEnabled(x=False, y=False)
+            plot_handler.setMenuEnabled(False)
+            if k != 0:
+                plot_handler.setXLink(self._panes[0].plot_handler)
+            self._panes.append(_Pane(engine, plot_handler))
         self._init_canvas()
-
-        # Plots
-        self._plot_handler.clear()
-        self._plots = dict()
-        # Add PlotDataItem
-        for k, idx in enumerate(self._scope.selected_channels):
-            self._plots[idx] = self._plot_handler.plot(
-                x=self._x_arr,
-                y=self._scope.data_buffer[idx, -self._duration_plot_samples :]
-                + self._offset[k],
-                pen=pg.mkColor(self._available_colors[idx, :]),
-            )
+        for pane in self._panes:
+            pane.resize()
 
         # Timer
         self._timer = QtCore.QTimer(self._win)
         self._timer.timeout.connect(self._update_loop)
 
-    @copy_doc(_Backend._init_variables)
-    def _init_variables(self):
-        super()._init_variables()
-
-        # yRange
-        self._offset = np.arange(
-            0,
-            -len(self._scope.selected_channels) * self._yRange,
-            -self._yRange,
-        )
-
-        logger.debug("Initialization of variables from _BackendPyQtGraph complete.")
-
     def _init_canvas(self):
         """Initialize the drawing canvas."""
         logger.debug("Initialization of canvas..")
 
-        # Ranges
-        self._plot_handler.disableAutoRange()
-        yRange = [
-            1.5 * self._yRange,
-            -self._yRange * (len(self._scope.selected_channels) + 1),
-        ]
-        self._plot_handler.setRange(xRange=[0, self._xRange], yRange=yRange)
-        self._plot_handler.showGrid(y=True)
-
-        # Y-axis
-        yticks = [
-            (-k * self._yRange, self._scope.channels_labels[idx])
-            for k, idx in enumerate(self._scope.selected_channels)
-        ]
-        ticks = [yticks, []]  # [major, minor]
-        self._plot_handler.getAxis("left").setTicks(ticks)
-        self._plot_handler.setLabel(axis="left", text=f"Scale (uV): {self._yRange}")
+        for pane, selected_channels in zip(self._panes, self._selected_channels):
+            scope = pane.engine.scope
+            # Ranges
+            pane.plot_handler.disableAutoRange()
+            yRange = [1.5 * self._yRange, -self._yRange * (len(selected_channels) + 1)]
+            pane.plot_handler.setRange(xRange=[0, self._xRange], yRange=yRange)
+            pane.plot_handler.showGrid(y=True)
+
+            # Y-axis
+            yticks = [
+                (-k * self._yRange, scope.channels_labels[idx])
+                for k, idx in enumerate(selected_channels)
+            ]
+            ticks = [yticks, []]  # [major, minor]
+            pane.plot_handler.getAxis("left").setTicks(ticks)
+            pane.plot_handler.setLabel(axis="left", text=f"Scale (uV): {self._yRange}")
+            if 1 < len(self._panes):
+                pane.plot_handler.setTitle(scope.stream_name)
 
         # X-axis
-        self._x_arr = np.arange(self._duration_plot_samples) / self._scope.sample_rate
-        self._plot_handler.setLabel(axis="bottom", text="Time (s)")
+        self._panes[-1].plot_handler.setLabel(axis="bottom", text="Time (s)")
 
         logger.debug("Initialization of canvas complete.")
 
-    # ------------------------ Trigger Events ----------------------
-    @copy_doc(_Backend._update_LPT_trigger_events)
-    def _update_LPT_trigger_events(self, trigger_arr):
-        events_trigger_arr_idx = np.where(trigger_arr != 0)[0]
-        events_values = trigger_arr[events_trigger_arr_idx]
-
-        for k, event_value in enumerate(events_values):
-            position_buffer = (
-                self._scope.duration_buffer
-                - (trigger_arr.shape[0] - events_trigger_arr_idx[k])
-                / self._scope.sample_rate
-            )
-            position_plot = position_buffer - self._delta_with_buffer
-
-            event = _TriggerEvent(
-                event_type="LPT",
-                event_value=event_value,
-                position_buffer=position_buffer,
-                position_plot=position_plot,
-                plot_handler=self._plot_handler,
-                yRange=self._yRange,
+    def _draw(self, pane, frame):
+        """Draw a frame produced by the engine of a pane.
+
+        The channels are offset along the y-axis in a buffer reused between frames.
+        """
+        pane.frame = frame
+        if pane.y.shape != frame.data.shape:
+            pane.y = np.empty(frame.data.shape)
+        offset = np.arange(len(frame.picks)) * -self._yRange
+        np.add(frame.data, offset[:, np.newaxis], out=pane.y)
+        pane.curves.setData(
+            frame.times, pane.y, [pane.pens[idx] for idx in frame.picks]
+        )
+        if self._show_LPT_trigger_events:
+            pane.events.setData(
+                frame.event_times,
+                frame.event_labels,
+                -self._yRange * (len(frame.picks) + 1),
+                1.5 * self._yRange,
             )
+        else:
+            pane.events.setData(np.empty(0), list())
+        if pane.psd_curves is not None and frame.freqs.size != 0:
+            self._draw_spectrum(pane, frame)
+
+    def _draw_spectrum(self, pane, frame):
+        """Draw the power spectral density and the spectrogram of a frame in dB."""
+        if pane.psd_db.shape != frame.psd.shape:
+            pane.psd_db = np.empty(frame.psd.shape)
+        if pane.spectrogram_db.shape != frame.spectrogram.shape:
+            pane.spectrogram_db = np.empty(frame.spectrogram.shape)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            np.log10(frame.psd, out=pane.psd_db)
+            np.log10(frame.spectrogram, out=pane.spectrogram_db)
+        pane.psd_db *= 10
+        pane.spectrogram_db *= 10
+        pane.psd_curves.setData(
+            frame.freqs, pane.psd_db, [pane.pens[idx] for idx in frame.picks]
+        )
+        finite = np.isfinite(pane.spectrogram_db)
+        if not finite.any():
+            return
+        levels = (pane.spectrogram_db[finite].min(), pane.spectrogram_db[finite].max())
+        pane.spectrogram_db[~finite] = levels[0]
+        pane.spectrogram_image.setImage(
+            pane.spectrogram_db, autoLevels=False, levels=levels
+        )
+        pane.spectrogram_image.setRect(
+            QtCore.QRectF(0, 0, self._xRange, float(frame.freqs[-1]))
+        )
 
-            if position_plot >= 0:
-                if event.event_type == "LPT" and self._show_LPT_trigger_events:
-                    event.addEventPlot()
-
-            self._trigger_events.append(event)
-
-    @copy_doc(_Backend._clean_up_trigger_events)
-    def _clean_up_trigger_events(self):
-        """Hide events exiting the plotting window."""
-        super()._clean_up_trigger_events()
-        for event in self._trigger_events:
-            if event.position_plot < 0:
-                event.removeEventPlot()
+    def _open_spectrum(self):
+        """Open the window displaying the spectrum of each stream."""
+        title = ", ".join(scope.stream_name for scope in self._scopes)
+        self._spectrum_win = pg.GraphicsLayoutWidget(
+            size=self._geometry[2:], title=f"Spectrum: {title}"
+        )
+        self._spectrum_win.show()
+        for k, pane in enumerate(self._panes):
+            if k != 0:
+                self._spectrum_win.nextRow()
+            pane.add_spectrum(self._spectrum_win, self._xRange)
+
+    def _close_spectrum(self):
+        """Close the window displaying the spectrum of each stream."""
+        if self._spectrum_win is None:
+            return
+        for pane in self._panes:
+            pane.remove_spectrum()
+        self._spectrum_win.close()
+        self._spectrum_win = None
+
+    def _set_spectrum(self):
+        """Request the spectrum matching the FFT window and the hop to the engines."""
+        for engine in self._engines:
+            if not self._show_spectrum:
+                engine.n_fft = None
+                continue
+            n_fft = max(round(self._fft_window * engine.scope.sample_rate), 2)
+            hop = min(max(round(self._hop * engine.scope.sample_rate), 1), n_fft)
+            engine.hop = None
+            engine.n_fft = n_fft
+            engine.hop = hop
+
+    def _align(self):
+        """Align the panes on the LSL timestamp of the most recent sample acquired.
+
+        In scroll mode, the frames of a stream lagging behind the most recent stream are
+        translated to the left by the lag. In sweep mode, each pane sweeps its own
+        samples.
+        """
+        frames = [pane.frame for pane in self._panes if pane.frame is not None]
+        timestamps = [
+            frame.timestamp for frame in frames if frame.timestamp is not None
+        ]
+        reference = max(timestamps) if len(timestamps) != 0 else None
+        for pane in self._panes:
+            if pane.frame is None:
+                continue
+            shift = 0.0
+            if (
+                reference is not None
+                and pane.frame.timestamp is not None
+                and pane.engine.mode == "scroll"
+            ):
+                shift = pane.frame.timestamp - reference
+            pane.curves.setPos(pane.frame.position + shift, 0)
+            pane.events.setPos(shift, 0)
 
     # -------------------------- Main Loop -------------------------
     @copy_doc(_Backend.start_timer)
     def start_timer(self):
-        logger.debug("Update 20 ms timer start requested..")
-        self._timer.start(20)
-        logger.debug("Update 20 ms timer has started.")
+        logger.debug("Update %i ms timer start requested..", self._refresh_interval)
+        self._loop.start()
+        self._timer.start(self._refresh_interval)
+        logger.debug("Update %i ms timer has started.", self._refresh_interval)
 
     @copy_doc(_Backend._update_loop)
     def _update_loop(self):
-        super()._update_loop()
-
-        if len(self._scope.ts_list) > 0:
-            for k, idx in enumerate(self._scope.selected_channels):
-                self._plots[idx].setData(
-                    x=self._x_arr,
-                    y=self._scope.data_buffer[idx, -self._duration_plot_samples :]
-                    + self._offset[k],
-                )
-
-            # Update existing events position
-            for event in self._trigger_events:
-                event.position_buffer = (
-                    event.position_buffer
-                    - len(self._scope.ts_list) / self._scope.sample_rate
-                )
-            # Add new events entering the buffer
-            self._update_LPT_trigger_events(
-                self._scope.trigger_buffer[-len(self._scope.ts_list) :]
-            )
-            # Hide/Remove events exiting window and buffer
-            self._clean_up_trigger_events()
+        start = time.perf_counter()
+        drawn = False
+        for pane in self._panes:
+            if pane.n_pixels != pane.width():
+                pane.resize()  # the window was resized
+            frame = pane.engine._acquire_frame()
+            if frame is not None:
+                self._draw(pane, frame)
+                drawn = True
+        if not drawn:
+            return
+        self._align()
+        timestamps = [
+            pane.frame.timestamp
+            for pane in self._panes
+            if pane.frame is not None and pane.frame.timestamp is not None
+        ]
+        if len(timestamps) != 0:
+            # the dejittered timestamps can be slightly ahead of the local clock
+            self._lag = max(local_clock() - min(timestamps), 0.0)
+        paint_time = sum(pane.curves.paint_time for pane in self._panes)
+        self._adapt_refresh_interval(time.perf_counter() - start + paint_time)
+
+    def _adapt_refresh_interval(self, frame_time):
+        """Adapt the interval between 2 updates to the measured frame time.
+
+        Parameters
+        ----------
+        frame_time : float
+            Time spent to update and to draw the last frame in seconds. The frame time
+            is smoothed with an exponential moving average.
+        """
+        if self._frame_time is None:
+            self._frame_time = frame_time
+        else:
+            self._frame_time += 0.1 * (frame_time - self._frame_time)
+        self._set_refresh_interval(
+            round(_REFRESH_INTERVAL_RATIO * self._frame_time * 1000)
+        )
+
+    def _set_refresh_interval(self, interval):
+        """Set the interval between 2 updates, bounded by the minimum interval."""
+        interval = min(
+            max(interval, self._min_refresh_interval),
+            max(_REFRESH_INTERVAL_MAX, self._min_refresh_interval),
+        )
+        if interval != self._refresh_interval:
+            self._refresh_interval = interval
+            self._timer.setInterval(interval)
+            for engine in self._engines:
+                engine.frame_rate = 1000 / interval
+            logger.debug("Update timer interval set to %i ms.", interval)
+
+    def _redraw(self):
+        """Redraw the last frames drawn."""
+        for pane in self._panes:
+            if pane.frame is not None:
+                self._draw(pane, pane.frame)
+        self._align()
 
     # --------------------------- Events ---------------------------
     @copy_doc(_Backend.close)
     def close(self):
         self._timer.stop()
+        self._loop.stop()
+        self._close_spectrum()
         self._win.close()
 
     # ------------------------ Update program ----------------------
@@ -194,182 +309,335 @@ class _BackendPyQtGraph(_Backend):
     @copy_doc(_Backend.xRange.setter)
     def xRange(self, xRange):
         self._xRange = xRange
-        self._init_variables()
+        for engine in self._engines:
+            engine.duration = xRange
         self._init_canvas()
-
-        for event in self._trigger_events:
-            event.position_plot = event.position_buffer - self._delta_with_buffer
-            if event.position_plot >= 0:
-                if event.event_type == "LPT" and self._show_LPT_trigger_events:
-                    event.addEventPlot()
-            else:
-                event.removeEventPlot()
+        for pane in self._panes:
+            if pane.spectrogram_plot is not None:
+                pane.spectrogram_plot.setXRange(0, xRange)
 
     @_Backend.yRange.setter
     @copy_doc(_Backend.yRange.setter)
     def yRange(self, yRange):
         self._yRange = yRange
-        self._init_variables()
         self._init_canvas()
-
-        for event in self._trigger_events:
-            event.yRange = self._yRange
+        self._redraw()
 
     @_Backend.selected_channels.setter
     @copy_doc(_Backend.selected_channels.setter)
     def selected_channels(self, selected_channels):
-        plots2remove = [
-            idx for idx in self._selected_channels if idx not in selected_channels
-        ]
-        plots2add = [
-            idx for idx in selected_channels if idx not in self._selected_channels
-        ]
         self._selected_channels = selected_channels
-        self._init_variables()
+        for engine, picks in zip(self._engines, selected_channels):
+            engine.picks = picks
         self._init_canvas()
 
-        for idx in plots2remove:
-            self._plot_handler.removeItem(self._plots[idx])
-            del self._plots[idx]
-        for k, idx in enumerate(plots2add):
-            self._plots[idx] = self._plot_handler.plot(
-                x=self._x_arr,
-                y=self._scope.data_buffer[idx, -self._duration_plot_samples :]
-                + self._offset[k],
-                pen=pg.mkColor(self._available_colors[idx, :]),
-            )
-
     @_Backend.show_LPT_trigger_events.setter
     @copy_doc(_Backend.show_LPT_trigger_events.setter)
     def show_LPT_trigger_events(self, show_LPT_trigger_events):
         self._show_LPT_trigger_events = show_LPT_trigger_events
-        for event in self._trigger_events:
-            if event.position_plot >= 0 and event.event_type == "LPT":
-                if self._show_LPT_trigger_events:
-                    event.addEventPlot()
-                else:
-                    event.removeEventPlot()
+        self._redraw()
 
+    @property
+    def mode(self):
+        """Display mode, 'scroll' or 'sweep'.
 
-@fill_doc
-class _TriggerEvent(_Event):
-    """Class defining a trigger event for the pyqtgraph backend.
+        In scroll mode, the signal scrolls from right to left, the newest samples being
+        on the right. In sweep mode, the newest samples are drawn from left to right
+        over the oldest ones, like on EEG paper.
+        """
+        return self._engines[0].mode
+
+    @mode.setter
+    def mode(self, mode):
+        for engine in self._engines:
+            engine.mode = mode
+
+    @property
+    def refresh_interval(self):
+        """Interval between 2 updates in ms, adapted to the time spent drawing."""
+        return self._refresh_interval
+
+    @property
+    def min_refresh_interval(self):
+        """Minimum interval between 2 updates in ms.
+
+        The engines acquire and process the new samples at the same cadence, and the
+        interval is increased above the minimum if drawing the frames takes longer.
+        """
+        return self._min_refresh_interval
+
+    @min_refresh_interval.setter
+    def min_refresh_interval(self, min_refresh_interval):
+        self._min_refresh_interval = max(int(min_refresh_interval), 1)
+        self._set_refresh_interval(self._refresh_interval)
+
+    @property
+    def lag(self):
+        """Delay in seconds between the last sample drawn and the local clock.
+
+        The lag is measured against :func:`~mne_lsl.lsl.local_clock` on the pane
+        lagging the most when the frames are drawn, and is None until a frame with
+        samples is drawn. The timestamps of the streams must be corrected to the local
+        clock, e.g. with the ``'clocksync'`` processing flag.
+        """
+        return self._lag
+
+    @property
+    def show_spectrum(self):
+        """Tick/Untick status of the spectrum, displayed in a separate window.
+
+        The power spectral density of each channel and the spectrogram averaged across
+        channels are computed by the engines from FFT blocks of ``fft_window``
+        seconds, starting every ``hop`` seconds.
+        """
+        return self._show_spectrum
+
+    @show_spectrum.setter
+    def show_spectrum(self, show_spectrum):
+        self._show_spectrum = show_spectrum
+        if show_spectrum and self._spectrum_win is None:
+            self._open_spectrum()
+        elif not show_spectrum:
+            self._close_spectrum()
+        self._set_spectrum()
+
+    @property
+    def fft_window(self):
+        """Duration of the FFT blocks in seconds."""
+        return self._fft_window
+
+    @fft_window.setter
+    def fft_window(self, fft_window):
+        self._fft_window = fft_window
+        self._set_spectrum()
+
+    @property
+    def hop(self):
+        """Duration between the start of 2 consecutive FFT blocks in seconds."""
+        return self._hop
+
+    @hop.setter
+    def hop(self, hop):
+        self._hop = hop
+        self._set_spectrum()
+
+
+class _Pane:
+    """Plot drawing the frames produced by an engine.
 
     Parameters
     ----------
-    event_type : str
-        Type of event. Supported: 'LPT'.
-    event_value : int
-        Value of the event.
-    position_buffer : float
-        Time (seconds) at which the event is positioned in the buffer where:
-            0 represents the older events exiting the buffer.
-            _BUFFER_DURATION represents the newer events entering the
-            buffer.
-    position_plot : float
-        Time (seconds) at which the event is positioned in the plotting window
-        where:
-            0 represents the older events exiting the window.
-            xRange represents the newer events entering the window.
-    plot_handler : pyqtgraph.PlotItem
-        Plot handler.
-    yRange : int | float
-        Currently set signal range/scale.
+    engine : ViewerEngine
+        Engine producing the frames drawn.
+    plot_handler : PlotItem
+        Plot in which the frames are drawn.
     """
 
-    colors = {"LPT": pg.mkColor(0, 255, 0)}
-
-    def __init__(
-        self,
-        event_type,
-        event_value,
-        position_buffer,
-        position_plot,
-        plot_handler,
-        yRange,
-    ):
-        super().__init__(event_type, event_value, position_buffer, position_plot)
-        self._plot_handler = plot_handler
-        self._yRange = yRange
+    def __init__(self, engine, plot_handler):
+        self.engine = engine
+        self.plot_handler = plot_handler
+        # all the selected channels are drawn by a single item
+        self.curves = _MultiCurveItem()
+        self.plot_handler.addItem(self.curves)
+        colors = np.random.uniform(
+            size=(engine.scope.nb_channels, 3), low=128, high=230
+        )
+        self.pens = [pg.mkPen(pg.mkColor(color)) for color in colors]
+        self.events = _EventsItem(pg.mkColor(0, 255, 0))
+        self.plot_handler.addItem(self.events)
+        self.frame = None  # last frame drawn
+        self.y = np.empty((0, 0))
+        self.n_pixels = 0
+        # spectrum, drawn in a separate window
+        self.psd_plot = None
+        self.psd_curves = None
+        self.spectrogram_plot = None
+        self.spectrogram_image = None
+        self.psd_db = np.empty((0, 0))
+        self.spectrogram_db = np.empty((0, 0))
+
+    def add_spectrum(self, win, xRange):
+        """Add the plots of the power spectral density and of the spectrogram.
+
+        Parameters
+        ----------
+        win : GraphicsLayoutWidget
+            Window in which the plots are added, on the current row.
+        xRange : float
+            Duration of the spectrogram in seconds.
+        """
+        name = self.engine.scope.stream_name
+        self.psd_plot = win.addPlot(title=f"{name}: PSD")
+        self.psd_plot.setMenuEnabled(False)
+        self.psd_plot.showGrid(x=True, y=True)
+        self.psd_plot.setLabel(axis="left", text="Power (dB)")
+        self.psd_plot.setLabel(axis="bottom", text="Frequency (Hz)")
+        self.psd_curves = _MultiCurveItem()
+        self.psd_plot.addItem(self.psd_curves)
+        self.spectrogram_plot = win.addPlot(title=f"{name}: spectrogram")
+        self.spectrogram_plot.setMouseEnabled(x=False, y=False)
+        self.spectrogram_plot.setMenuEnabled(False)
+        self.spectrogram_plot.setLabel(axis="left", text="Frequency (Hz)")
+        self.spectrogram_plot.setLabel(axis="bottom", text="Time (s)")
+        self.spectrogram_plot.setXRange(0, xRange, padding=0)
+        self.spectrogram_image = pg.ImageItem()
+        self.spectrogram_image.setLookupTable(
+            pg.colormap.get("viridis").getLookupTable()
+        )
+        self.spectrogram_plot.addItem(self.spectrogram_image)
 
-        self._lineItem = None
-        self._textItem = None
-        self._plotted = False
+    def remove_spectrum(self):
+        """Remove the plots of the power spectral density and of the spectrogram."""
+        self.psd_plot = None
+        self.psd_curves = None
+        self.spectrogram_plot = None
+        self.spectrogram_image = None
+
+    def width(self):
+        """Width of the plot in pixels."""
+        return max(int(self.plot_handler.getViewBox().width()), 1)
+
+    def resize(self):
+        """Request frames matching the width of the plot to the engine.
+
+        The envelope has 1 bin per pixel of the plot, thus the number of points drawn
+        does not depend on the sampling rate nor on the duration of the window.
+        """
+        self.n_pixels = self.width()
+        self.engine.n_points = self.n_pixels
 
-    def addEventPlot(self):
-        """Plot the event on the handler."""
-        if not self._plotted:
-            self._lineItem = pg.InfiniteLine(
-                pos=self._position_plot, pen=self.colors[self._event_type]
-            )
-            self._plot_handler.addItem(self._lineItem)
 
-            self._textItem = pg.TextItem(
-                str(self._event_value),
-                anchor=(0.5, 0.5),
-                fill=(0, 0, 0),
-                color=self.colors[self._event_type],
+class _MultiCurveItem(pg.GraphicsObject):
+    """Item drawing several curves sharing the same x-axis.
+
+    A single item is added to the scene for all the channels, thus the scene does not
+    need to process one item per channel at every update.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._paths = list()
+        self._pens = list()
+        self._bounds = QtCore.QRectF()
+        self._paint_time = 0.0
+
+    def setData(self, x, y, pens):
+        """Set the curves to draw.
+
+        Parameters
+        ----------
+        x : array of shape (n_points,)
+            Position of the points on the x-axis.
+        y : array of shape (n_curves, n_points)
+            Position of the points on the y-axis. The non-finite points are not drawn.
+        pens : list of QPen
+            Pen of each curve.
+        """
+        self.prepareGeometryChange()
+        self._paths = [pg.arrayToQPath(x, y_, connect="finite") for y_ in y]
+        self._pens = pens
+        finite = np.isfinite(y)
+        if finite.any():
+            ymin, ymax = float(y[finite].min()), float(y[finite].max())
+            self._bounds = QtCore.QRectF(
+                float(x[0]), ymin, float(x[-1] - x[0]), ymax - ymin
             )
-            self._textItem.setPos(self._position_plot, 1.5 * self._yRange)
-            self._plot_handler.addItem(self._textItem)
-            self._plotted = True
-
-    def removeEventPlot(self):
-        """Remove the event from the plot handler."""
-        if self._plotted:
-            self._plot_handler.removeItem(self._lineItem)
-            self._plot_handler.removeItem(self._textItem)
-            self._lineItem = None
-            self._textItem = None
-            self._plotted = False
-
-    def _update(self):
-        """Update the plot handler."""
-        if self._lineItem is not None:
-            self._lineItem.setValue(self._position_plot)
-        if self._textItem is not None:
-            self._textItem.setPos(self._position_plot, 1.5 * self._yRange)
-
-    def __del__(self):
-        try:
-            self.removeEventPlot()
-        except Exception:
-            pass
+        else:
+            self._bounds = QtCore.QRectF()
+        self.update()
+
+    def boundingRect(self):
+        """Bounding rectangle of the curves."""
+        return self._bounds
+
+    def paint(self, painter, *args):
+        """Draw each curve with its pen."""
+        start = time.perf_counter()
+        for path, pen in zip(self._paths, self._pens):
+            painter.setPen(pen)
+            painter.drawPath(path)
+        self._paint_time = time.perf_counter() - start
 
     @property
-    @copy_doc(_Event.event_type)
-    def event_type(self):
-        return self._event_type
+    def paint_time(self):
+        """Time spent drawing the curves the last time they were painted (s)."""
+        return self._paint_time
 
-    @property
-    @copy_doc(_Event.event_value)
-    def event_value(self):
-        return self._event_value
-
-    @_Event.position_buffer.setter
-    @copy_doc(_Event.position_buffer.setter)
-    def position_buffer(self, position_buffer):
-        _Event.position_buffer.__set__(self, position_buffer)
-        self._update()
-
-    @_Event.position_plot.setter
-    @copy_doc(_Event.position_plot.setter)
-    def position_plot(self, position_plot):
-        _Event.position_plot.__set__(self, position_plot)
-        self._update()
 
-    @property
-    def plotted(self):
-        """True if the event is displayed, else False."""
-        return self._plotted
+class _EventsItem(pg.GraphicsObject):
+    """Item drawing the trigger events as vertical lines labelled with a text.
 
-    @property
-    def yRange(self):
-        """Signal range/scale used to position the TextItem."""
-        return self._yRange
+    A single item is added to the scene for all the events, and the lines are drawn as
+    a single path.
 
-    @yRange.setter
-    def yRange(self, yRange):
-        """Impacts the position of the TextItem."""
-        self._yRange = yRange
-        self._update()
+    Parameters
+    ----------
+    color : QColor
+        Color of the lines and of the labels.
+    """
+
+    def __init__(self, color):
+        super().__init__()
+        self._pen = pg.mkPen(color)
+        self._x = np.empty(0)
+        self._labels = list()
+        self._path = QtGui.QPainterPath()
+        self._ylabel = 0.0
+        self._bounds = QtCore.QRectF()
+
+    def setData(self, x, labels, ymin=0.0, ymax=0.0):
+        """Set the events to draw.
+
+        Parameters
+        ----------
+        x : array of shape (n_events,)
+            Position of the events on the x-axis.
+        labels : list of str
+            Text displayed on each event.
+        ymin : float
+            Position of the bottom of the lines on the y-axis.
+        ymax : float
+            Position of the top of the lines and of the labels on the y-axis.
+        """
+        self.prepareGeometryChange()
+        self._x = x
+        self._labels = labels
+        self._ylabel = ymax
+        self._path = pg.arrayToQPath(
+            np.repeat(x, 2), np.tile([ymin, ymax], x.size), connect="pairs"
+        )
+        if x.size == 0:
+            self._bounds = QtCore.QRectF()
+        else:
+            # leave room for the labels, centered on the lines
+            margin = 50 * (self.pixelWidth() or 0)
+            self._bounds = QtCore.QRectF(
+                float(x.min()) - margin,
+                ymin,
+                float(x.max() - x.min()) + 2 * margin,
+                ymax - ymin,
+            )
+        self.update()
+
+    def boundingRect(self):
+        """Bounding rectangle of the events."""
+        return self._bounds
+
+    def paint(self, painter, *args):
+        """Draw the lines and the labels of the events."""
+        painter.setPen(self._pen)
+        painter.drawPath(self._path)
+        # the labels are drawn in device coordinates to be unaffected by the scaling
+        transform = painter.transform()
+        painter.save()
+        painter.resetTransform()
+        for x, label in zip(self._x, self._labels):
+            pos = transform.map(QtCore.QPointF(x, self._ylabel))
+            rect = painter.boundingRect(
+                QtCore.QRectF(pos.x() - 50, pos.y() - 10, 100, 20),
+                QtCore.Qt.AlignCenter,
+                label,
+            )
+            painter.fillRect(rect, QtGui.QColor(0, 0, 0))
+            painter.drawText(rect, QtCore.Qt.AlignCenter, label)
+        painter.restore()
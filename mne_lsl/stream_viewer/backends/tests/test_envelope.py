@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from mne_lsl.stream_viewer.backends._envelope import _Envelope
+
+
+def _expected(data, bin_size, n_bins):
+    """Compute the envelope of the last n_bins bins, in chronological order."""
+    starts = np.arange(0, data.shape[-1], bin_size)[-n_bins:]
+    mins = np.array(
+        [data[:, start : start + bin_size].min(axis=-1) for start in starts]
+    )
+    maxs = np.array(
+        [data[:, start : start + bin_size].max(axis=-1) for start in starts]
+    )
+    return np.stack((mins.T, maxs.T), axis=-1)
+
+
+@pytest.mark.parametrize("chunk_sizes", [[1] * 30 + [5, 37, 2], [500], [3, 700, 11]])
+def test_envelope(chunk_sizes):
+    """Test the min/max envelope updated chunk by chunk."""
+    rng = np.random.default_rng(0)
+    data = rng.standard_normal((3, sum(chunk_sizes)))
+    envelope = _Envelope(3, 250, 100)
+    assert envelope.bin_size == 3
+    assert envelope.n_bins == 84
+    assert np.isnan(envelope.data).all()
+    start = 0
+    for chunk_size in chunk_sizes:
+        envelope.update(data[:, start : start + chunk_size])
+        start += chunk_size
+        assert envelope.n_samples == start
+        expected = _expected(data[:, :start], 3, 84)
+        # reorder the ring chronologically
+        order = np.arange(
+            envelope.last_slot + 1 - expected.shape[1], envelope.last_slot + 1
+        )
+        assert_array_equal(envelope.data[:, order % 84], expected)
+        assert envelope.last_fill == (start - 1) % 3 + 1
+    envelope.update(np.empty((3, 0)))
+    assert envelope.n_samples == start
+
+
+def test_envelope_small_window():
+    """Test the envelope of a window with less samples than bins."""
+    envelope = _Envelope(2, 50, 100)
+    assert envelope.bin_size == 1
+    assert envelope.n_bins == 50
+    data = np.arange(120, dtype=float).reshape(2, 60)
+    envelope.update(data)
+    assert_array_equal(envelope.data[..., 0], envelope.data[..., 1])
+    assert_array_equal(np.roll(envelope.data[..., 0], -10, axis=-1), data[:, 10:])
+
+
+@pytest.mark.parametrize(
+    "n_samples, n_bins", [(2048, 100), (2000, 100), (2048, 50), (250, 100), (1, 10)]
+)
+def test_envelope_covers_window(n_samples, n_bins):
+    """Test that the bins cover the window whatever the filling of the last bin."""
+    envelope = _Envelope(1, n_samples, n_bins)
+    assert envelope.n_bins <= n_bins
+    envelope.update(np.zeros((1, n_samples)))
+    for _ in range(2 * envelope.bin_size):
+        envelope.update(np.zeros((1, 1)))
+        covered = (envelope.n_bins - 1) * envelope.bin_size + envelope.last_fill
+        assert n_samples <= covered
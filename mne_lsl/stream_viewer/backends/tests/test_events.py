@@ -0,0 +1,31 @@
+import numpy as np
+from numpy.testing import assert_array_equal
+
+from mne_lsl.stream_viewer.backends._events import _TriggerEvents
+
+
+def test_trigger_events():
+    """Test the storage of the trigger events."""
+    events = _TriggerEvents()
+    assert len(events) == 0
+    assert events.window(0, 100).size == 0
+    events.add([3, 10, 42], [1, 2, 1])
+    events.add(np.array([], dtype=int), np.array([]))
+    events.add(np.array([50, 51]), np.array([4.0, 5.0]))
+    assert len(events) == 5
+    assert events.events.dtype.names == ("sample", "value", "label")
+    assert_array_equal(events.events["label"], -1)
+    assert_array_equal(events.events["sample"], [3, 10, 42, 50, 51])
+    window = events.window(10, 50)
+    assert_array_equal(window["sample"], [10, 42])
+    assert_array_equal(window["value"], [2, 1])
+    assert events.window(52, 100).size == 0
+    events.discard(11)
+    assert_array_equal(events.events["sample"], [42, 50, 51])
+    # events older than the last event stored are inserted in order
+    events.add(np.array([45, 60]), np.array([6.0, np.nan]), np.array([-1, 0]))
+    assert_array_equal(events.events["sample"], [42, 45, 50, 51, 60])
+    assert_array_equal(events.events["value"], [1, 6, 4, 5, np.nan])
+    assert_array_equal(events.events["label"], [-1, -1, -1, -1, 0])
+    events.discard(100)
+    assert len(events) == 0
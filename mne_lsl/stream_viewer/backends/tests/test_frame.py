@@ -0,0 +1,66 @@
+from threading import Thread
+
+import numpy as np
+
+from mne_lsl.stream_viewer.backends._frame import _Frame, _TripleBuffer
+
+
+def test_frame():
+    """Test the frame allocation."""
+    x = np.arange(10, dtype=float)
+    frame = _Frame([0, 3], x)
+    assert frame.picks == [0, 3]
+    assert frame.times is x
+    assert frame.data.shape == (2, 10)
+    assert frame.timestamp is None
+    assert frame.n_samples == 0
+
+
+def test_triple_buffer():
+    """Test the exchange of frames between a producer and a consumer."""
+    x = np.arange(5, dtype=float)
+    frames = _TripleBuffer([_Frame([0], x) for _ in range(3)])
+    assert frames.acquire() is None
+    frame = frames.back()
+    frame.n_samples = 1
+    frames.publish()
+    assert frames.acquire() is frame
+    assert frames.acquire() is None
+    # the producer never writes in the frame read nor in the frame published
+    back = frames.back()
+    assert back is not frame
+    back.n_samples = 2
+    frames.publish()
+    assert frames.back() not in (frame, back)
+    assert frames.acquire() is back
+    assert frames.acquire() is None
+
+
+def test_triple_buffer_threads():
+    """Test that a frame is never written while it is read."""
+    x = np.arange(5, dtype=float)
+    frames = _TripleBuffer([_Frame([0], x) for _ in range(3)])
+    n_frames = 20000
+    torn = list()
+
+    def produce():
+        for k in range(1, n_frames + 1):
+            frame = frames.back()
+            frame.data.fill(k)
+            frame.n_samples = k
+            frames.publish()
+
+    producer = Thread(target=produce)
+    producer.start()
+    last = 0
+    while producer.is_alive() or last != n_frames:
+        frame = frames.acquire()
+        if frame is None:
+            continue
+        n_samples = frame.n_samples
+        if not np.all(frame.data == n_samples) or frame.n_samples != n_samples:
+            torn.append(n_samples)
+        assert last <= n_samples
+        last = n_samples
+    producer.join()
+    assert len(torn) == 0
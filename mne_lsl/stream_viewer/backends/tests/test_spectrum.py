@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+from scipy.signal import spectrogram, welch
+
+from mne_lsl.stream_viewer.backends._spectrum import _Spectrum
+
+
+@pytest.mark.parametrize(
+    "chunk_sizes", [[1] * 300 + [5, 370, 2], [2000], [3, 700, 11, 64, 64, 64]]
+)
+@pytest.mark.parametrize("n_fft, hop", [(64, 16), (65, 65), (128, 100)])
+def test_spectrum(chunk_sizes, n_fft, hop):
+    """Test the spectrum updated chunk by chunk against Welch's method."""
+    rng = np.random.default_rng(0)
+    data = rng.standard_normal((3, sum(chunk_sizes)))
+    spectrum = _Spectrum(3, 100.0, n_fft, hop, 10)
+    assert spectrum.n_blocks == 10
+    assert np.isnan(spectrum.psd).all()
+    assert np.isnan(spectrum.spectrogram).all()
+    start = 0
+    for chunk_size in chunk_sizes:
+        spectrum.update(data[:, start : start + chunk_size])
+        start += chunk_size
+        n_computed = (start - n_fft) // hop + 1
+        if n_computed <= 0:
+            assert np.isnan(spectrum.psd).all()
+            continue
+        # the blocks cached are the last 10 blocks computed
+        n_blocks = min(n_computed, 10)
+        first = (n_computed - n_blocks) * hop
+        last = (n_computed - 1) * hop + n_fft
+        freqs, psd = welch(
+            data[:, first:last],
+            100.0,
+            nperseg=n_fft,
+            noverlap=n_fft - hop,
+            detrend=False,
+        )
+        assert_allclose(spectrum.freqs, freqs)
+        assert_allclose(spectrum.psd, psd, rtol=1e-10)
+        _, _, sxx = spectrogram(
+            data[:, first:last],
+            100.0,
+            window="hann",
+            nperseg=n_fft,
+            noverlap=n_fft - hop,
+            detrend=False,
+        )
+        expected = np.full((10, freqs.size), np.nan)
+        expected[10 - n_blocks :] = sxx.mean(axis=0).T
+        assert_allclose(spectrum.spectrogram, expected, rtol=1e-10)
+
+
+def test_spectrum_rounding():
+    """Test that the running sum does not drift over many updates."""
+    rng = np.random.default_rng(0)
+    spectrum = _Spectrum(2, 100.0, 32, 8, 4)
+    spectrum.update(1e6 * rng.standard_normal((2, 2000)))
+    for _ in range(100):
+        spectrum.update(rng.standard_normal((2, 8)))
+    assert spectrum._pending.shape[-1] < 32
+    assert_allclose(spectrum.psd, spectrum._blocks.mean(axis=0), rtol=1e-10)
@@ -12,16 +12,16 @@ class _ControlGUI(QMainWindow, ABC, metaclass=_metaclass_ControlGUI):
 
     Parameters
     ----------
-    scope : Scope
-        Scope connected to a StreamInlet acquiring the data and applying
-        filtering. The scope has a buffer of _BUFFER_DURATION seconds
-        (default: 30s).
+    engines : list of ViewerEngine
+        Engines producing the frames displayed from the signal acquired and filtered
+        by their scope.
     """
 
     @abstractmethod
-    def __init__(self, scope):
+    def __init__(self, engines):
         super().__init__()
-        self._scope = scope
+        self._engines = list(engines)
+        self._scopes = [engine.scope for engine in self._engines]
 
     @abstractmethod
     def _load_gui(self):
@@ -44,9 +44,14 @@ class _ControlGUI(QMainWindow, ABC, metaclass=_metaclass_ControlGUI):
 
     # --------------------------------------------------------------------
     @property
-    def scope(self):
-        """Measuring scope."""
-        return self._scope
+    def engines(self):
+        """Engines producing the frames displayed."""
+        return self._engines
+
+    @property
+    def scopes(self):
+        """Measuring scopes."""
+        return self._scopes
 
     @property
     @abstractmethod
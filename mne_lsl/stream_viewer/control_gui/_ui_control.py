@@ -87,6 +87,30 @@ class UI_MainWindow(object):  # noqa
         self.checkBox_detrend.setObjectName("checkBox_detrend")
         self.checkBox_detrend.setText("Detrend")
 
+        # Detrend window
+        self.label_detrend_window = QLabel(self.MainWidget)
+        self.label_detrend_window.setGeometry(QRect(320, 60, 95, 17))
+        self.label_detrend_window.setObjectName("label_detrend_window")
+        self.label_detrend_window.setText("Detrend (s)")
+
+        self.doubleSpinBox_detrend_window = QDoubleSpinBox(self.MainWidget)
+        self.doubleSpinBox_detrend_window.setGeometry(QRect(320, 80, 69, 27))
+        self.doubleSpinBox_detrend_window.setMinimum(0.1)
+        self.doubleSpinBox_detrend_window.setMaximum(float(_BUFFER_DURATION))
+        self.doubleSpinBox_detrend_window.setSingleStep(0.5)
+        self.doubleSpinBox_detrend_window.setProperty("value", 2.0)  # Default 2s
+        self.doubleSpinBox_detrend_window.setObjectName("doubleSpinBox_detrend_window")
+
+        # Display mode
+        self.label_mode = QLabel(self.MainWidget)
+        self.label_mode.setGeometry(QRect(420, 60, 100, 17))
+        self.label_mode.setObjectName("label_mode")
+        self.label_mode.setText("Display")
+
+        self.comboBox_mode = QComboBox(self.MainWidget)
+        self.comboBox_mode.setGeometry(QRect(420, 80, 85, 27))
+        self.comboBox_mode.setObjectName("comboBox_mode")
+
         # Show LPT events
         self.checkBox_show_LPT_trigger_events = QCheckBox(self.MainWidget)
         self.checkBox_show_LPT_trigger_events.setGeometry(QRect(120, 80, 151, 22))
@@ -129,6 +153,25 @@ class UI_MainWindow(object):  # noqa
         self.table_channels.verticalHeader().setVisible(False)
         self.table_channels.verticalHeader().setHighlightSections(False)
 
+        # Spectrum
+        self.checkBox_spectrum = QCheckBox(self.MainWidget)
+        self.checkBox_spectrum.setGeometry(QRect(10, 642, 100, 22))
+        self.checkBox_spectrum.setObjectName("checkBox_spectrum")
+        self.checkBox_spectrum.setText("Spectrum")
+
+        self.label_hop = QLabel(self.MainWidget)
+        self.label_hop.setGeometry(QRect(118, 645, 65, 17))
+        self.label_hop.setObjectName("label_hop")
+        self.label_hop.setText("Hop (s)")
+
+        self.doubleSpinBox_hop = QDoubleSpinBox(self.MainWidget)
+        self.doubleSpinBox_hop.setGeometry(QRect(185, 640, 69, 27))
+        self.doubleSpinBox_hop.setMinimum(0.01)
+        self.doubleSpinBox_hop.setMaximum(10.0)
+        self.doubleSpinBox_hop.setSingleStep(0.05)
+        self.doubleSpinBox_hop.setProperty("value", 0.25)  # Default 0.25s
+        self.doubleSpinBox_hop.setObjectName("doubleSpinBox_hop")
+
         # Bottom status Bar
         self.statusBar = QStatusBar(MainWindow)
         self.statusBar.setObjectName("statusBar")
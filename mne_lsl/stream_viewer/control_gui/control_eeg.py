@@ -1,4 +1,5 @@
 import math
+from configparser import Error as ConfigParserError
 from configparser import RawConfigParser
 from pathlib import Path
 
@@ -7,24 +8,29 @@ from qtpy.QtWidgets import QHeaderView, QTableWidgetItem
 
 from ...utils._docs import copy_doc
 from ...utils.logs import logger
-from ..backends.pyqtgraph import _BackendPyQtGraph
+from ..backends.pyqtgraph import _REFRESH_INTERVAL_MIN, _BackendPyQtGraph
+from ..engine import ViewerEngine
 from ._control import _ControlGUI
 from ._ui_control import UI_MainWindow
 
+_STATUS_INTERVAL = 500  # ms
+
 
 class ControlGUI_EEG(_ControlGUI):
-    """Controller GUI for EEG LSL Stream.
+    """Controller GUI for EEG LSL Streams.
+
+    The filters are applied to all the streams, and the channel table lists the
+    channels of all the streams.
 
     Parameters
     ----------
-    scope : Scope
-        Scope connected to a StreamInlet acquiring the data and applying
-        filtering. The scope has a buffer of _BUFFER_DURATION seconds
-        (default: 30s).
+    engines : list of ViewerEngine
+        Engines producing the frames displayed from the signal acquired and filtered
+        by their scope.
     """
 
-    def __init__(self, scope):
-        super().__init__(scope)
+    def __init__(self, engines):
+        super().__init__(engines)
         config_file = "settings_scope_eeg.ini"
 
         self._load_configuration(config_file)
@@ -35,6 +41,11 @@ class ControlGUI_EEG(_ControlGUI):
 
         self._backend.start_timer()
 
+        # the lag of the viewer is reported in the status bar
+        self._timer_status = QtCore.QTimer(self)
+        self._timer_status.timeout.connect(self._update_status)
+        self._timer_status.start(_STATUS_INTERVAL)
+
     def _load_gui(self):
         """Load the UI created with QtCreator."""
         logger.debug("Loading GUI..")
@@ -44,12 +55,17 @@ class ControlGUI_EEG(_ControlGUI):
         for yRange in self._yRanges:
             self._ui.comboBox_signal_yRange.addItem(str(yRange))
             logger.debug("y-scale option %s added.", yRange)
-
-        # Set table channels row/col
-        self._nb_table_columns = 8 if self._scope.nb_channels > 64 else 4
-        self._nb_table_rows = math.ceil(
-            self._scope.nb_channels / self._nb_table_columns
-        )
+        for mode in ViewerEngine._modes:
+            self._ui.comboBox_mode.addItem(mode)
+
+        # Set table channels row/col, the channels of each stream being listed in order
+        self._channels = [
+            (k, idx)
+            for k, scope in enumerate(self._scopes)
+            for idx in range(scope.nb_channels)
+        ]
+        self._nb_table_columns = 8 if len(self._channels) > 64 else 4
+        self._nb_table_rows = math.ceil(len(self._channels) / self._nb_table_columns)
         self._ui.table_channels.setRowCount(self._nb_table_rows)
         self._ui.table_channels.setColumnCount(self._nb_table_columns)
 
@@ -60,17 +76,19 @@ class ControlGUI_EEG(_ControlGUI):
         )
 
         # Set table channels elements
-        for idx in range(self._scope.nb_channels):
-            row = idx // self._nb_table_columns
-            col = idx % self._nb_table_columns
-            self._ui.table_channels.setItem(row, col, QTableWidgetItem(idx))
+        for pos, (k, idx) in enumerate(self._channels):
+            row = pos // self._nb_table_columns
+            col = pos % self._nb_table_columns
+            label = self._scopes[k].channels_labels[idx]
+            self._ui.table_channels.setItem(row, col, QTableWidgetItem(pos))
             self._ui.table_channels.item(row, col).setTextAlignment(
                 QtCore.Qt.AlignCenter
             )
-            self._ui.table_channels.item(row, col).setText(
-                self._scope.channels_labels[idx]
+            self._ui.table_channels.item(row, col).setText(label)
+            self._ui.table_channels.item(row, col).setToolTip(
+                self._scopes[k].stream_name
             )
-            logger.debug("Added channel %s", self._scope.channels_labels[idx])
+            logger.debug("Added channel %s", label)
 
         # Table channels header
         self._ui.table_channels.verticalHeader().setSectionResizeMode(
@@ -151,6 +169,22 @@ class ControlGUI_EEG(_ControlGUI):
         except Exception:  # 10s by default
             self._ui.spinBox_signal_xRange.setValue(10)
 
+        # Display mode
+        try:
+            mode = scope_settings.get("plot", "mode")
+            self._ui.comboBox_mode.setCurrentIndex(ViewerEngine._modes.index(mode))
+        except Exception:  # scroll by default
+            self._ui.comboBox_mode.setCurrentIndex(0)
+        self._backend.mode = self._ui.comboBox_mode.currentText()
+
+        # Refresh interval
+        try:
+            self._backend.min_refresh_interval = int(
+                scope_settings.get("plot", "refresh_interval")
+            )
+        except (ConfigParserError, ValueError):
+            self._backend.min_refresh_interval = _REFRESH_INTERVAL_MIN
+
         # BP Filters
         self._ui.checkBox_bandpass.setChecked(
             bool(int(scope_settings.get("filtering", "apply_bandpass")))
@@ -181,10 +215,11 @@ class ControlGUI_EEG(_ControlGUI):
         self._ui.doubleSpinBox_bandpass_low.setMaximum(
             self._ui.doubleSpinBox_bandpass_high.value() - 1
         )
-        self._scope.init_bandpass_filter(
-            low=self._ui.doubleSpinBox_bandpass_low.value(),
-            high=self._ui.doubleSpinBox_bandpass_high.value(),
-        )
+        for scope in self._scopes:
+            scope.init_bandpass_filter(
+                low=self._ui.doubleSpinBox_bandpass_low.value(),
+                high=self._ui.doubleSpinBox_bandpass_high.value(),
+            )
 
         # CAR
         try:
@@ -201,6 +236,14 @@ class ControlGUI_EEG(_ControlGUI):
             )
         except Exception:
             self._ui.checkBox_detrend.setChecked(False)
+        try:
+            self._ui.doubleSpinBox_detrend_window.setValue(
+                float(scope_settings.get("filtering", "detrend_window"))
+            )
+        except Exception:  # 2s by default
+            self._ui.doubleSpinBox_detrend_window.setValue(2.0)
+        for scope in self._scopes:
+            scope.detrend_window = self._ui.doubleSpinBox_detrend_window.value()
 
         # Trigger events
         try:
@@ -210,10 +253,31 @@ class ControlGUI_EEG(_ControlGUI):
         except Exception:
             self._ui.checkBox_show_LPT_trigger_events.setChecked(False)
 
+        # Spectrum
+        try:
+            self._backend.fft_window = float(
+                scope_settings.get("spectrum", "fft_window")
+            )
+        except Exception:  # 1s by default
+            self._backend.fft_window = 1.0
+        try:
+            self._ui.doubleSpinBox_hop.setValue(
+                float(scope_settings.get("spectrum", "hop"))
+            )
+        except Exception:  # 0.25s by default
+            self._ui.doubleSpinBox_hop.setValue(0.25)
+        self._backend.hop = self._ui.doubleSpinBox_hop.value()
+        try:
+            self._ui.checkBox_spectrum.setChecked(
+                bool(int(scope_settings.get("spectrum", "show_spectrum")))
+            )
+        except Exception:
+            self._ui.checkBox_spectrum.setChecked(False)
+
         # Table channels
-        for idx in range(self._scope.nb_channels):
-            row = idx // self._nb_table_columns
-            col = idx % self._nb_table_columns
+        for pos in range(len(self._channels)):
+            row = pos // self._nb_table_columns
+            col = pos % self._nb_table_columns
             self._ui.table_channels.item(row, col).setSelected(True)
 
     @copy_doc(_ControlGUI._init_backend)
@@ -225,7 +289,7 @@ class ControlGUI_EEG(_ControlGUI):
             self.height(),
         )
         self._backend = _BackendPyQtGraph(
-            self._scope, geometry, self._xRange, self._yRange
+            self._engines, geometry, self._xRange, self._yRange
         )
 
     # --------------------------------------------------------------------
@@ -239,6 +303,7 @@ class ControlGUI_EEG(_ControlGUI):
         self._ui.spinBox_signal_xRange.valueChanged.connect(
             self.onValueChanged_spinBox_signal_xRange
         )
+        self._ui.comboBox_mode.activated.connect(self.onActivated_comboBox_mode)
 
         # CAR / Filters
         self._ui.checkBox_bandpass.stateChanged.connect(
@@ -252,12 +317,23 @@ class ControlGUI_EEG(_ControlGUI):
         )
         self._ui.checkBox_car.stateChanged.connect(self.onClicked_checkBox_car)
         self._ui.checkBox_detrend.stateChanged.connect(self.onClicked_checkBox_detrend)
+        self._ui.doubleSpinBox_detrend_window.valueChanged.connect(
+            self.onValueChanged_doubleSpinBox_detrend_window
+        )
 
         # Trigger events
         self._ui.checkBox_show_LPT_trigger_events.stateChanged.connect(
             self.onClicked_checkBox_show_LPT_trigger_events
         )
 
+        # Spectrum
+        self._ui.checkBox_spectrum.stateChanged.connect(
+            self.onClicked_checkBox_spectrum
+        )
+        self._ui.doubleSpinBox_hop.valueChanged.connect(
+            self.onValueChanged_doubleSpinBox_hop
+        )
+
         # Channel table
         self._ui.table_channels.itemSelectionChanged.connect(
             self.onSelectionChanged_table_channels
@@ -279,10 +355,17 @@ class ControlGUI_EEG(_ControlGUI):
         self._backend.xRange = self._xRange
         logger.debug("x-range set to %d", self._xRange)
 
+    @QtCore.Slot()
+    def onActivated_comboBox_mode(self):
+        logger.debug("Display mode event received.")
+        self._backend.mode = self._ui.comboBox_mode.currentText()
+        logger.debug("Display mode set to %s", self._backend.mode)
+
     @QtCore.Slot()
     def onClicked_checkBox_bandpass(self):
         logger.debug("Checkbox for BP event received.")
-        self._scope.apply_bandpass = self._ui.checkBox_bandpass.isChecked()
+        for scope in self._scopes:
+            scope.apply_bandpass = self._ui.checkBox_bandpass.isChecked()
         logger.debug("BP checkbox: %s", self._ui.checkBox_bandpass.isChecked())
 
     @QtCore.Slot()
@@ -291,10 +374,11 @@ class ControlGUI_EEG(_ControlGUI):
         self._ui.doubleSpinBox_bandpass_high.setMinimum(
             self._ui.doubleSpinBox_bandpass_low.value() + 1
         )
-        self._scope.init_bandpass_filter(
-            low=self._ui.doubleSpinBox_bandpass_low.value(),
-            high=self._ui.doubleSpinBox_bandpass_high.value(),
-        )
+        for scope in self._scopes:
+            scope.init_bandpass_filter(
+                low=self._ui.doubleSpinBox_bandpass_low.value(),
+                high=self._ui.doubleSpinBox_bandpass_high.value(),
+            )
         logger.debug(
             "BP set to [%d, %d]",
             self._ui.doubleSpinBox_bandpass_low.value(),
@@ -307,10 +391,11 @@ class ControlGUI_EEG(_ControlGUI):
         self._ui.doubleSpinBox_bandpass_low.setMaximum(
             self._ui.doubleSpinBox_bandpass_high.value() - 1
         )
-        self._scope.init_bandpass_filter(
-            low=self._ui.doubleSpinBox_bandpass_low.value(),
-            high=self._ui.doubleSpinBox_bandpass_high.value(),
-        )
+        for scope in self._scopes:
+            scope.init_bandpass_filter(
+                low=self._ui.doubleSpinBox_bandpass_low.value(),
+                high=self._ui.doubleSpinBox_bandpass_high.value(),
+            )
         logger.debug(
             "BP set to [%d, %d]",
             self._ui.doubleSpinBox_bandpass_low.value(),
@@ -320,15 +405,27 @@ class ControlGUI_EEG(_ControlGUI):
     @QtCore.Slot()
     def onClicked_checkBox_car(self):
         logger.debug("Checkbox for CAR event received.")
-        self._scope.apply_car = self._ui.checkBox_car.isChecked()
+        for scope in self._scopes:
+            scope.apply_car = self._ui.checkBox_car.isChecked()
         logger.debug("CAR checkbox: %s", self._ui.checkBox_car.isChecked())
 
     @QtCore.Slot()
     def onClicked_checkBox_detrend(self):
         logger.debug("Checkbox for detrend event received.")
-        self._scope.apply_detrend = self._ui.checkBox_detrend.isChecked()
+        for scope in self._scopes:
+            scope.apply_detrend = self._ui.checkBox_detrend.isChecked()
         logger.debug("Detrend checkbox: %s", self._ui.checkBox_bandpass.isChecked())
 
+    @QtCore.Slot()
+    def onValueChanged_doubleSpinBox_detrend_window(self):
+        logger.debug("Detrend window event received.")
+        for scope in self._scopes:
+            scope.detrend_window = self._ui.doubleSpinBox_detrend_window.value()
+        logger.debug(
+            "Detrend window set to %.1f s",
+            self._ui.doubleSpinBox_detrend_window.value(),
+        )
+
     @QtCore.Slot()
     def onClicked_checkBox_show_LPT_trigger_events(self):
         logger.debug("Checkbox for LPT event received.")
@@ -340,18 +437,45 @@ class ControlGUI_EEG(_ControlGUI):
             self._ui.checkBox_show_LPT_trigger_events.isChecked(),
         )
 
+    @QtCore.Slot()
+    def onClicked_checkBox_spectrum(self):
+        logger.debug("Checkbox for spectrum event received.")
+        self._backend.show_spectrum = self._ui.checkBox_spectrum.isChecked()
+        logger.debug("Spectrum checkbox: %s", self._ui.checkBox_spectrum.isChecked())
+
+    @QtCore.Slot()
+    def onValueChanged_doubleSpinBox_hop(self):
+        logger.debug("Hop event received.")
+        self._backend.hop = self._ui.doubleSpinBox_hop.value()
+        logger.debug("Hop set to %.2f s", self._backend.hop)
+
     @QtCore.Slot()
     def onSelectionChanged_table_channels(self):
         logger.debug("Channel selection event received.")
         selected = self._ui.table_channels.selectedItems()
-        self._scope.selected_channels = sorted(
-            [item.row() * self._nb_table_columns + item.column() for item in selected]
+        selected = sorted(
+            self._channels[item.row() * self._nb_table_columns + item.column()]
+            for item in selected
+        )
+        for k, scope in enumerate(self._scopes):
+            scope.selected_channels = [idx for j, idx in selected if j == k]
+        self._backend.selected_channels = [
+            scope.selected_channels for scope in self._scopes
+        ]
+
+    @QtCore.Slot()
+    def _update_status(self):
+        """Report the lag of the viewer and the refresh interval in the status bar."""
+        lag = self._backend.lag
+        lag = "n/a" if lag is None else f"{1000 * lag:.0f} ms"
+        self._ui.statusBar.showMessage(
+            f"Lag: {lag} | Refresh interval: {self._backend.refresh_interval} ms"
         )
-        self._backend.selected_channels = self._scope.selected_channels
 
     def closeEvent(self, event):
         """Event called when closing the _ScopeControllerUI window."""
         logger.debug("Closing event received.")
+        self._timer_status.stop()
         self._backend.close()
         super().closeEvent(event)
 
@@ -0,0 +1,697 @@
+from threading import Event, Timer
+
+import numpy as np
+
+from ..lsl import StreamInlet
+from ..stream import StreamLSL
+from ..utils._checks import check_type, check_value, ensure_int
+from ..utils.logs import logger
+from .backends._envelope import _Envelope
+from .backends._events import _TriggerEvents
+from .backends._frame import _Frame, _TripleBuffer
+from .backends._spectrum import _Spectrum
+from .scope import ScopeEEG
+
+_SWEEP_GAP = 0.02  # ratio of the display window erased ahead of the sweep
+
+
+class _Layout:
+    """Layout of the display window.
+
+    Parameters
+    ----------
+    picks : list of int
+        Indices of the channels displayed.
+    n_samples : int
+        Number of samples in the display window.
+    n_points : int
+        Number of bins of the envelope, e.g. the width of the window in pixels.
+    mode : str
+        Display mode, 'scroll' or 'sweep'.
+    duration : float
+        Duration of the display window in seconds.
+    n_fft : int | None
+        Number of samples of the FFT blocks, None to disable the spectrum.
+    hop : int | None
+        Number of samples between the start of 2 consecutive FFT blocks.
+    """
+
+    def __init__(self, picks, n_samples, n_points, mode, duration, n_fft, hop):
+        self.picks = list(picks)
+        self.n_samples = n_samples
+        self.n_points = n_points
+        self.mode = mode
+        self.duration = duration
+        self.n_fft = n_fft
+        self.hop = hop
+
+
+class ViewerEngine:
+    """Headless engine producing the frames displayed by a stream viewer.
+
+    The engine acquires the new samples of a stream, filters them with a
+    :class:`~mne_lsl.stream_viewer.scope.ScopeEEG`, and decimates the display window to
+    its min/max envelope, at a target frame rate and outside of the caller's thread. The
+    size of a frame depends on the number of points of the display window instead of
+    the sampling rate, and the engine does not depend on Qt, thus the frames can be
+    sent to a remote dashboard, e.g. with a callback forwarding them to a socket.
+
+    Parameters
+    ----------
+    stream : StreamLSL
+        Connected stream to display. The stream can be shared with other consumers,
+        e.g. an acquisition process.
+    duration : float
+        Duration of the display window in seconds.
+    n_points : int
+        Number of bins of the display window, e.g. its width in pixels. Each bin is
+        represented by its minimum and maximum.
+    frame_rate : float
+        Target number of frames produced per second.
+    mode : ``'scroll'`` | ``'sweep'``
+        Display mode. In scroll mode, the newest samples are on the right of the
+        window. In sweep mode, the newest samples are written from left to right over
+        the oldest ones, like on EEG paper.
+    markers : list of StreamLSL | StreamInlet | None
+        Connected streams or inlets with an irregular sampling rate, e.g. marker
+        streams, whose samples are overlaid as events. The events are positioned from
+        their timestamp, thus the streams must share the same clock, e.g. by connecting
+        them with the ``'clocksync'`` processing flag. The value of an event is the
+        value of the first channel. The string marker streams, which can not be
+        connected to a :class:`~mne_lsl.stream.StreamLSL`, are read from a
+        :class:`~mne_lsl.lsl.StreamInlet`, and their labels are displayed as text, or as
+        a value if the label is a number. A pull consumes the samples of an inlet, thus
+        an inlet is pulled once per update of the loop and its samples are given to
+        every engine of the loop, and it should not be shared between engines started
+        separately. The time correction of an inlet should be initiated with
+        :meth:`~mne_lsl.lsl.StreamInlet.time_correction`, else the first pull blocks
+        until it is estimated.
+    n_fft : int | None
+        Number of samples of the blocks transformed to compute the power spectral
+        density and the spectrogram of the display window. If None, the spectrum is not
+        computed.
+    hop : int | None
+        Number of samples between the start of 2 consecutive blocks, i.e. the time
+        resolution of the spectrogram. If None, the blocks overlap by half.
+
+    Notes
+    -----
+    A frame has the attributes:
+
+    * ``picks``: indices of the channels in the frame, among
+      :attr:`~mne_lsl.stream_viewer.scope.ScopeEEG.channels_labels`.
+    * ``times``: array of shape ``(n_points,)``, position of the points in the window
+      in seconds, to translate by ``position``.
+    * ``data``: array of shape ``(n_channels, n_points)``, alternating minimum and
+      maximum of each bin. The bins not yet acquired are set to NaN.
+    * ``position``: translation of ``times`` in seconds.
+    * ``n_samples``: number of samples acquired by the engine.
+    * ``timestamp``: LSL timestamp of the last sample acquired.
+    * ``event_times``, ``event_values``: position in seconds and value of the trigger
+      and marker events in the window. The value of a string marker which is not a
+      number is NaN.
+    * ``event_labels``: list of the text displayed on each event, i.e. the label of the
+      string markers or the value of the other events.
+    * ``freqs``: array of shape ``(n_freqs,)``, frequencies of the spectrum in Hz.
+    * ``psd``: array of shape ``(n_channels, n_freqs)``, power spectral density of
+      each channel averaged over the blocks of the window (Welch's method).
+    * ``spectrogram``: array of shape ``(n_blocks, n_freqs)``, power spectral density
+      of each block of the window averaged across channels, in chronological order.
+
+    The spectrum is computed from the FFT of the new blocks only, cached until they exit
+    the window, and all the channels are transformed at once. The spectral arrays are
+    empty if ``n_fft`` is None.
+
+    A frame is overwritten by the engine once the next frame is retrieved, thus its
+    arrays should be copied to be retained.
+    """
+
+    _modes = ("scroll", "sweep")
+
+    def __init__(
+        self,
+        stream,
+        duration=10,
+        n_points=1000,
+        frame_rate=30,
+        mode="scroll",
+        markers=None,
+        n_fft=None,
+        hop=None,
+    ):
+        check_type(stream, (StreamLSL,), "stream")
+        if not stream.connected:
+            raise RuntimeError(
+                "The stream must be connected before being attached to the engine."
+            )
+        markers = list() if markers is None else list(markers)
+        for marker in markers:
+            check_type(marker, (StreamLSL, StreamInlet), "marker")
+            if isinstance(marker, StreamInlet):
+                sfreq = marker.sfreq
+            elif not marker.connected:
+                raise RuntimeError(
+                    "The marker streams must be connected before being attached to the "
+                    "engine."
+                )
+            else:
+                sfreq = marker.info["sfreq"]
+            if sfreq != 0:
+                raise ValueError(
+                    "The marker streams must have an irregular sampling rate. "
+                    f"{marker.name} is sampled at {sfreq} Hz."
+                )
+        self._markers = markers
+        # timestamp of the last sample retrieved from each marker stream
+        self._markers_ts = [0] * len(markers)
+        # text labels of the string markers, stored once and referenced by index
+        self._labels = dict()
+        self._scope = ScopeEEG(stream)
+        self._picks = list(range(self._scope.nb_channels))
+        # the layout is complete once all the settings are validated and set
+        self._n_points = None
+        self._mode = None
+        self._n_fft = None
+        self._hop = None
+        self.duration = duration
+        self.n_points = n_points
+        self.frame_rate = frame_rate
+        self.mode = mode
+        self.n_fft = n_fft
+        self.hop = hop
+
+        self._applied_layout = None
+        self._frames = None
+        self._new_frame = Event()
+        self._events = _TriggerEvents()
+        self._n_samples = 0  # number of samples acquired
+        self._timestamp = None
+        self._callback = None
+        self._loop = None
+        self._interrupt = True
+
+    def start(self, callback=None):
+        """Start producing frames in a daemonic thread.
+
+        Parameters
+        ----------
+        callback : callable | None
+            Function called with each new frame, in the engine's thread.
+        """
+        if callback is not None and not callable(callback):
+            raise TypeError(f"The callback must be callable. {callback} is invalid.")
+        self._callback = callback
+        _EngineLoop([self]).start()
+
+    def stop(self):
+        """Stop producing frames and wait for the termination of the thread.
+
+        If the engine is updated in a thread shared with other engines, the other
+        engines are stopped as well.
+        """
+        if self._loop is not None:
+            self._loop.stop()
+
+    def iter_frames(self, timeout=None):
+        """Iterate over the frames produced by the engine.
+
+        The frames produced while the previous frame is processed are skipped, thus the
+        iterator always yields the most recent frame.
+
+        Parameters
+        ----------
+        timeout : float | None
+            Maximum time to wait for a new frame in seconds. If None, wait until the
+            engine is stopped.
+
+        Yields
+        ------
+        frame : Frame
+            The last frame produced. See the notes of
+            :class:`~mne_lsl.stream_viewer.ViewerEngine` for its attributes.
+        """
+        while True:
+            if not self._new_frame.wait(timeout) or self._interrupt:
+                return
+            self._new_frame.clear()
+            frame = self._acquire_frame()
+            if frame is not None:
+                yield frame
+
+    def _acquire_frame(self):
+        """Get the last frame produced, or None if it was already retrieved."""
+        frames = self._frames
+        return None if frames is None else frames.acquire()
+
+    def _set_layout(self):
+        """Request the layout matching the properties, applied at the next update."""
+        self._layout = _Layout(
+            self._picks,
+            int(np.ceil(self._duration * self._scope.sample_rate)),
+            self._n_points,
+            self._mode,
+            self._duration,
+            self._n_fft,
+            self.hop,
+        )
+
+    def _update(self, chunks=None):
+        """Retrieve the new samples and publish a frame.
+
+        The envelope and the spectrum are updated with the new samples only.
+
+        Parameters
+        ----------
+        chunks : dict | None
+            Labels and timestamps pulled from each marker inlet during this update of
+            the loop, keyed by the id of the inlet. If None, the inlets are pulled by
+            the engine.
+        """
+        self._scope.update_loop()
+        n_samples = len(self._scope.ts_list)
+        self._n_samples += n_samples
+        if n_samples != 0:
+            self._timestamp = self._scope.ts_list[-1]
+            trigger = self._scope.get_trigger(n_samples)
+            idx = np.flatnonzero(trigger)
+            if idx.size != 0:
+                self._events.add(self._n_samples - n_samples + idx, trigger[idx])
+            # the events exiting the scope's buffer can not be displayed anymore
+            self._events.discard(self._n_samples - self._scope.duration_buffer_samples)
+        if self._timestamp is not None:
+            self._read_markers(chunks)
+        layout = self._layout
+        if layout is not self._applied_layout:
+            self._apply_layout(layout)
+        elif n_samples != 0:
+            data = self._scope.get_data(n_samples)[layout.picks]
+            self._envelope.update(data)
+            if self._spectrum is not None:
+                self._spectrum.update(data)
+        else:
+            return
+        frame = self._frames.back()
+        self._compose(frame)
+        self._frames.publish()
+        self._new_frame.set()
+        if self._callback is not None:
+            # the frame is not overwritten before the next update
+            self._callback(frame)
+
+    def _read_markers(self, chunks=None):
+        """Add the new samples of the marker streams to the events.
+
+        The timestamps of the markers are converted to the index of the closest sample
+        of the stream displayed. The markers more recent than the last sample acquired
+        are displayed once the stream catches up.
+        """
+        for k, marker in enumerate(self._markers):
+            if isinstance(marker, StreamInlet):
+                if chunks is None:
+                    data, timestamps = _pull_markers(marker)
+                elif id(marker) in chunks:
+                    data, timestamps = chunks[id(marker)]
+                else:
+                    continue
+            else:
+                data, timestamps = marker._get_data_since(self._markers_ts[k], [0])
+                data = data[0]
+            if timestamps.size == 0:
+                continue
+            self._markers_ts[k] = timestamps[-1]
+            samples = self._n_samples - 1
+            samples += np.round(
+                (timestamps - self._timestamp) * self._scope.sample_rate
+            ).astype(np.int64)
+            if data.dtype == object:
+                self._events.add(samples, *self._encode_labels(data))
+            else:
+                self._events.add(samples, data)
+
+    def _encode_labels(self, labels):
+        """Convert the labels of string markers to event values and label indices.
+
+        The labels which are numbers are converted to the value of the event, and the
+        other labels are referenced by their index among the labels received.
+        """
+        values = np.full(labels.size, np.nan)
+        indices = np.full(labels.size, -1, dtype=np.int64)
+        for k, label in enumerate(labels):
+            try:
+                values[k] = float(label)
+            except ValueError:
+                indices[k] = self._labels.setdefault(label, len(self._labels))
+        return values, indices
+
+    def _apply_layout(self, layout):
+        """Initialize the envelope, the spectrum and the frames from the buffer."""
+        self._envelope = _Envelope(len(layout.picks), layout.n_samples, layout.n_points)
+        data = self._scope.get_data(layout.n_samples)
+        self._envelope.update(data[layout.picks])
+        bin_size = self._envelope.bin_size / self._scope.sample_rate
+        times = np.repeat(np.arange(self._envelope.n_bins) * bin_size, 2)
+        if layout.n_fft is None:
+            self._spectrum = None
+            freqs, n_blocks = None, 0
+        else:
+            # the blocks cover the display window
+            n_blocks = max((layout.n_samples - layout.n_fft) // layout.hop + 1, 1)
+            self._spectrum = _Spectrum(
+                len(layout.picks),
+                self._scope.sample_rate,
+                layout.n_fft,
+                layout.hop,
+                n_blocks,
+            )
+            n_samples = (n_blocks - 1) * layout.hop + layout.n_fft
+            data = self._scope.get_data(n_samples)
+            self._spectrum.update(data[layout.picks])
+            freqs = self._spectrum.freqs
+        self._frames = _TripleBuffer(
+            [_Frame(layout.picks, times, freqs, n_blocks) for _ in range(3)]
+        )
+        # index of the sample at the start of the envelope
+        self._origin = self._n_samples - layout.n_samples
+        self._applied_layout = layout
+
+    def _compose(self, frame):
+        """Write the points to display with the selected display mode in the frame.
+
+        In sweep mode, the bins are placed at their position in the ring, thus the new
+        samples are written from left to right over the oldest ones, like on EEG paper.
+        In scroll mode, the bins are placed in chronological order, the newest samples
+        on the right, and the entire curve is translated by the duration of the last
+        incomplete bin. The position of the trigger events is derived from the number of
+        samples acquired with the same mapping.
+        """
+        layout = self._applied_layout
+        data = self._envelope.data  # (channels, bins, 2)
+        out = frame.data.reshape(data.shape)
+        slot = self._envelope.last_slot
+        if layout.mode == "sweep":
+            out[:] = data
+            n_gap = max(int(_SWEEP_GAP * self._envelope.n_bins), 1)
+            gap = np.arange(slot + 1, slot + 1 + n_gap) % self._envelope.n_bins
+            out[:, gap] = np.nan
+            frame.position = 0.0
+            # the events erased by the gap are not displayed
+            period = self._envelope.n_bins * self._envelope.bin_size
+            start = (
+                self._n_samples
+                - self._envelope.last_fill
+                - (self._envelope.n_bins - n_gap - 1) * self._envelope.bin_size
+            )
+            events = self._events.window(start, self._n_samples)
+            frame.event_times = (
+                (events["sample"] - self._origin) % period / self._scope.sample_rate
+            )
+        else:
+            n_bins = self._envelope.n_bins - slot - 1
+            out[:, :n_bins] = data[:, slot + 1 :]
+            out[:, n_bins:] = data[:, : slot + 1]
+            # the start of the last bin is positioned before the right edge by the
+            # duration of the samples it contains, and the envelope covers the window
+            # whatever this duration, thus the position is negative.
+            frame.position = (
+                layout.duration
+                - frame.times[-1]
+                - self._envelope.last_fill / self._scope.sample_rate
+            )
+            events = self._events.window(
+                self._n_samples - layout.n_samples, self._n_samples
+            )
+            frame.event_times = (
+                layout.duration
+                - (self._n_samples - events["sample"]) / self._scope.sample_rate
+            )
+        frame.event_values = events["value"]
+        if np.any(events["label"] != -1):
+            labels = list(self._labels)  # ordered by index
+            frame.event_labels = [
+                f"{value:g}" if label == -1 else labels[label]
+                for value, label in zip(events["value"], events["label"])
+            ]
+        else:
+            frame.event_labels = [f"{value:g}" for value in events["value"]]
+        if self._spectrum is not None:
+            frame.psd[:] = self._spectrum.psd
+            frame.spectrogram[:] = self._spectrum.spectrogram
+        frame.n_samples = self._n_samples
+        frame.timestamp = self._timestamp
+
+    # --------------------------------------------------------------------
+    @property
+    def scope(self):
+        """Scope acquiring and filtering the signal.
+
+        :type: :class:`~mne_lsl.stream_viewer.scope.ScopeEEG`
+        """
+        return self._scope
+
+    @property
+    def stream(self):
+        """Stream displayed.
+
+        :type: :class:`~mne_lsl.stream.StreamLSL`
+        """
+        return self._scope.stream
+
+    @property
+    def picks(self):
+        """Indices of the channels displayed.
+
+        :type: :class:`list` of :class:`int`
+        """
+        return self._picks
+
+    @picks.setter
+    def picks(self, picks):
+        picks = [ensure_int(pick, "pick") for pick in picks]
+        for pick in picks:
+            if not 0 <= pick < self._scope.nb_channels:
+                raise ValueError(
+                    f"The channel index {pick} is invalid. The scope has "
+                    f"{self._scope.nb_channels} channels."
+                )
+        self._picks = picks
+        self._set_layout()
+
+    @property
+    def duration(self):
+        """Duration of the display window in seconds.
+
+        :type: :class:`float`
+        """
+        return self._duration
+
+    @duration.setter
+    def duration(self, duration):
+        check_type(duration, ("numeric",), "duration")
+        if not 0 < duration <= self._scope.duration_buffer:
+            raise ValueError(
+                "The duration of the display window must be strictly positive and "
+                f"shorter than the scope's buffer ({self._scope.duration_buffer} s). "
+                f"{duration} is invalid."
+            )
+        self._duration = duration
+        self._set_layout()
+
+    @property
+    def n_points(self):
+        """Number of bins of the display window.
+
+        :type: :class:`int`
+        """
+        return self._n_points
+
+    @n_points.setter
+    def n_points(self, n_points):
+        n_points = ensure_int(n_points, "n_points")
+        if n_points <= 0:
+            raise ValueError(
+                f"The number of points must be strictly positive. {n_points} is "
+                "invalid."
+            )
+        self._n_points = n_points
+        self._set_layout()
+
+    @property
+    def mode(self):
+        """Display mode, ``'scroll'`` or ``'sweep'``.
+
+        :type: :class:`str`
+        """
+        return self._mode
+
+    @mode.setter
+    def mode(self, mode):
+        check_value(mode, self._modes, "mode")
+        self._mode = mode
+        self._set_layout()
+
+    @property
+    def n_fft(self):
+        """Number of samples of the blocks transformed to compute the spectrum.
+
+        :type: :class:`int` | None
+        """
+        return self._n_fft
+
+    @n_fft.setter
+    def n_fft(self, n_fft):
+        if n_fft is not None:
+            n_fft = ensure_int(n_fft, "n_fft")
+            if not 2 <= n_fft <= self._scope.duration_buffer_samples:
+                raise ValueError(
+                    "The number of samples of the FFT blocks must be at least 2 and "
+                    "shorter than the scope's buffer "
+                    f"({self._scope.duration_buffer_samples} samples). {n_fft} is "
+                    "invalid."
+                )
+            if self._hop is not None and n_fft < self._hop:
+                raise ValueError(
+                    f"The number of samples of the FFT blocks {n_fft} must be larger "
+                    f"than the hop size {self._hop}."
+                )
+        self._n_fft = n_fft
+        self._set_layout()
+
+    @property
+    def hop(self):
+        """Number of samples between the start of 2 consecutive blocks.
+
+        :type: :class:`int` | None
+        """
+        if self._n_fft is None:
+            return None
+        return max(self._n_fft // 2, 1) if self._hop is None else self._hop
+
+    @hop.setter
+    def hop(self, hop):
+        if hop is not None:
+            hop = ensure_int(hop, "hop")
+            if hop <= 0 or (self._n_fft is not None and self._n_fft < hop):
+                raise ValueError(
+                    "The hop size must be strictly positive and at most the number of "
+                    f"samples of the FFT blocks ({self._n_fft}). {hop} is invalid."
+                )
+        self._hop = hop
+        self._set_layout()
+
+    @property
+    def frame_rate(self):
+        """Target number of frames produced per second.
+
+        :type: :class:`float`
+        """
+        return self._frame_rate
+
+    @frame_rate.setter
+    def frame_rate(self, frame_rate):
+        check_type(frame_rate, ("numeric",), "frame_rate")
+        if frame_rate <= 0:
+            raise ValueError(
+                f"The frame rate must be strictly positive. {frame_rate} is invalid."
+            )
+        self._frame_rate = frame_rate
+
+    @property
+    def markers(self):
+        """Marker streams overlaid as events.
+
+        :type: :class:`list` of :class:`~mne_lsl.stream.StreamLSL` |
+            :class:`~mne_lsl.lsl.StreamInlet`
+        """
+        return self._markers
+
+    @property
+    def running(self):
+        """True if the engine is producing frames.
+
+        :type: :class:`bool`
+        """
+        return not self._interrupt
+
+
+class _EngineLoop:
+    """Update several engines one after the other in a single daemonic thread.
+
+    The streams of the engines are acquired and their frames are composed in the same
+    loop, at the frame rate of the fastest engine.
+
+    Parameters
+    ----------
+    engines : list of ViewerEngine
+        Engines updated by the loop. An engine is updated by a single loop.
+    """
+
+    def __init__(self, engines):
+        self._engines = list(engines)
+        self._thread = None
+        self._interrupt = True
+
+    def start(self):
+        """Start the updates in a daemonic thread."""
+        for engine in self._engines:
+            if engine._loop is not None and engine.running:
+                engine._loop.stop()
+            engine._loop = self
+            engine._interrupt = False
+        self._interrupt = False
+        self._create_thread(0)
+
+    def stop(self):
+        """Stop the updates and wait for the termination of the thread."""
+        self._interrupt = True
+        while self._thread is not None:
+            thread = self._thread
+            thread.cancel()
+            if thread.ident is not None:  # the thread might not be started yet
+                thread.join()
+            if thread is self._thread:
+                break
+        for engine in self._engines:
+            engine._interrupt = True
+            engine._new_frame.set()  # wake up the iterators
+
+    def _pull_inlets(self):
+        """Pull the marker inlets of the engines, each inlet once.
+
+        A pull consumes the samples of an inlet, thus the samples are pulled once and
+        given to every engine overlaying the inlet.
+        """
+        chunks = dict()
+        for engine in self._engines:
+            for marker in engine.markers:
+                if not isinstance(marker, StreamInlet) or id(marker) in chunks:
+                    continue
+                try:
+                    chunks[id(marker)] = _pull_markers(marker)
+                except Exception as error:
+                    logger.exception(error)
+        return chunks
+
+    def _create_thread(self, delay):
+        """Create and start the daemonic update thread."""
+        self._thread = Timer(delay, self._run)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _run(self):
+        """Update function called at a regular interval by the thread."""
+        chunks = self._pull_inlets()
+        for engine in self._engines:
+            try:
+                engine._update(chunks)
+            except Exception as error:
+                logger.exception(error)
+        if self._interrupt:
+            return None
+        # recreate the timer thread as it is one-call only
+        self._create_thread(1 / max(engine.frame_rate for engine in self._engines))
+
+
+def _pull_markers(inlet):
+    """Pull the labels of the first channel and the timestamps available in an inlet."""
+    data, timestamps = inlet.pull_chunk(timeout=0.0, strings_as_array=True)
+    return data[:, 0], timestamps
@@ -0,0 +1,74 @@
+import numpy as np
+
+
+class _RingBuffer:
+    """Fixed-size ring buffer storing samples along the last axis.
+
+    New samples overwrite the oldest ones in-place, thus writing a chunk costs a time
+    proportional to the chunk size instead of shifting the entire buffer with np.roll.
+
+    Parameters
+    ----------
+    shape : tuple of int
+        Shape of the buffer, the last axis being the samples.
+    dtype : dtype
+        Data type of the buffer.
+    """
+
+    def __init__(self, shape, dtype=np.float64):
+        self._data = np.zeros(shape, dtype=dtype)
+        self._idx = 0  # position of the oldest sample, where the next one is written
+
+    def write(self, data):
+        """Write new samples, of shape (..., n_samples), in the buffer."""
+        size = self._data.shape[-1]
+        data = data[..., -size:]
+        n_samples = data.shape[-1]
+        stop = self._idx + n_samples
+        if stop <= size:
+            self._data[..., self._idx : stop] = data
+        else:
+            self._data[..., self._idx :] = data[..., : size - self._idx]
+            self._data[..., : stop - size] = data[..., size - self._idx :]
+        self._idx = stop % size
+
+    def get(self, n_samples=None):
+        """Get the last samples in chronological order.
+
+        The returned array is a view if the samples are contiguous in memory, and a
+        copy if they wrap around the end of the buffer.
+        """
+        size = self._data.shape[-1]
+        n_samples = size if n_samples is None else min(n_samples, size)
+        start = self._idx - n_samples
+        if 0 <= start:
+            return self._data[..., start : self._idx]
+        if self._idx == 0:
+            return self._data[..., start:]
+        return np.concatenate(
+            (self._data[..., start:], self._data[..., : self._idx]), axis=-1
+        )
+
+    def get_oldest(self, n_samples):
+        """Get a copy of the oldest samples in chronological order."""
+        n_samples = min(n_samples, self._data.shape[-1])
+        return np.take(
+            self._data,
+            np.arange(self._idx, self._idx + n_samples),
+            axis=-1,
+            mode="wrap",
+        )
+
+    def sum(self):
+        """Sum of the samples in the buffer, along the last axis."""
+        return self._data.sum(axis=-1)
+
+    def reset(self):
+        """Reset the buffer to zeros."""
+        self._data.fill(0)
+        self._idx = 0
+
+    @property
+    def size(self):
+        """Number of samples in the buffer."""
+        return self._data.shape[-1]
@@ -0,0 +1,60 @@
+import numpy as np
+
+from ._ring_buffer import _RingBuffer
+
+
+class _RunningMean:
+    """Causal moving average over a sliding window of samples.
+
+    The sum over the window is updated with the samples entering and leaving the
+    window, thus the cost of an update is proportional to the number of new samples
+    instead of the window length. Subtracting the moving average from the signal acts
+    as a high-pass filter removing the drifts slower than the window.
+
+    Parameters
+    ----------
+    n_channels : int
+        Number of channels.
+    window : int
+        Number of samples in the sliding window.
+    """
+
+    def __init__(self, n_channels, window):
+        self._buffer = _RingBuffer((n_channels, window), dtype=np.float64)
+        self._sum = np.zeros(n_channels)
+        self._n_samples = 0  # number of samples in the window, until it is full
+        self._n_samples_resync = 0
+
+    def update(self, data):
+        """Add new samples of shape (channels, samples) and return their mean.
+
+        Returns
+        -------
+        mean : array of shape (channels, samples)
+            Mean of the window ending at each new sample.
+        """
+        window = self._buffer.size
+        n_samples = data.shape[-1]
+        # the buffer is filled with zeros until the window is full, thus the samples
+        # leaving the window do not need to be distinguished during the warm-up.
+        leaving = self._buffer.get_oldest(n_samples)
+        if window < n_samples:
+            leaving = np.concatenate((leaving, data[:, : n_samples - window]), axis=-1)
+        csum = np.cumsum(data - leaving, axis=-1)
+        csum += self._sum[:, np.newaxis]
+        count = np.minimum(np.arange(1, n_samples + 1) + self._n_samples, window)
+        self._sum = csum[:, -1]
+        self._n_samples = count[-1]
+        self._buffer.write(data)
+        # the rounding errors accumulate in the running sum, which is thus recomputed
+        # once per window, i.e. at an amortized cost of 1 operation per sample.
+        self._n_samples_resync += n_samples
+        if window <= self._n_samples_resync:
+            self._sum = self._buffer.sum()
+            self._n_samples_resync = 0
+        return csum / count
+
+    @property
+    def window(self):
+        """Number of samples in the sliding window."""
+        return self._buffer.size
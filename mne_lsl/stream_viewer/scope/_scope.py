@@ -1,6 +1,8 @@
 import math
 from abc import ABC, abstractmethod
 
+import numpy as np
+
 from ...utils.logs import logger
 
 _BUFFER_DURATION = 30  # seconds
@@ -11,24 +13,29 @@ class _Scope(ABC):
 
     Parameters
     ----------
-    inlet : StreamInlet
+    stream : StreamLSL
+        Connected stream from which the new samples are retrieved at every update. The
+        stream can be shared with other consumers, e.g. an acquisition process.
     """
 
     # ---------------------------- INIT ----------------------------
     @abstractmethod
-    def __init__(self, inlet):
-        self._inlet = inlet
-        self._stream_name = self._inlet.get_sinfo().name
+    def __init__(self, stream):
+        self._stream = stream
+        self._stream_name = self._stream.sinfo.name
 
         # Infos from stream
-        self._sample_rate = self._inlet.get_sinfo().sfreq
+        self._sample_rate = self._stream.info["sfreq"]
 
         # Variables
         self._duration_buffer = _BUFFER_DURATION
         self._duration_buffer_samples = math.ceil(_BUFFER_DURATION * self._sample_rate)
+        # the buffer of the stream is empty (zeros) until the first samples are
+        # acquired, and the samples are retrieved based on their timestamps.
+        self._last_ts = 0
 
         # Buffers
-        self._ts_list = list()
+        self._ts_list = np.empty(0)
 
         logger.debug("Scope connected to %s", self._stream_name)
         logger.debug("Data sample rate is %f", self._sample_rate)
@@ -45,14 +52,24 @@ class _Scope(ABC):
 
     @abstractmethod
     def _read_lsl_stream(self):
-        """Acquires data from the connected LSL stream."""
-        # (n_samples, n_channels)
-        self._data_acquired, self._ts_list = self._inlet.pull_chunk()
-
-        if len(self._ts_list) > 0:
+        """Retrieve the new samples from the buffer of the connected stream."""
+        # the new samples are selected based on their timestamps, thus the number of
+        # new samples of the stream is left untouched for other consumers.
+        data, self._ts_list = self._stream._get_data_since(
+            self._last_ts, self._picks_stream
+        )
+        self._data_acquired = data.T  # (n_samples, n_channels)
+
+        if self._ts_list.size > 0:
+            self._last_ts = self._ts_list[-1]
             logger.debug("Signal acquired by the scope.")
 
     # --------------------------------------------------------------------
+    @property
+    def stream(self):
+        """Connected stream."""
+        return self._stream
+
     @property
     def stream_name(self):
         """Name of the connected stream."""
@@ -75,5 +92,5 @@ class _Scope(ABC):
 
     @property
     def ts_list(self):
-        """Timestamps buffer [samples, ]."""
+        """Timestamps of the samples acquired at the last update [samples, ]."""
         return self._ts_list
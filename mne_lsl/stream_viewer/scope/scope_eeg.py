@@ -5,9 +5,12 @@ from scipy.signal import butter, sosfilt, sosfilt_zi
 
 from ...utils._docs import copy_doc
 from ...utils.logs import logger
+from ._ring_buffer import _RingBuffer
+from ._running_mean import _RunningMean
 from ._scope import _Scope
 
 BP_ORDER = 2
+DETREND_WINDOW = 2  # seconds
 
 
 class ScopeEEG(_Scope):
@@ -15,14 +18,16 @@ class ScopeEEG(_Scope):
 
     Parameters
     ----------
-    inlet : StreamInlet
+    stream : StreamLSL
+        Connected stream from which the new samples are retrieved at every update.
     """
 
     # ---------------------------- INIT ----------------------------
-    def __init__(self, inlet):
-        super().__init__(inlet)
+    def __init__(self, stream):
+        super().__init__(stream)
 
-        self._channels_labels = self._inlet.get_sinfo().get_channel_names()
+        self._channels_labels = list(self._stream.ch_names)
+        self._picks_stream = np.arange(len(self._channels_labels))
         self._picks = list(range(len(self._channels_labels)))
         # patch for CB classic trigger channel on ANT devices:
         if "TRIGGER" in self._channels_labels:
@@ -38,14 +43,14 @@ class ScopeEEG(_Scope):
         self._apply_bandpass = False
         self._apply_car = False
         self._apply_detrend = False
-        self._detrend_mean = None
+        self._detrend_window = DETREND_WINDOW
+        self._running_mean = None
         self._selected_channels = list(range(self._nb_channels))
 
-        # Buffers
-        self._trigger_buffer = np.zeros(self._duration_buffer_samples)
-        self._data_buffer = np.zeros(
-            (self._nb_channels, self._duration_buffer_samples),
-            dtype=np.float32,
+        # Buffers, written in-place with the new samples
+        self._trigger_buffer = _RingBuffer(self._duration_buffer_samples)
+        self._data_buffer = _RingBuffer(
+            (self._nb_channels, self._duration_buffer_samples), dtype=np.float32
         )
 
     def init_bandpass_filter(self, low, high):
@@ -79,14 +84,10 @@ class ScopeEEG(_Scope):
             if self._tch is not None:
                 self._filter_trigger()
             # shape (channels, samples)
-            self._data_buffer = np.roll(self._data_buffer, -len(self._ts_list), axis=1)
-            self._data_buffer[:, -len(self._ts_list) :] = self._data_acquired.T
+            self._data_buffer.write(self._data_acquired.T)
             # shape (samples, )
             if self._tch is not None:
-                self._trigger_buffer = np.roll(
-                    self._trigger_buffer, -len(self._ts_list)
-                )
-                self._trigger_buffer[-len(self._ts_list) :] = self._trigger_acquired
+                self._trigger_buffer.write(self._trigger_acquired)
 
     @copy_doc(_Scope._read_lsl_stream)
     def _read_lsl_stream(self):
@@ -97,26 +98,21 @@ class ScopeEEG(_Scope):
         super()._read_lsl_stream()
         # Remove trigger ch - shapes (samples, ) and (samples, channels)
         if self._tch is not None:
-            self._trigger_acquired = self._data_acquired[:, self._tch]
+            self._trigger_acquired = self._data_acquired[:, self._tch].copy()
         self._data_acquired = self._data_acquired[:, self._picks].reshape(
             (-1, self._nb_channels)
         )
 
     def _filter_signal(self):
         """Apply bandpass and CAR filter to the signal acquired if needed."""
-        if self._apply_detrend:
-            if self._detrend_mean is None:
-                raise RuntimeError(
-                    "The variable _detrend_mean should not be None if "
-                    "the detrending checkbox is ticked. Please contact a developer. "
-                )
-            # shape (channels, samples)
-            self._detrend_mean = np.roll(
-                self._detrend_mean, -len(self._ts_list), axis=1
-            )
-            self._detrend_mean[:, -len(self._ts_list) :] = self._data_acquired.T
-            if not np.all(self._detrend_mean[:, 0] == 0):
-                self._data_acquired -= np.mean(self._detrend_mean, axis=1)
+        # the setters can replace the running mean between 2 updates of the engine,
+        # thus it is read once.
+        running_mean = self._running_mean
+        if self._apply_detrend and running_mean is not None:
+            # shape (channels, samples), the moving average is updated in a time
+            # proportional to the number of new samples.
+            mean = running_mean.update(self._data_acquired.T)
+            self._data_acquired -= mean.T
 
         if self._apply_bandpass:
             if self._zi is None:
@@ -182,14 +178,35 @@ class ScopeEEG(_Scope):
 
     @apply_detrend.setter
     def apply_detrend(self, apply_detrend):
-        self._apply_detrend = bool(apply_detrend)
-        if self._apply_detrend is True:
-            self._detrend_mean = np.zeros(
-                (self._nb_channels, math.ceil(2 * self._sample_rate)),
-                dtype=np.float32,
-            )
+        # the running mean is created before the flag is set and removed after the flag
+        # is unset, thus the flag never enables a missing running mean.
+        if apply_detrend:
+            self._running_mean = self._create_running_mean()
+            self._apply_detrend = True
         else:
-            self._detrend_mean = None
+            self._apply_detrend = False
+            self._running_mean = None
+
+    @property
+    def detrend_window(self):
+        """Length of the moving average removed by the detrending [seconds]."""
+        return self._detrend_window
+
+    @detrend_window.setter
+    def detrend_window(self, detrend_window):
+        if detrend_window <= 0:
+            raise ValueError(
+                "The detrending window must be strictly positive. "
+                f"{detrend_window} is invalid."
+            )
+        self._detrend_window = detrend_window
+        if self._apply_detrend:
+            self._running_mean = self._create_running_mean()
+
+    def _create_running_mean(self):
+        """Create the moving average removed by the detrending."""
+        window = max(math.ceil(self._detrend_window * self._sample_rate), 1)
+        return _RunningMean(self._nb_channels, window)
 
     @property
     def selected_channels(self):
@@ -200,12 +217,43 @@ class ScopeEEG(_Scope):
     def selected_channels(self, selected_channels):
         self._selected_channels = selected_channels
 
+    def get_data(self, n_samples=None):
+        """Get the last samples of the data buffer (channels, samples).
+
+        Parameters
+        ----------
+        n_samples : int | None
+            Number of samples to retrieve. If None, the entire buffer is returned.
+
+        Returns
+        -------
+        data : array of shape (channels, samples)
+            Data in chronological order. The array is a view on the buffer if the
+            samples are contiguous in memory, thus it should not be modified.
+        """
+        return self._data_buffer.get(n_samples)
+
+    def get_trigger(self, n_samples=None):
+        """Get the last samples of the trigger buffer (samples, ).
+
+        Parameters
+        ----------
+        n_samples : int | None
+            Number of samples to retrieve. If None, the entire buffer is returned.
+
+        Returns
+        -------
+        trigger : array of shape (samples,)
+            Trigger values in chronological order.
+        """
+        return self._trigger_buffer.get(n_samples)
+
     @property
     def data_buffer(self):
-        """Data buffer (channels, samples)."""
-        return self._data_buffer
+        """Data buffer (channels, samples) in chronological order."""
+        return self._data_buffer.get()
 
     @property
     def trigger_buffer(self):
-        """Trigger buffer (samples, )."""
-        return self._trigger_buffer
+        """Trigger buffer (samples, ) in chronological order."""
+        return self._trigger_buffer.get()
@@ -0,0 +1,38 @@
+import numpy as np
+from numpy.testing import assert_array_equal
+
+from mne_lsl.stream_viewer.scope._ring_buffer import _RingBuffer
+
+
+def test_ring_buffer():
+    """Test writing and reading from the ring buffer."""
+    buffer = _RingBuffer((2, 10))
+    assert buffer.size == 10
+    assert_array_equal(buffer.get(), np.zeros((2, 10)))
+    data = np.arange(24).reshape(2, 12)
+    # chunks wrapping around the end of the buffer
+    buffer.write(data[:, :4])
+    assert_array_equal(buffer.get(4), data[:, :4])
+    assert np.shares_memory(buffer.get(4), buffer._data)
+    buffer.write(data[:, 4:11])
+    assert_array_equal(buffer.get(), data[:, 1:11])
+    assert_array_equal(buffer.get(3), data[:, 8:11])
+    assert_array_equal(buffer.get(100), data[:, 1:11])
+    assert_array_equal(buffer.get_oldest(3), data[:, 1:4])
+    assert_array_equal(buffer.get_oldest(100), data[:, 1:11])
+    assert_array_equal(buffer.sum(), data[:, 1:11].sum(axis=-1))
+    # chunk larger than the buffer
+    buffer.write(np.arange(30).reshape(2, 15))
+    assert_array_equal(buffer.get(), np.arange(30).reshape(2, 15)[:, -10:])
+    # chunk ending exactly at the end of the buffer
+    buffer.reset()
+    buffer.write(data[:, :10])
+    assert buffer._idx == 0
+    assert_array_equal(buffer.get(), data[:, :10])
+    assert_array_equal(buffer.get(2), data[:, 8:10])
+    assert_array_equal(buffer.get(0), np.empty((2, 0)))
+    # 1D buffer
+    buffer = _RingBuffer(5)
+    buffer.write(np.arange(3))
+    buffer.write(np.arange(3, 6))
+    assert_array_equal(buffer.get(), np.arange(1, 6))
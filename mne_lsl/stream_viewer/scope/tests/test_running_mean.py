@@ -0,0 +1,24 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from mne_lsl.stream_viewer.scope._running_mean import _RunningMean
+
+
+@pytest.mark.parametrize("window", [1, 7, 50])
+def test_running_mean(window):
+    """Test the running mean against the mean over the sliding window."""
+    rng = np.random.default_rng(0)
+    data = rng.standard_normal((3, 500)) + np.linspace(0, 100, 500)
+    running_mean = _RunningMean(3, window)
+    assert running_mean.window == window
+    means = list()
+    # chunks smaller and larger than the window
+    for chunk in np.array_split(data, np.cumsum([1, 5, 3, 80, 2, 120, 16]), axis=1):
+        means.append(running_mean.update(chunk))
+    means = np.concatenate(means, axis=1)
+    assert means.shape == data.shape
+    expected = np.array(
+        [data[:, max(k - window + 1, 0) : k + 1].mean(axis=1) for k in range(500)]
+    ).T
+    assert_allclose(means, expected)
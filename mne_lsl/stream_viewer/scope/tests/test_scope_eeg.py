@@ -6,8 +6,8 @@ import numpy as np
 import pytest
 
 from mne_lsl.datasets import testing
-from mne_lsl.lsl import StreamInlet, resolve_streams
 from mne_lsl.player import PlayerLSL as Player
+from mne_lsl.stream import StreamLSL
 from mne_lsl.stream_viewer.scope import ScopeEEG
 from mne_lsl.stream_viewer.scope._scope import _BUFFER_DURATION
 
@@ -17,10 +17,9 @@ def test_scope_eeg():
     stream_name = "StreamPlayer"
 
     with Player(testing.data_path() / "sample-eeg-ant-raw.fif", stream_name):
-        streams = resolve_streams()
-        inlet = StreamInlet(streams[0])
-        inlet.open_stream()
-        scope = ScopeEEG(inlet)
+        stream = StreamLSL(2, name=stream_name)
+        stream.connect()
+        scope = ScopeEEG(stream)
 
         # test init of BP filter
         assert not hasattr(scope, "_sos")
@@ -34,12 +33,27 @@ def test_scope_eeg():
 
         # test update loop
         assert len(scope._ts_list) == 0
-        assert (scope._trigger_buffer == 0).all()
-        assert (scope._data_buffer == 0).all()
+        assert (scope.trigger_buffer == 0).all()
+        assert (scope.data_buffer == 0).all()
         time.sleep(0.2)
         scope.update_loop()
         assert len(scope._ts_list) != 0
-        assert (scope._data_buffer != 0).any()
+        assert (scope.data_buffer != 0).any()
+        n_samples = len(scope._ts_list)
+        assert (scope.get_data(n_samples) != 0).all()
+        assert (scope.data_buffer[:, :-n_samples] == 0).all()
+
+        # the new samples are retrieved even if another consumer reset the number of
+        # new samples in the stream buffer
+        time.sleep(0.2)
+        last_ts = scope._ts_list[-1]
+        stream.get_data()
+        time.sleep(0.1)
+        scope.update_loop()
+        assert len(scope._ts_list) != 0
+        assert np.all(last_ts < scope._ts_list)
+        sfreq = stream.info["sfreq"]
+        assert np.allclose(scope._ts_list[0] - last_ts, 1 / sfreq, rtol=0.5)
 
         # car and BP were off
         assert scope._zi is None
@@ -62,10 +76,22 @@ def test_scope_eeg():
         scope.update_loop()
         assert scope._zi is not None
 
+        # test apply detrend
+        time.sleep(0.2)
+        scope.apply_detrend = True
+        assert scope._running_mean.window == math.ceil(2 * sfreq)
+        scope.update_loop()
+        assert scope._running_mean._n_samples == len(scope._ts_list)
+        scope.detrend_window = 0.5
+        assert scope._running_mean.window == math.ceil(0.5 * sfreq)
+        scope.apply_detrend = False
+        assert scope._running_mean is None
+
         # test selection of channel
         time.sleep(0.2)
         n = len(scope._selected_channels)
         scope._selected_channels = scope._selected_channels[: n // 2]
+        stream.disconnect()
 
 
 def test_buffer_duration():
@@ -77,14 +103,18 @@ def test_buffer_duration():
     sfreq = raw.info["sfreq"]
 
     with Player(testing.data_path() / "sample-eeg-ant-raw.fif", stream_name):
-        streams = resolve_streams()
-        inlet = StreamInlet(streams[0])
-        inlet.open_stream()
-        scope = ScopeEEG(inlet)
-        assert scope.sample_rate == inlet.get_sinfo().sfreq
+        stream = StreamLSL(2, name=stream_name)
+        stream.connect()
+        scope = ScopeEEG(stream)
+        assert scope.sample_rate == stream.info["sfreq"]
 
         assert scope.duration_buffer == _BUFFER_DURATION
         assert scope.duration_buffer_samples == math.ceil(_BUFFER_DURATION * sfreq)
+        assert scope.data_buffer.shape == (
+            scope.nb_channels,
+            scope.duration_buffer_samples,
+        )
+        stream.disconnect()
 
 
 def test_properties():
@@ -95,29 +125,33 @@ def test_properties():
     )
 
     with Player(testing.data_path() / "sample-eeg-ant-raw.fif", stream_name):
-        streams = resolve_streams()
-        inlet = StreamInlet(streams[0])
-        inlet.open_stream()
-        scope = ScopeEEG(inlet)
+        stream = StreamLSL(2, name=stream_name)
+        stream.connect()
+        scope = ScopeEEG(stream)
 
+        assert scope.stream is stream
         assert scope.stream_name == scope._stream_name == stream_name
         assert scope.sample_rate == scope._sample_rate
         assert scope.duration_buffer == scope._duration_buffer
         assert scope.duration_buffer_samples == scope._duration_buffer_samples
-        assert scope.ts_list == scope._ts_list == list()
+        assert scope.ts_list is scope._ts_list
+        assert scope.ts_list.size == 0
         assert scope.channels_labels == scope._channels_labels == raw.ch_names[:-1]
         assert scope.nb_channels == scope._nb_channels == len(raw.ch_names[1:])
         assert scope.apply_car == scope._apply_car
         assert not scope.apply_car
         assert scope.apply_bandpass == scope._apply_bandpass
         assert not scope.apply_bandpass
+        assert scope.apply_detrend == scope._apply_detrend
+        assert not scope.apply_detrend
+        assert scope.detrend_window == scope._detrend_window == 2
         assert (
             scope.selected_channels
             == scope._selected_channels
             == list(range(scope.nb_channels))
         )
-        assert (scope.data_buffer == scope._data_buffer).all()
-        assert (scope.trigger_buffer == scope._trigger_buffer).all()
+        assert (scope.data_buffer == scope._data_buffer.get()).all()
+        assert (scope.trigger_buffer == scope._trigger_buffer.get()).all()
 
         with pytest.raises(AttributeError):
             scope.stream_name = "new name"
@@ -137,6 +171,12 @@ def test_properties():
         assert scope.apply_car
         scope.apply_bandpass = True
         assert scope.apply_bandpass
+        scope.apply_detrend = True
+        assert scope.apply_detrend
+        scope.detrend_window = 1
+        assert scope.detrend_window == 1
+        with pytest.raises(ValueError, match="must be strictly positive"):
+            scope.detrend_window = 0
         scope.selected_channels = list(range(scope.nb_channels // 2))
         assert scope.selected_channels == list(range(scope.nb_channels // 2))
         with pytest.raises(AttributeError):
@@ -146,3 +186,4 @@ def test_properties():
             )
         with pytest.raises(AttributeError):
             scope.trigger_buffer = np.ones(scope._duration_buffer_samples)
+        stream.disconnect()
@@ -1,33 +1,68 @@
 import sys
-import time
 
 from qtpy.QtWidgets import QApplication
 
 from ..lsl import StreamInlet, resolve_streams
+from ..stream import StreamLSL
 from ..utils._checks import check_type
 from ..utils.logs import _use_log_level, logger
 from .control_gui.control_eeg import ControlGUI_EEG
-from .scope.scope_eeg import ScopeEEG
+from .engine import ViewerEngine
+
+# the streams created by the viewer are acquired faster than the frames are drawn, thus
+# the frames are not delayed by the acquisition.
+_ACQUISITION_DELAY = 0.01  # seconds
 
 
 class StreamViewer:
-    """Class for visualizing the signals coming from an LSL stream.
+    """Class for visualizing the signals coming from LSL streams.
 
-    The stream viewer will connect to only one LSL stream. If ``stream_name``
-    is set to ``None``, an automatic search is performed followed by a prompt
-    if multiple non-markers streams are found.
+    The stream viewer connects to one or several LSL streams. The streams with a regular
+    sampling rate are displayed in stacked panes, aligned on their LSL timestamps, and
+    the streams with an irregular sampling rate, e.g. marker streams, are overlaid as
+    events on every pane. All the streams are acquired and displayed by a single loop.
+    If ``stream_name`` is set to ``None``, an automatic search is performed followed by
+    a prompt if multiple streams are found.
 
     Parameters
     ----------
-    stream_name : str | None
+    stream_name : str | list of str | None
         Servers' name to connect to. ``None`` will prompt the user.
+    stream : StreamLSL | list of StreamLSL | None
+        Connected :class:`~mne_lsl.stream.StreamLSL` to visualize. If provided,
+        ``stream_name`` is ignored and the viewer attaches to the streams, e.g. the
+        stream of an acquisition process, without opening a second inlet. The streams
+        are left connected when the viewer is closed. The streams must share the same
+        clock to be aligned, e.g. by connecting them with the ``'clocksync'`` processing
+        flag.
     """
 
-    def __init__(self, stream_name=None):
-        self._sinfo = StreamViewer._check_stream_name(stream_name)
+    def __init__(self, stream_name=None, stream=None):
+        if isinstance(stream, StreamLSL):
+            stream = [stream]
+        check_type(stream, (list, tuple, None), "stream")
+        if stream is None:
+            self._sinfos = StreamViewer._check_stream_name(stream_name)
+        else:
+            if len(stream) == 0:
+                raise ValueError("At least one stream must be provided.")
+            for stream_ in stream:
+                check_type(stream_, (StreamLSL,), "stream")
+                if not stream_.connected:
+                    raise RuntimeError(
+                        "The streams must be connected before being attached to the "
+                        "viewer."
+                    )
+            self._sinfos = [stream_.sinfo for stream_ in stream]
+            stream = list(stream)
+        if all(sinfo.sfreq == 0 for sinfo in self._sinfos):
+            raise RuntimeError(
+                "At least one stream with a regular sampling rate must be displayed."
+            )
+        self._streams = stream
 
-    def start(self, bufsize=0.2):
-        """Connect to the selected amplifier and plot the streamed data.
+    def start(self, bufsize=5):
+        """Connect to the selected amplifiers and plot the streamed data.
 
         If ``stream_name`` is not provided, look for available streams on the
         network.
@@ -35,41 +70,86 @@ class StreamViewer:
         Parameters
         ----------
         bufsize : int | float
-            Buffer/window size of the attached Viewer.
-            The default ``0.2`` should work in most cases since data is fetched
-            every 20 ms.
+            Size of the buffer (in seconds) of the :class:`~mne_lsl.stream.StreamLSL`
+            created to acquire the data. The buffer must hold the samples acquired
+            between 2 updates of the viewer. Ignored if connected streams were
+            provided, and for the streams with an irregular sampling rate, which are
+            read with a :class:`~mne_lsl.lsl.StreamInlet` to support string markers.
         """
-        self._inlet = StreamInlet(self._sinfo)
-        self._inlet.open_stream()
-        time.sleep(bufsize)  # Delay to fill the LSL buffer.
-        self._scope = ScopeEEG(self._inlet)
+        if self._streams is None:
+            streams = list()
+            for sinfo in self._sinfos:
+                if sinfo.sfreq == 0:
+                    # the marker streams are corrected to the local clock only, as the
+                    # dejittering assumes a regular sampling rate.
+                    stream = StreamInlet(sinfo, processing_flags=["clocksync"])
+                    stream.open_stream()
+                    # initiate the time correction, else the first pull blocks the loop
+                    stream.time_correction()
+                    streams.append(stream)
+                    continue
+                stream = StreamLSL(
+                    bufsize,
+                    name=sinfo.name,
+                    stype=sinfo.stype,
+                    source_id=sinfo.source_id,
+                )
+                # the timestamps are corrected to the local clock to align the streams
+                stream.connect(
+                    processing_flags="all", acquisition_delay=_ACQUISITION_DELAY
+                )
+                streams.append(stream)
+        else:
+            streams = self._streams
+        markers, displayed = list(), list()
+        for stream in streams:
+            if isinstance(stream, StreamInlet) or stream.info["sfreq"] == 0:
+                markers.append(stream)
+            else:
+                displayed.append(stream)
+        self._engines = [ViewerEngine(stream, markers=markers) for stream in displayed]
         app = QApplication(sys.argv)
-        self._ui = ControlGUI_EEG(self._scope)
-        sys.exit(app.exec_())
+        self._ui = ControlGUI_EEG(self._engines)
+        code = app.exec_()
+        if self._streams is None:
+            for stream in streams:
+                if isinstance(stream, StreamInlet):
+                    stream.close_stream()
+                else:
+                    stream.disconnect()
+        sys.exit(code)
 
     # --------------------------------------------------------------------
     @staticmethod
     def _check_stream_name(stream_name):  # noqa
         """
-        Check that the stream_name is valid or search for a valid stream on
+        Check that the stream_name is valid or search for valid streams on
         the network.
         """
-        check_type(stream_name, (None, str), item_name="stream_name")
+        check_type(stream_name, (None, str, list, tuple), item_name="stream_name")
+        if isinstance(stream_name, (list, tuple)):
+            sinfos = list()
+            for name in stream_name:
+                check_type(name, (str,), item_name="stream_name")
+                streams = resolve_streams(name=name)
+                if len(streams) == 0:
+                    raise RuntimeError(f"No LSL stream '{name}' found.")
+                sinfos.append(streams[0])
+            return sinfos
         streams = resolve_streams(name=stream_name)
         if len(streams) == 0:
             raise RuntimeError("No LSL stream found.")
         elif len(streams) == 1:
-            return streams[0]
+            return streams
         else:
             with _use_log_level("INFO"):
                 logger.info("-- List of servers --")
                 for k, stream in enumerate(streams):
                     logger.info("%i: %s", k, stream.name)
             index = input(
-                "Stream index? Hit enter without index to select the first server.\n>> "
+                "Stream indices? Separate several indices with commas. Hit enter "
+                "without index to select the first server.\n>> "
             )
             if index.strip() == "":
-                index = 0
-            else:
-                index = int(index.strip())
-            return streams[index]
+                return [streams[0]]
+            return [streams[int(idx.strip())] for idx in index.split(",")]
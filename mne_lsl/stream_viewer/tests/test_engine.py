@@ -0,0 +1,183 @@
+import time
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from mne_lsl.datasets import testing
+from mne_lsl.lsl import StreamInfo, StreamInlet, StreamOutlet, local_clock
+from mne_lsl.player import PlayerLSL as Player
+from mne_lsl.stream import StreamLSL
+from mne_lsl.stream_viewer import ViewerEngine
+from mne_lsl.stream_viewer.engine import _EngineLoop
+
+
+def test_engine():
+    """Test the production of frames by the headless engine."""
+    stream_name = "StreamPlayer"
+
+    with Player(testing.data_path() / "sample-eeg-ant-raw.fif", stream_name):
+        stream = StreamLSL(2, name=stream_name)
+        with pytest.raises(RuntimeError, match="must be connected"):
+            ViewerEngine(stream)
+        stream.connect()
+        engine = ViewerEngine(stream, duration=2, n_points=100, frame_rate=50)
+        assert engine.stream is stream
+        assert engine.picks == list(range(engine.scope.nb_channels))
+        assert engine._acquire_frame() is None
+        assert not engine.running
+        engine.picks = [0, 2, 3]
+        with pytest.raises(ValueError, match="channel index"):
+            engine.picks = [engine.scope.nb_channels]
+        with pytest.raises(ValueError, match="Invalid value"):
+            engine.mode = "101"
+        with pytest.raises(ValueError, match="duration"):
+            engine.duration = engine.scope.duration_buffer + 1
+        with pytest.raises(ValueError, match="frame rate"):
+            engine.frame_rate = 0
+        assert engine.n_fft is None and engine.hop is None
+        with pytest.raises(ValueError, match="FFT blocks"):
+            engine.n_fft = 1
+        engine.n_fft = 128
+        assert engine.hop == 64
+        with pytest.raises(ValueError, match="hop size"):
+            engine.hop = 129
+        engine.hop = 32
+
+        # frames are produced by the thread and passed to the callback
+        frames = list()
+        engine.start(callback=lambda frame: frames.append(frame.n_samples))
+        assert engine.running
+        time.sleep(0.5)
+        engine.stop()
+        assert not engine.running
+        assert not engine._loop._thread.is_alive()
+        assert 0 < len(frames)
+        frame = engine._acquire_frame()
+        assert frame is not None
+        assert frame.n_samples == frames[-1] == engine._n_samples
+        assert frame.picks == [0, 2, 3]
+        assert frame.data.shape == (3, frame.times.size)
+        assert frame.times.size <= 200
+        assert frame.timestamp == engine._timestamp
+        # the bins cover the window, the newest sample on its right edge
+        fill = engine._envelope.last_fill
+        assert frame.position <= 0
+        sfreq = engine.scope.sample_rate
+        assert_allclose(frame.position + frame.times[-1] + fill / sfreq, 2)
+        # the newest bin matches the last samples acquired
+        data = engine.scope.get_data(fill)[[0, 2, 3]]
+        assert np.allclose(frame.data[:, -1], data.max(axis=-1))
+        assert np.allclose(frame.data[:, -2], data.min(axis=-1))
+        assert engine._acquire_frame() is None
+        # the spectrum of the window is averaged from the FFT blocks
+        n_blocks = (int(2 * engine.scope.sample_rate) - 128) // 32 + 1
+        assert_allclose(frame.freqs, np.fft.rfftfreq(128, 1 / engine.scope.sample_rate))
+        assert frame.psd.shape == (3, 65)
+        assert frame.spectrogram.shape == (n_blocks, 65)
+        assert np.isfinite(frame.psd).all()
+        assert_allclose(
+            frame.psd.mean(axis=0), frame.spectrogram.mean(axis=0), rtol=1e-6
+        )
+        # the events in the window are positioned from their sample index
+        assert frame.event_times.shape == frame.event_values.shape
+        assert np.all((0 <= frame.event_times) & (frame.event_times <= 2))
+        assert np.all(frame.event_values != 0)
+        events = engine._events.events
+        assert np.all(events["sample"] < engine._n_samples)
+        times = 2 - (frame.n_samples - events["sample"]) / engine.scope.sample_rate
+        assert np.allclose(frame.event_times, times[0 <= times])
+
+        # a new layout is applied at the next update
+        time.sleep(0.1)
+        engine.picks = [1]
+        engine.mode = "sweep"
+        engine.n_points = 50
+        engine.n_fft = None
+        engine._update()
+        frame = engine._acquire_frame()
+        assert frame.picks == [1]
+        assert frame.position == 0
+        assert frame.times.size <= 100
+        assert np.isnan(frame.data).any()
+        assert frame.psd.shape == (1, 0)
+        assert frame.spectrogram.shape == (0, 0)
+        period = engine._envelope.n_bins * engine._envelope.bin_size / sfreq
+        assert np.all((0 <= frame.event_times) & (frame.event_times <= period))
+
+        # the iterator yields the last frame until the engine is stopped
+        engine.start()
+        n_samples = 0
+        for k, frame in enumerate(engine.iter_frames(timeout=1)):
+            assert n_samples < frame.n_samples
+            n_samples = frame.n_samples
+            if k == 4:
+                engine.stop()
+        assert k == 4
+        assert list(engine.iter_frames(timeout=0.1)) == []
+        stream.disconnect()
+
+
+def test_engine_markers():
+    """Test the overlay of marker streams and the loop shared between engines."""
+    stream_name = "StreamPlayer"
+
+    with Player(testing.data_path() / "sample-eeg-ant-raw.fif", stream_name):
+        sinfo = StreamInfo("Markers", "Markers", 1, 0, "float32", "markers")
+        outlet = StreamOutlet(sinfo)
+        stream = StreamLSL(2, name=stream_name)
+        stream.connect()
+        marker = StreamLSL(10, name="Markers")
+        marker.connect()
+        # the string marker streams are read with an inlet
+        sinfo = StreamInfo("Labels", "Markers", 1, 0, "string", "labels")
+        outlet_labels = StreamOutlet(sinfo)
+        inlet = StreamInlet(sinfo, processing_flags=["clocksync"])
+        inlet.open_stream(timeout=5)
+        inlet.time_correction(timeout=5)
+        with pytest.raises(ValueError, match="irregular sampling rate"):
+            ViewerEngine(stream, markers=[stream])
+        engines = [
+            ViewerEngine(stream, duration=2, n_points=100, markers=[marker, inlet]),
+            ViewerEngine(stream, duration=1, n_points=50, markers=[inlet]),
+        ]
+        assert engines[0].markers == [marker, inlet]
+        loop = _EngineLoop(engines)
+        loop.start()
+        assert all(engine.running for engine in engines)
+        time.sleep(0.3)
+        outlet.push_sample(np.array([7.0], dtype=np.float32), local_clock())
+        outlet_labels.push_chunk([["left"], ["8"], ["left"]], local_clock())
+        time.sleep(0.5)
+        engines[1].stop()  # stops the shared loop
+        assert not any(engine.running for engine in engines)
+        assert not loop._thread.is_alive()
+        frames = [engine._acquire_frame() for engine in engines]
+        assert frames[0].times.size <= 200
+        assert frames[1].times.size <= 100
+        # both engines acquired the same stream in the same loop
+        assert frames[0].timestamp == frames[1].timestamp
+        # the marker is positioned from its timestamp
+        assert 7 in engines[0]._events.events["value"]
+        assert 7 not in engines[1]._events.events["value"]
+        assert 7 in frames[0].event_values
+        idx = list(frames[0].event_values).index(7)
+        assert 1 < frames[0].event_times[idx] <= 2
+        assert frames[0].event_labels[idx] == "7"
+        # the labels of the string markers are displayed as text or as a value
+        # the inlet is pulled once per update and overlaid by both engines
+        for engine, frame in zip(engines, frames):
+            assert engine._labels == {"left": 0}
+            assert 8 in frame.event_values
+            assert frame.event_labels.count("left") == 2
+            assert frame.event_labels.count("8") == 1
+            assert len(frame.event_labels) == frame.event_values.size
+        inlet.close_stream()
+        marker.disconnect()
+        stream.disconnect()
+
+
+def test_engine_invalid():
+    """Test the validation of the engine's settings."""
+    with pytest.raises(TypeError, match="must be an instance of"):
+        ViewerEngine(101)
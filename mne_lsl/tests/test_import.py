@@ -0,0 +1,51 @@
+import subprocess
+import sys
+
+import pytest
+
+
+def _run(code):
+    """Run code in a new interpreter and return its standard output."""
+    return subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, check=True, text=True
+    ).stdout.strip()
+
+
+@pytest.mark.parametrize("module", ("mne_lsl", "mne_lsl.lsl", "mne_lsl.stream"))
+def test_import_lazy(module):
+    """Test that MNE is not imported and liblsl is not loaded on import."""
+    out = _run(
+        f"import sys; import {module}; from mne_lsl.lsl.load_liblsl import lib; "
+        "print('mne' in sys.modules, lib._lib is None)"
+    )
+    assert out == "False True"
+
+
+def test_import_on_access():
+    """Test that the subpackages and attributes are imported on first access."""
+    out = _run(
+        "import sys; import mne_lsl; "
+        "print(callable(mne_lsl.sys_info), mne_lsl.stream.StreamLSL.__name__, "
+        "mne_lsl.player.PlayerLSL.__name__, 'mne' in sys.modules)"
+    )
+    assert out == "True StreamLSL PlayerLSL True"
+    out = _run("from mne_lsl.lsl import local_clock; print(0 < local_clock())")
+    assert out == "True"
+
+
+def test_import_engine_without_qt():
+    """Test that the stream viewer engine does not import Qt."""
+    out = _run(
+        "import sys; from mne_lsl.stream_viewer import ViewerEngine; "
+        "print(any(module in sys.modules for module in ('qtpy', 'pyqtgraph')))"
+    )
+    assert out == "False"
+
+
+def test_import_invalid():
+    """Test access to an invalid attribute."""
+    import mne_lsl
+
+    with pytest.raises(AttributeError, match="has no attribute"):
+        mne_lsl.invalid
+    assert "stream" in dir(mne_lsl)
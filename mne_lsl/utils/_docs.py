@@ -7,12 +7,11 @@ Inspired from mne.utils.docs.py by Eric Larson <larson.eric.d@gmail.com>
 import sys
 from typing import Callable, Dict, List, Tuple
 
-from mne.utils.docs import docdict as docdict_mne
-
 # ------------------------- Documentation dictionary -------------------------
 docdict: Dict[str, str] = dict()
 
 # -------- Documentation to inc. from MNE -------
+# The entries are added on first use by fill_doc, as importing MNE is slow.
 keys: Tuple[str, ...] = (
     "anonymize_info_notes",
     "daysback_anonymize_info",
@@ -26,18 +25,23 @@ keys: Tuple[str, ...] = (
     "ref_channels",
 )
 
-for key in keys:
-    entry = docdict_mne[key]
-    if ".. versionchanged::" in entry:
-        entry = entry.replace(".. versionchanged::", ".. versionchanged:: MNE ")
-    if ".. versionadded::" in entry:
-        entry = entry.replace(".. versionadded::", ".. versionadded:: MNE ")
-    docdict[key] = entry
+
+def _add_docdict_mne() -> None:
+    """Add the entries from MNE to the documentation dictionary."""
+    from mne.utils.docs import docdict as docdict_mne
+
+    for key in keys:
+        entry = docdict_mne[key]
+        if ".. versionchanged::" in entry:
+            entry = entry.replace(".. versionchanged::", ".. versionchanged:: MNE ")
+        if ".. versionadded::" in entry:
+            entry = entry.replace(".. versionadded::", ".. versionadded:: MNE ")
+        docdict[key] = entry
+    docdict_indented.clear()
+
 
 # -----------------------------------------------
-docdict[
-    "stream_bufsize"
-] = """
+docdict["stream_bufsize"] = """
 bufsize : float | int
     Size of the buffer keeping track of the data received from the stream. If
     the stream sampling rate ``sfreq`` is regular, ``bufsize`` is expressed in
@@ -46,9 +50,7 @@ bufsize : float | int
     expressed in samples. The buffer will hold the last ``bufsize`` samples."""
 
 # -----------------------------------------------
-docdict[
-    "verbose"
-] = """
+docdict["verbose"] = """
 verbose : int | str | bool | None
     Sets the verbosity level. The verbosity increases gradually between
     ``"CRITICAL"``, ``"ERROR"``, ``"WARNING"``, ``"INFO"`` and ``"DEBUG"``.
@@ -77,6 +79,8 @@ def fill_doc(f: Callable) -> Callable:
     if not docstring:
         return f
 
+    if keys[0] not in docdict and any(f"%({key})s" in docstring for key in keys):
+        _add_docdict_mne()
     lines = docstring.splitlines()
     indent_count = _indentcount_lines(lines)
 
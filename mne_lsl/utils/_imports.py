@@ -4,6 +4,8 @@ Inspired from pandas: https://pandas.pydata.org/
 """
 
 import importlib
+import sys
+from types import ModuleType
 
 # A mapping from import name to package name (on PyPI) when the package name
 # is different.
@@ -61,3 +63,53 @@ def import_optional_dependency(
             return None
 
     return module
+
+
+def lazy_attach(module_name, attributes, submodules=()):
+    """Attach attributes and submodules to a module, imported on first access.
+
+    Parameters
+    ----------
+    module_name : str
+        Name of the module, i.e. ``__name__``. The attributes already defined in the
+        module, e.g. imported eagerly, are kept.
+    attributes : dict
+        Mapping from the name of an attribute to the submodule, relative to the
+        module, which defines it.
+    submodules : tuple of str
+        Names of the submodules.
+
+    Returns
+    -------
+    __getattr__ : callable
+        Function importing the attributes and the submodules on first access.
+    __dir__ : callable
+        Function listing the attributes, including the ones imported on first access.
+    __all__ : list of str
+        Public attributes of the module.
+    """
+    module = sys.modules[module_name]
+    lazy = set(attributes) | set(submodules)
+
+    def __getattr__(name):
+        if name in submodules:
+            return importlib.import_module(f".{name}", module_name)
+        if name in attributes:
+            submodule = importlib.import_module(f".{attributes[name]}", module_name)
+            return getattr(submodule, name)
+        raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+
+    def __dir__():
+        return sorted(set(vars(module)) | lazy)
+
+    __all__ = sorted(
+        lazy
+        | {
+            name
+            for name, value in vars(module).items()
+            if not name.startswith("_")
+            and not isinstance(value, ModuleType)
+            and value is not lazy_attach
+        }
+    )
+    return __getattr__, __dir__, __all__
@@ -0,0 +1,58 @@
+from __future__ import annotations  # c.f. PEP 563, PEP 649
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from ._checks import check_type, ensure_int
+
+if TYPE_CHECKING:
+    from typing import Any, Dict, Sequence, Tuple
+
+
+class _Metrics:
+    """Fixed-size ring buffers of measurements recorded at every tick of a hot path.
+
+    Parameters
+    ----------
+    names : tuple of str
+        Names of the measurements recorded at every tick.
+    size : int
+        Number of ticks retained. Older ticks are overwritten.
+    """
+
+    def __init__(self, names: Tuple[str, ...], size: int) -> None:
+        size = ensure_int(size, "size")
+        if size <= 0:
+            raise ValueError(
+                "The argument 'size' must be a strictly positive integer. "
+                f"{size} is invalid."
+            )
+        self._names = names
+        self._data = np.full((size, len(names)), np.nan, dtype=np.float64)
+        self._idx = 0
+        self._n_ticks = 0
+        self._overruns = 0
+
+    def record(self, values: Tuple[float, ...], overrun: bool = False) -> None:
+        """Record the measurements of one tick, in the order of the names.
+
+        If ``overrun`` is True, the tick is also counted as an overrun.
+        """
+        self._data[self._idx] = values
+        self._overruns += bool(overrun)
+        self._idx = (self._idx + 1) % self._data.shape[0]
+        self._n_ticks += 1
+
+    def summary(self, percentiles: Sequence[float]) -> Dict[str, Any]:
+        """Summarize the retained measurements with percentiles."""
+        check_type(percentiles, (list, tuple), "percentiles")
+        data = self._data[: min(self._n_ticks, self._data.shape[0])]
+        metrics = {"n_ticks": self._n_ticks, "overruns": self._overruns}
+        for k, name in enumerate(self._names):
+            values = data[:, k][~np.isnan(data[:, k])]
+            metrics[name] = {
+                p: float(np.percentile(values, p)) if values.size != 0 else np.nan
+                for p in percentiles
+            }
+        return metrics
@@ -7,10 +7,28 @@ from mne import create_info as mne_create_info
 from mne.utils import check_version
 
 if check_version("mne", "1.6"):
-    from mne._fiff.constants import FIFF, _ch_unit_mul_named
+    from mne._fiff._digitization import DigPoint  # noqa: F401
+    from mne._fiff.constants import (  # noqa: F401
+        FIFF,
+        _ch_coil_type_named,
+        _ch_kind_named,
+        _ch_unit_mul_named,
+        _coord_frame_named,
+        _dig_cardinal_named,
+        _dig_kind_named,
+    )
     from mne._fiff.pick import get_channel_type_constants
 else:
-    from mne.io.constants import FIFF, _ch_unit_mul_named
+    from mne.io._digitization import DigPoint  # noqa: F401
+    from mne.io.constants import (  # noqa: F401
+        FIFF,
+        _ch_coil_type_named,
+        _ch_kind_named,
+        _ch_unit_mul_named,
+        _coord_frame_named,
+        _dig_cardinal_named,
+        _dig_kind_named,
+    )
     from mne.io.pick import get_channel_type_constants
 
 from ._checks import check_type, check_value, ensure_int
@@ -1,8 +1,11 @@
 """Test _imports.py"""
 
+import sys
+from types import ModuleType
+
 import pytest
 
-from mne_lsl.utils._imports import import_optional_dependency
+from mne_lsl.utils._imports import import_optional_dependency, lazy_attach
 
 
 def test_import_optional_dependency():
@@ -22,3 +25,22 @@ def test_import_optional_dependency():
     # Test extra
     with pytest.raises(ImportError, match="blabla"):
         import_optional_dependency("non_existing_pkg", extra="blabla")
+
+
+def test_lazy_attach(monkeypatch):
+    """Test the attributes and the submodules imported on first access."""
+    from mne_lsl.utils import config, logs
+
+    # replace the package mne_lsl.utils with a module resolving its submodules
+    module = ModuleType("mne_lsl.utils")
+    module.eager = 101
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+    __getattr__, __dir__, __all__ = lazy_attach(
+        module.__name__, {"sys_info": "config"}, ("logs",)
+    )
+    assert __all__ == ["eager", "logs", "sys_info"]
+    assert {"eager", "logs", "sys_info"} <= set(__dir__())
+    assert __getattr__("logs") is logs
+    assert __getattr__("sys_info") is config.sys_info
+    with pytest.raises(AttributeError, match="has no attribute 'invalid'"):
+        __getattr__("invalid")
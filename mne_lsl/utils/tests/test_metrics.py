@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+
+from mne_lsl.utils._metrics import _Metrics
+
+
+def test_metrics():
+    """Test the fixed-size ring buffers of metrics."""
+    metrics = _Metrics(("a", "b"), 4)
+    summary = metrics.summary((50,))
+    assert summary["n_ticks"] == 0
+    assert summary["overruns"] == 0
+    assert np.isnan(summary["a"][50])
+    for k in range(6):
+        metrics.record((k, np.nan if k % 2 else 10 * k), overrun=k == 2)
+    summary = metrics.summary((0, 50, 100))
+    assert summary["n_ticks"] == 6
+    assert summary["overruns"] == 1
+    # only the last 4 ticks are retained
+    assert summary["a"] == {0: 2.0, 50: 3.5, 100: 5.0}
+    # missing values are ignored
+    assert summary["b"] == {0: 20.0, 50: 30.0, 100: 40.0}
+
+
+def test_invalid_metrics():
+    """Test invalid arguments for the metrics."""
+    with pytest.raises(ValueError, match="strictly positive"):
+        _Metrics(("a",), 0)
+    with pytest.raises(TypeError, match="must be an integer"):
+        _Metrics(("a",), 1.5)
+    with pytest.raises(TypeError, match="must be an instance of"):
+        _Metrics(("a",), 1).summary(50)